@@ -0,0 +1,12 @@
+# coding: utf-8
+"""
+Benchmarks
+==========
+
+Micro-benchmarks used to measure the overhead of the decorators of the Deprecated Library.
+
+The benchmarks only depend on the standard library, they can be run offline from the root
+of the project, for instance::
+
+    python -m benchmarks.bench_messages
+"""
@@ -0,0 +1,29 @@
+# coding: utf-8
+"""
+Run all the benchmarks::
+
+    python -m benchmarks
+"""
+from benchmarks import bench_action_threads
+from benchmarks import bench_class_mode
+from benchmarks import bench_import
+from benchmarks import bench_lightweight
+from benchmarks import bench_messages
+from benchmarks import bench_overhead
+from benchmarks import bench_params_import
+from benchmarks import bench_stacked
+
+
+def main():
+    bench_overhead.main([])
+    bench_messages.main()
+    bench_action_threads.main()
+    bench_stacked.main()
+    bench_lightweight.main()
+    bench_class_mode.main()
+    bench_import.main([])
+    bench_params_import.main([])
+
+
+if __name__ == '__main__':
+    main()
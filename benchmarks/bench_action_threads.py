@@ -0,0 +1,78 @@
+# coding: utf-8
+"""
+Benchmark of the local warning filter under concurrency
+=======================================================
+
+When the *action* parameter is set, the warning filter is applied locally by the
+decorator, without modifying the global :data:`warnings.filters`.
+
+This benchmark compares it with the previous implementation, which used
+:class:`warnings.catch_warnings` and :func:`warnings.simplefilter` at each call,
+the deprecated functions being called concurrently by 8 threads.
+
+Usage::
+
+    python -m benchmarks.bench_action_threads
+"""
+import threading
+import time
+import warnings
+
+import wrapt
+
+from benchmarks.common import print_results
+from benchmarks.common import silent_showwarning
+from deprecated.classic import deprecated
+
+THREADS = 8
+CALLS = 20000
+
+
+def catch_warnings_deprecated(action):
+    # Implementation of the decorator before the local warning filter
+    @wrapt.decorator
+    def wrapper(wrapped_, instance_, args_, kwargs_):
+        msg = "Call to deprecated function (or staticmethod) {0}.".format(wrapped_.__name__)
+        with warnings.catch_warnings():
+            warnings.simplefilter(action, DeprecationWarning)
+            warnings.warn(msg, category=DeprecationWarning, stacklevel=2)
+        return wrapped_(*args_, **kwargs_)
+
+    return wrapper
+
+
+def time_threads(func):
+    def run():
+        for _ in range(CALLS):
+            func()
+
+    threads = [threading.Thread(target=run) for _ in range(THREADS)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return (time.perf_counter() - start) * 1e9 / (THREADS * CALLS)
+
+
+def main():
+    results = []
+    with warnings.catch_warnings():
+        warnings.showwarning = silent_showwarning
+        for action in ["ignore", "once", "always"]:
+
+            @catch_warnings_deprecated(action)
+            def foo():
+                pass
+
+            @deprecated(action=action)
+            def bar():
+                pass
+
+            results.append(("action={0!r}, catch_warnings".format(action), time_threads(foo)))
+            results.append(("action={0!r}, local filter".format(action), time_threads(bar)))
+    print_results("Local warning filter ({0} threads)".format(THREADS), results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# coding: utf-8
+"""
+Benchmark of the instantiation of the subclasses of a deprecated class
+======================================================================
+
+By default, the ``@deprecated`` decorator replaces the ``__new__`` method of a deprecated class,
+so that every instantiation of the class, and of its subclasses, calls the deprecation wrapper.
+With ``class_mode="exact"``, the subclasses are instantiated using the original ``__new__`` method.
+With ``class_mode="subclass"``, the warning is emitted when the subclass is defined, and ``__new__`` is not replaced.
+
+This benchmark compares the instantiation of a subclass (with an ``__init__`` method)
+of an undecorated base class and of a deprecated base class, for each class mode.
+The warnings are emitted but not displayed.
+
+Usage::
+
+    python -m benchmarks.bench_class_mode
+"""
+import warnings
+
+from benchmarks.common import print_results
+from benchmarks.common import silent_showwarning
+from benchmarks.common import time_per_call
+from deprecated.classic import deprecated
+
+
+def make_subclass(decorator):
+    class Base(object):
+        pass
+
+    if decorator is not None:
+        Base = decorator(Base)
+
+    class Model(Base):
+        def __init__(self, name):
+            self.name = name
+
+    return Model
+
+
+def main():
+    results = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        warnings.showwarning = silent_showwarning
+        model = make_subclass(None)
+        baseline = time_per_call(lambda: model("foo"))
+        results.append(("undecorated base class", baseline))
+        for class_mode in ["instance", "exact", "subclass"]:
+            model = make_subclass(deprecated(class_mode=class_mode))
+            results.append(("class_mode={0!r}".format(class_mode), time_per_call(lambda: model("foo"))))
+    print_results("Instantiation of a subclass", results, baseline=baseline)
+
+
+if __name__ == '__main__':
+    main()
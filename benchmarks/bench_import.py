@@ -0,0 +1,88 @@
+# coding: utf-8
+"""
+Benchmark of the import time
+============================
+
+This benchmark measures the time needed to import the Deprecated Library, using the
+``-X importtime`` option of the Python interpreter (Python 3.7+). Each import statement
+is run in a new interpreter, several times, and the best time is kept.
+
+The ``deprecated`` package imports its submodules (and the *wrapt* library) lazily,
+on first access to :func:`deprecated.deprecated` or :func:`deprecated.deprecated_params`.
+
+Only the modules imported by the statement are counted: the top-level lines reported after
+a marker line. Filtering the lines by module name is not enough, because the submodules
+imported with :func:`importlib.import_module` are not reported by ``-X importtime``
+(only their own imports are).
+
+Usage::
+
+    python -m benchmarks.bench_import [--repeat REPEAT]
+"""
+from __future__ import print_function
+
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks.common import print_results
+
+#: Import statements to measure.
+STATEMENTS = [
+    "import deprecated",
+    "from deprecated import configure",
+    "from deprecated import deprecated",
+    "from deprecated import deprecated_params",
+    "from deprecated.sphinx import deprecated",
+]
+
+#: Line written on *stderr* before running the statement, to skip the imports done at startup.
+MARKER = "-- import statement --"
+
+MARKER_STATEMENT = "import sys; sys.stderr.write({0!r}); sys.stderr.flush(); ".format(MARKER + "\n")
+
+
+def import_time(statement):
+    """
+    Measure the import time of a statement, using ``-X importtime``.
+
+    :param statement: Import statement to run in a new interpreter.
+    :return: The cumulative import time (in nanoseconds) of the modules imported by the statement
+        (the ``deprecated`` modules and their dependencies, like *wrapt*), without the interpreter startup.
+    """
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env["PYTHONPATH"] = os.pathsep.join([root] + [p for p in env.get("PYTHONPATH", "").split(os.pathsep) if p])
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", MARKER_STATEMENT + statement],
+        env=env,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    # The modules imported by the interpreter at startup are reported before the marker.
+    lines = proc.stderr.splitlines()
+    total = 0
+    for line in lines[lines.index(MARKER) + 1 :]:
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if not name[1:].startswith(" "):
+            # top-level import: the cumulative time includes the nested imports
+            total += int(cumulative)
+    return total * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of the library.")
+    parser.add_argument("--repeat", type=int, default=10, help="number of measures (the best one is kept)")
+    args = parser.parse_args(argv)
+
+    results = [(statement, min(import_time(statement) for _ in range(args.repeat))) for statement in STATEMENTS]
+    print_results("Import time of the package (-X importtime, cumulative)", results, unit="us")
+
+
+if __name__ == '__main__':
+    main()
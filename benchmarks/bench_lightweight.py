@@ -0,0 +1,48 @@
+# coding: utf-8
+"""
+Benchmark of the lightweight wrapper
+====================================
+
+With ``lightweight=True``, the ``@deprecated`` decorator wraps the functions which are not defined
+in a class body with a closure (using :func:`functools.wraps`), instead of a *wrapt* function wrapper.
+
+This benchmark compares the call overhead of both wrappers, for each *action*
+(with ``None``, the warnings are ignored by the global filters).
+
+Usage::
+
+    python -m benchmarks.bench_lightweight
+"""
+import warnings
+
+from benchmarks.common import print_results
+from benchmarks.common import silent_showwarning
+from benchmarks.common import time_per_call
+from deprecated.classic import deprecated
+
+
+def make_foo():
+    def foo(x, y):
+        return x + y
+
+    return foo
+
+
+def main():
+    foo = make_foo()
+    results = []
+    with warnings.catch_warnings():
+        warnings.showwarning = silent_showwarning
+        warnings.simplefilter("ignore")
+        baseline = time_per_call(lambda: foo(1, 2))
+        results.append(("undecorated function", baseline))
+        for action in [None, "ignore", "once", "always"]:
+            wrapt_foo = deprecated(action=action)(make_foo())
+            light_foo = deprecated(action=action, lightweight=True)(make_foo())
+            results.append(("action={0!r}, wrapt".format(action), time_per_call(lambda: wrapt_foo(1, 2))))
+            results.append(("action={0!r}, lightweight".format(action), time_per_call(lambda: light_foo(1, 2))))
+    print_results("Lightweight wrapper", results, baseline=baseline)
+
+
+if __name__ == '__main__':
+    main()
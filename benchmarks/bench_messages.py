@@ -0,0 +1,85 @@
+# coding: utf-8
+"""
+Benchmark of the deprecation message computation
+================================================
+
+The :class:`~deprecated.classic.ClassicAdapter` computes the warning messages once,
+at decoration time. The messages are only computed at each call if the
+:meth:`~deprecated.classic.ClassicAdapter.get_deprecated_msg` method is overridden.
+
+This benchmark compares both paths, the warnings being emitted but not displayed
+(so that the cost of the warning display is not measured).
+
+Usage::
+
+    python -m benchmarks.bench_messages
+"""
+import warnings
+
+from benchmarks.common import print_results
+from benchmarks.common import silent_showwarning
+from benchmarks.common import time_per_call
+from deprecated.classic import ClassicAdapter
+from deprecated.classic import deprecated
+
+
+class PerCallAdapter(ClassicAdapter):
+    def get_deprecated_msg(self, wrapped, instance):
+        # Same message, but computed at each call
+        return super(PerCallAdapter, self).get_deprecated_msg(wrapped, instance)
+
+
+def foo(x, y):
+    return x + y
+
+
+@deprecated(reason="use foo", version="1.2.3")
+def static_foo(x, y):
+    return x + y
+
+
+@deprecated(reason="use foo", version="1.2.3", adapter_cls=PerCallAdapter)
+def per_call_foo(x, y):
+    return x + y
+
+
+class Foo(object):
+    @deprecated(reason="use foo", version="1.2.3")
+    def static_foo(self, x, y):
+        return x + y
+
+    @deprecated(reason="use foo", version="1.2.3", adapter_cls=PerCallAdapter)
+    def per_call_foo(self, x, y):
+        return x + y
+
+
+@deprecated(reason="use Foo", version="1.2.3")
+class StaticBar(object):
+    pass
+
+
+@deprecated(reason="use Foo", version="1.2.3", adapter_cls=PerCallAdapter)
+class PerCallBar(object):
+    pass
+
+
+def main():
+    obj = Foo()
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        warnings.showwarning = silent_showwarning
+        baseline = time_per_call(lambda: foo(1, 2))
+        results = [
+            ("undecorated function", baseline),
+            ("function, static message", time_per_call(lambda: static_foo(1, 2))),
+            ("function, per-call message", time_per_call(lambda: per_call_foo(1, 2))),
+            ("method, static message", time_per_call(lambda: obj.static_foo(1, 2))),
+            ("method, per-call message", time_per_call(lambda: obj.per_call_foo(1, 2))),
+            ("class, static message", time_per_call(StaticBar)),
+            ("class, per-call message", time_per_call(PerCallBar)),
+        ]
+    print_results("Deprecation message computation", results, baseline=baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+# coding: utf-8
+"""
+Benchmark of the decorators call overhead
+=========================================
+
+This benchmark measures the time of a call to a deprecated function, method or class,
+compared to the undecorated baseline, for each kind of decorated object:
+
+- plain function,
+- instance method,
+- class method,
+- static method,
+- class instantiation (``__new__`` replacement),
+- property read,
+- function decorated with the Sphinx ``@deprecated`` decorator (:class:`~deprecated.sphinx.SphinxAdapter`),
+- function decorated with ``@deprecated_params`` (called with and without the deprecated parameter),
+- method decorated with ``@deprecated_params``,
+- function with a renamed parameter (``@deprecated_params(renamed=...)``), called with the old name,
+- function with a parameter which will become keyword-only (``@deprecated_params(keyword_only=...)``),
+  called with a keyword argument.
+
+Each case is run with the *action* parameter set to ``None`` (global filters), "ignore", "once" and "always".
+The warnings are emitted but not displayed. With ``None``, the global filters are set to "always",
+and the "None/ignored" column shows the calls when the global filters ignore the warnings.
+
+Usage::
+
+    python -m benchmarks.bench_overhead [--number NUMBER] [--repeat REPEAT] [--json FILE]
+
+The ``--json`` option saves the results, in nanoseconds per call, in order to compare
+several versions of the library.
+"""
+from __future__ import print_function
+
+import argparse
+import json
+import warnings
+
+from benchmarks.common import silent_showwarning
+from benchmarks.common import time_per_call
+from deprecated.classic import deprecated
+from deprecated.params import deprecated_params
+from deprecated.sphinx import deprecated as sphinx_deprecated
+
+#: Column name and *action* parameter of each benchmark, the last item is the global filter.
+ACTIONS = [
+    ("None", None, "always"),
+    ("None/ignored", None, "ignore"),
+    ("ignore", "ignore", "always"),
+    ("once", "once", "always"),
+    ("always", "always", "always"),
+]
+
+
+def make_cases(decorator):
+    """
+    Create the callables to measure, using the given decorator factory.
+
+    :param decorator: Decorator factory, called with the *action* keyword argument (can be ``None``).
+    :return: A list of ``(label, callable)`` tuples.
+    """
+
+    def foo(x, y):
+        return x + y
+
+    class Foo(object):
+        def method(self, x, y):
+            return x + y
+
+        @classmethod
+        def class_method(cls, x, y):
+            return x + y
+
+        @staticmethod
+        def static_method(x, y):
+            return x + y
+
+        @property
+        def prop(self):
+            return 3
+
+    class Bar(object):
+        pass
+
+    if decorator is not None:
+        foo = decorator(foo)
+        Foo.method = decorator(Foo.method)
+        Foo.class_method = classmethod(decorator(Foo.__dict__["class_method"].__func__))
+        Foo.static_method = staticmethod(decorator(Foo.__dict__["static_method"].__func__))
+        Foo.prop = decorator(Foo.__dict__["prop"])
+        Bar = decorator(Bar)
+
+    obj = Foo()
+    return [
+        ("function", lambda: foo(1, 2)),
+        ("method", lambda: obj.method(1, 2)),
+        ("classmethod", lambda: Foo.class_method(1, 2)),
+        ("staticmethod", lambda: Foo.static_method(1, 2)),
+        ("class", Bar),
+        ("property", lambda: obj.prop),
+    ]
+
+
+def make_sphinx_case(action):
+    def foo(x, y):
+        """Foo"""
+        return x + y
+
+    if action != "baseline":
+        foo = sphinx_deprecated(version="1.2.3", reason="Use :func:`bar`", action=action)(foo)
+    return lambda: foo(1, 2)
+
+
+def make_params_cases(action):
+    def foo(x, y=None, z=None):
+        return x
+
+    class Foo(object):
+        def method(self, x, y=None, z=None):
+            return x
+
+    def bar(x, y=None):
+        return x
+
+    def baz(x, y=None):
+        return x
+
+    if action != "baseline":
+        foo = deprecated_params("z", action=action)(foo)
+        Foo.method = deprecated_params("z", action=action)(Foo.method)
+        bar = deprecated_params(renamed={"old_y": "y"}, action=action)(bar)
+        baz = deprecated_params(keyword_only="y", action=action)(baz)
+        renamed_kwargs = {"old_y": 2}
+    else:
+        renamed_kwargs = {"y": 2}
+    obj = Foo()
+    return [
+        ("deprecated_params (not used)", lambda: foo(1, y=2)),
+        ("deprecated_params (used)", lambda: foo(1, z=2)),
+        ("deprecated_params method (used)", lambda: obj.method(1, z=2)),
+        ("deprecated_params renamed (used)", lambda: bar(1, **renamed_kwargs)),
+        ("deprecated_params keyword_only (keyword)", lambda: baz(1, y=2)),
+    ]
+
+
+def run(number, repeat):
+    """
+    Run the benchmarks.
+
+    :return: A dictionary which maps each case to the baseline time and
+        to the time of each column (in nanoseconds per call).
+    """
+    results = {}
+
+    def measure(column, label, func):
+        results.setdefault(label, {})[column] = time_per_call(func, number=number, repeat=repeat)
+
+    with warnings.catch_warnings():
+        warnings.showwarning = silent_showwarning
+        for label, func in make_cases(None):
+            measure("baseline", label, func)
+        measure("baseline", "sphinx", make_sphinx_case("baseline"))
+        for label, func in make_params_cases("baseline"):
+            measure("baseline", label, func)
+
+        for column, action, global_filter in ACTIONS:
+            warnings.simplefilter(global_filter)
+            for label, func in make_cases(lambda wrapped: deprecated(action=action)(wrapped)):
+                measure(column, label, func)
+            measure(column, "sphinx", make_sphinx_case(action))
+            for label, func in make_params_cases(action):
+                measure(column, label, func)
+    return results
+
+
+def print_table(results):
+    columns = ["baseline"] + [column for column, _, _ in ACTIONS]
+    width = max(len(label) for label in results)
+    print("Call overhead (ns per call, baseline is the undecorated object)")
+    print(" ".join(["{0:<{1}}".format("", width)] + ["{0:>13}".format(column) for column in columns]))
+    for label, times in results.items():
+        cells = []
+        for column in columns:
+            if column not in times:
+                cells.append("{0:>13}".format("n/a"))
+            elif column == "baseline":
+                cells.append("{0:>13.1f}".format(times[column]))
+            else:
+                cells.append("{0:>+13.1f}".format(times[column] - times["baseline"]))
+        print(" ".join(["{0:<{1}}".format(label, width)] + cells))
+    print()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the call overhead of the decorators.")
+    parser.add_argument("--number", type=int, default=20000, help="number of calls per measure")
+    parser.add_argument("--repeat", type=int, default=5, help="number of measures (the best one is kept)")
+    parser.add_argument("--json", metavar="FILE", help="save the results in a JSON file")
+    args = parser.parse_args(argv)
+    results = run(args.number, args.repeat)
+    print_table(results)
+    if args.json:
+        with open(args.json, "w") as stream:
+            json.dump(results, stream, indent=2, sort_keys=True)
+
+
+if __name__ == '__main__':
+    main()
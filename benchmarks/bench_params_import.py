@@ -0,0 +1,118 @@
+# coding: utf-8
+"""
+Benchmark of the import time of a module using ``@deprecated_params``
+=====================================================================
+
+The :class:`~deprecated.params.DeprecatedParams` decorator analyses the signature
+of the decorated function on first call, instead of when the decorator is applied,
+so that the libraries which decorate many functions don't pay for it at import time.
+
+This benchmark generates a module with 1,000 functions and measures its import time
+in a new interpreter (the Deprecated Library being already imported), when the functions
+are not decorated, when they are decorated, and when each decorated function
+is also called once (with the warning filters set to "always", so that the first call
+analyses the signature, even if the deprecated parameter is not used).
+
+Usage::
+
+    python -m benchmarks.bench_params_import [--functions FUNCTIONS] [--repeat REPEAT]
+"""
+from __future__ import print_function
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.common import print_results
+
+FUNCTION_TEMPLATE = '''
+{decorator}
+def func_{index}(x, y=None, z=None, *args, **kwargs):
+    return x
+'''
+
+#: Script run in a new interpreter to measure the import time of a module (in nanoseconds).
+TIMER_SCRIPT = '''
+import time
+import deprecated.params
+start = time.perf_counter()
+import {name}
+print((time.perf_counter() - start) * 1e9)
+'''
+
+#: Calls of the functions, at the end of the module. The warnings are not ignored,
+#: otherwise the calls would return before analysing the signature.
+CALLS_TEMPLATE = '''
+import warnings
+warnings.simplefilter("always")
+for func in [{names}]:
+    func(1, y=2)
+'''
+
+
+def write_module(directory, name, functions, decorated, called):
+    """
+    Write a module with several functions.
+
+    :param directory: Directory of the module.
+    :param name: Name of the module.
+    :param functions: Number of functions.
+    :param decorated: Whether the functions are decorated with ``@deprecated_params``.
+    :param called: Whether each function is called once at the end of the module.
+    """
+    decorator = '@deprecated_params("z", reason="z is deprecated")' if decorated else ''
+    parts = ["from deprecated.params import deprecated_params\n"]
+    parts.extend(FUNCTION_TEMPLATE.format(decorator=decorator, index=index) for index in range(functions))
+    if called:
+        parts.append(CALLS_TEMPLATE.format(names=", ".join("func_{0}".format(i) for i in range(functions))))
+    with open(os.path.join(directory, name + ".py"), "w") as stream:
+        stream.write("".join(parts))
+
+
+def import_time(directory, name):
+    """
+    Measure the import time of a module, in a new interpreter.
+
+    :param directory: Directory of the module.
+    :param name: Name of the module.
+    :return: The import time, in nanoseconds.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([directory, root]))
+    output = subprocess.check_output(
+        [sys.executable, "-c", TIMER_SCRIPT.format(name=name)], env=env, universal_newlines=True
+    )
+    return float(output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the import time of a module using @deprecated_params.")
+    parser.add_argument("--functions", type=int, default=1000, help="number of functions in the module")
+    parser.add_argument("--repeat", type=int, default=10, help="number of measures (the best one is kept)")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    try:
+        cases = [
+            ("undecorated", "bench_undecorated", False, False),
+            ("@deprecated_params", "bench_decorated", True, False),
+            ("@deprecated_params, each function called", "bench_called", True, True),
+        ]
+        results = []
+        for label, name, decorated, called in cases:
+            write_module(directory, name, args.functions, decorated, called)
+            # the first import compiles the module: it is not measured
+            import_time(directory, name)
+            elapsed = min(import_time(directory, name) for _ in range(args.repeat))
+            results.append((label, elapsed))
+    finally:
+        shutil.rmtree(directory)
+    title = "Import time of a module with {0} functions".format(args.functions)
+    print_results(title, results, baseline=results[0][1], unit="ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# coding: utf-8
+"""
+Benchmark of the stacked decorators
+===================================
+
+When the ``@deprecated`` (classic or Sphinx) and ``@deprecated_params`` decorators are stacked,
+they share a single wrapper which runs every check in the same frame,
+instead of nesting one wrapper per decorator.
+
+This benchmark compares the stacked decorators with the equivalent nested wrappers,
+the warnings being ignored by the global filters (first table), or emitted but not displayed (second table).
+
+Usage::
+
+    python -m benchmarks.bench_stacked
+"""
+import warnings
+
+from benchmarks.common import print_results
+from benchmarks.common import silent_showwarning
+from benchmarks.common import time_per_call
+from deprecated.classic import _DeprecatedWrapper
+from deprecated.classic import deprecated
+from deprecated.params import deprecated_params
+from deprecated.sphinx import deprecated as sphinx_deprecated
+
+
+def make_foo():
+    def foo(x, y=None, z=None):
+        """Foo"""
+        return x
+
+    return foo
+
+
+def nest(*decorators):
+    """
+    Build the nested wrappers: one wrapper layer per decorator (the first decorator is the innermost).
+    """
+    func = make_foo()
+    for decorator in decorators:
+        func = _DeprecatedWrapper(func, decorator(make_foo())._self_checks)
+    return func
+
+
+def make_cases():
+    classic = deprecated(reason="use bar")
+    params_y = deprecated_params("y")
+    params_z = deprecated_params("z")
+    sphinx = sphinx_deprecated(version="1.2.3", reason="use :func:`bar`")
+    return [
+        ("@deprecated", classic(make_foo()), None),
+        ("@deprecated_params + @deprecated", params_z(classic(make_foo())), nest(classic, params_z)),
+        (
+            "@sphinx.deprecated + @deprecated_params + @deprecated_params",
+            sphinx(params_y(params_z(make_foo()))),
+            nest(params_z, params_y, sphinx),
+        ),
+    ]
+
+
+def measure(title):
+    foo = make_foo()
+    baseline = time_per_call(lambda: foo(1, y=2, z=3))
+    results = [("undecorated function", baseline)]
+    for label, stacked, nested in make_cases():
+        results.append((label + ", single wrapper", time_per_call(lambda: stacked(1, y=2, z=3))))
+        if nested is not None:
+            results.append((label + ", nested wrappers", time_per_call(lambda: nested(1, y=2, z=3))))
+    print_results(title, results, baseline=baseline)
+
+
+def main():
+    with warnings.catch_warnings():
+        warnings.showwarning = silent_showwarning
+        warnings.simplefilter("ignore")
+        measure("Stacked decorators (ignored warnings)")
+        warnings.simplefilter("always")
+        measure("Stacked decorators (emitted warnings)")
+
+
+if __name__ == '__main__':
+    main()
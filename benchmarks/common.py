@@ -0,0 +1,61 @@
+# coding: utf-8
+"""
+Timing helpers shared by the benchmarks.
+"""
+from __future__ import print_function
+
+import timeit
+
+
+def time_per_call(func, number=100000, repeat=5):
+    """
+    Measure the time of a call to *func* (without arguments).
+
+    :param func: Function to call.
+    :param number: Number of calls per measure.
+    :param repeat: Number of measures, the best one is kept.
+    :return: The best time per call, in nanoseconds.
+    """
+    timer = timeit.Timer(func)
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return best * 1e9 / number
+
+
+# noinspection PyUnusedLocal
+def silent_showwarning(*args, **kwargs):
+    """
+    Replacement of :func:`warnings.showwarning` used to emit warnings without displaying them.
+    """
+
+
+#: Time units used to display the results: unit => nanoseconds.
+UNITS = {"ns": 1, "us": 1e3, "ms": 1e6}
+
+
+def print_results(title, results, baseline=None, unit="ns"):
+    """
+    Print the results of a benchmark as a table.
+
+    :param title: Title of the benchmark.
+    :param results: List of ``(label, nanoseconds)`` tuples.
+    :param baseline: Time of the reference case (in nanoseconds), used to compute the overhead.
+    :param unit: Time unit used to display the results: "ns", "us" or "ms".
+    """
+    print(title)
+    print("=" * len(title))
+    width = max(len(label) for label, _ in results)
+    scale = UNITS[unit]
+    for label, elapsed in results:
+        if baseline is None:
+            print(
+                "{label:<{width}}  {elapsed:9.1f} {unit}".format(
+                    label=label, width=width, elapsed=elapsed / scale, unit=unit
+                )
+            )
+        else:
+            print(
+                "{label:<{width}}  {elapsed:9.1f} {unit}  (overhead: {overhead:+9.1f} {unit})".format(
+                    label=label, width=width, elapsed=elapsed / scale, overhead=(elapsed - baseline) / scale, unit=unit
+                )
+            )
+    print()
@@ -12,5 +12,46 @@ __author__ = u"Laurent LAPORTE <laurent.laporte.pro@gmail.com>"
 __date__ = "2025-10-30"
 __credits__ = "(c) Laurent LAPORTE"
 
-from deprecated.classic import deprecated
-from deprecated.params import deprecated_params
+import sys
+
+from deprecated.config import configure
+
+__all__ = ["alias", "configure", "deprecated", "deprecated_params"]
+
+#: Lazily imported attributes: attribute name => module name.
+#: The submodules (and the *wrapt* library) are only imported on first access.
+_lazy_attributes = {
+    "alias": "deprecated.module",
+    "deprecated": "deprecated.classic",
+    "deprecated_params": "deprecated.params",
+}
+
+#: Submodules which are imported on first access, for instance ``deprecated.classic.ClassicAdapter``
+#: after ``import deprecated``.
+_lazy_submodules = {"classic", "config", "module", "params", "sphinx", "stats"}
+
+if sys.version_info < (3, 7):
+    # Module ``__getattr__`` (PEP 562) is not available
+    from deprecated.classic import deprecated
+    from deprecated.module import alias
+    from deprecated.params import deprecated_params
+
+else:
+
+    def __getattr__(name):
+        import importlib
+
+        if name in _lazy_submodules:
+            # the import binds the submodule as an attribute of the package
+            return importlib.import_module(__name__ + "." + name)
+        try:
+            module_name = _lazy_attributes[name]
+        except KeyError:
+            raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+        value = getattr(importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_attributes) | _lazy_submodules)
@@ -9,28 +9,740 @@ Classic ``@deprecated`` decorator to deprecate old python classes, functions or
 """
 import functools
 import inspect
-import platform
+import sys
+import threading
+import time
 import warnings
 
 import wrapt
 
-try:
-    # If the C extension for wrapt was compiled and wrapt/_wrappers.pyd exists, then the
-    # stack level that should be passed to warnings.warn should be 2. However, if using
-    # a pure python wrapt, an extra stacklevel is required.
-    import wrapt._wrappers
-
-    _routine_stacklevel = 2
-    _class_stacklevel = 2
-except ImportError:  # pragma: no cover
-    _routine_stacklevel = 3
-    if platform.python_implementation() == "PyPy":
-        _class_stacklevel = 2
-    else:
-        _class_stacklevel = 3
+from deprecated import stats
+from deprecated.config import is_enabled
+
+#: Stack levels ``(routine, class)`` to pass to :func:`warnings.warn`, see :func:`_get_stacklevels`.
+_stacklevels = None
+
+
+def _get_stacklevels():
+    """
+    Get the stack levels to pass to :func:`warnings.warn` in the wrappers of the functions and classes.
+
+    The stack levels depend on the wrapt implementation: they are computed on first use
+    (when a class or a function is decorated) instead of at import time.
+
+    :return: A tuple ``(routine_stacklevel, class_stacklevel)``.
+    """
+    global _stacklevels
+    if _stacklevels is None:
+        try:
+            # If the C extension for wrapt was compiled and wrapt/_wrappers.pyd exists, then the
+            # stack level that should be passed to warnings.warn should be 2. However, if using
+            # a pure python wrapt, an extra stacklevel is required.
+            import wrapt._wrappers
+
+            _stacklevels = (2, 2)
+        except ImportError:  # pragma: no cover
+            import platform
+
+            if platform.python_implementation() == "PyPy":
+                _stacklevels = (3, 2)
+            else:
+                _stacklevels = (3, 3)
+    return _stacklevels
+
 
 string_types = (type(b''), type(u''))
 
+#: Implementations of :meth:`ClassicAdapter.get_deprecated_msg` which only depend
+#: on the kind of binding (class, function, class method or method): the messages
+#: can be computed once at decoration time instead of at each call.
+_static_msg_getters = set()
+
+#: Warning filter actions which can be applied locally, see: `The Warnings Filter`_.
+_filter_actions = {"default", "error", "ignore", "always", "all", "module", "once"}
+
+
+#: Values of the *class_mode* parameter of :class:`ClassicAdapter`.
+_class_modes = {"instance", "exact", "subclass"}
+
+#: Snapshot of the global warning filters, and the cached results of :func:`_is_ignored`.
+_ignored_cache = (None, None, {})
+
+#: With context-aware warnings (Python 3.14+), the warning filters may be local to the running
+#: thread or asynchronous task, so :data:`warnings.filters` cannot be used to take any decision.
+_global_filters = not getattr(sys.flags, "context_aware_warnings", False)
+
+
+def _resolve_ignored(filters, default_action, category):
+    """
+    Find out whether the warning filters ignore the warnings of the given *category*,
+    whatever the warning message is (see :func:`_is_ignored`).
+
+    :return: A boolean, or, if some filters only apply to some modules (like the default filter
+        of :exc:`DeprecationWarning`, which only applies to ``__main__``), a tuple with the list
+        of ``(module, action)`` of these filters and the result for the other modules.
+    """
+    result = False
+    module_filters = []
+    if _global_filters:
+        for action, msg, cat, mod, lineno in filters:
+            if issubclass(category, cat):
+                if msg is None and not lineno:
+                    if mod is None:
+                        result = action == "ignore"
+                        break
+                    module_filters.append((mod, action))
+                elif action != "ignore":
+                    # A filter which does not ignore the warning may match: we cannot conclude.
+                    # A filter which ignores the warning only matches some messages or lines: it is skipped.
+                    result = False
+                    break
+        else:
+            result = default_action == "ignore"
+    if any((action == "ignore") != result for _, action in module_filters):
+        return module_filters, result
+    return result
+
+
+def _is_ignored(category, stacklevel=None):
+    """
+    Check whether the global warning filters ignore the warnings of the given *category*,
+    whatever the warning message is.
+
+    This check is done before building the message and inspecting the call stack.
+    If some filters only apply to some modules, the module of the caller is read from
+    the frame at *stacklevel* (like :func:`warnings.warn` does).
+    The results are cached (per category and module) until the warning filters (or the default action) change.
+
+    :param category: The warning category.
+
+    :param stacklevel: Same meaning as in :func:`warnings.warn`, relative to the caller of this function,
+        or ``None`` if unknown (then, the warnings filtered by module are never considered as ignored).
+
+    :return: ``True`` if the warnings of this category are always ignored (in the module of the caller).
+    """
+    global _ignored_cache
+    snapshot, default_action, ignored = _ignored_cache
+    if snapshot != warnings.filters or default_action != warnings.defaultaction:
+        snapshot, default_action, ignored = _ignored_cache = (
+            list(warnings.filters),
+            warnings.defaultaction,
+            {},
+        )
+    try:
+        result = ignored[category]
+    except KeyError:
+        result = ignored[category] = _resolve_ignored(snapshot, default_action, category)
+    if result is True or result is False:
+        return result
+    if stacklevel is None:
+        return False
+    try:
+        module = sys._getframe(stacklevel).f_globals.get("__name__", "<string>")
+    except ValueError:
+        module = "sys"
+    key = (category, module)
+    try:
+        return ignored[key]
+    except KeyError:
+        pass
+    module_filters, ignored[key] = result
+    for mod, action in module_filters:
+        # the module of the filters which are not set by :func:`warnings.filterwarnings` is a string
+        if (mod == module) if isinstance(mod, string_types) else mod.match(module):
+            ignored[key] = action == "ignore"
+            break
+    return ignored[key]
+
+
+class _WarningState(object):
+    """
+    State of the deprecation warning of a decorated class or function.
+
+    When *done* is ``True``, no more warning must be emitted: the decorated object
+    behaves like the original one (apart from the wrapper call).
+
+    :param limit: Maximum number of warnings to emit, or ``None`` if unlimited.
+    """
+
+    def __init__(self, limit=None):
+        self.done = False
+        self.limit = limit
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def claim(self):
+        """
+        Claim a warning to emit: *done* is set to ``True`` when the limit is reached.
+
+        :return: ``True`` if the warning must be emitted by the caller,
+            ``False`` if the limit was already reached (for instance by another thread).
+        """
+        with self._lock:
+            if self.done:
+                return False
+            self.count += 1
+            if self.count >= self.limit:
+                self.done = True
+            return True
+
+
+class _DeprecatedWrapper(wrapt.FunctionWrapper):
+    """
+    Wrapper of a deprecated routine, which runs the checks of the stacked
+    ``@deprecated`` and ``@deprecated_params`` decorators in a single frame.
+
+    A check is called with the wrapped routine (bound by *wrapt*), the instance or class
+    to which it is bound, the positional and keyword arguments of the call, and the
+    stack level of the caller relative to the check (to use with :func:`warnings.warn`).
+    It returns the keyword arguments to pass to the routine (for instance, with renamed parameters).
+
+    :param wrapped: Wrapped routine.
+    :param checks: Tuple of checks, run in order before calling the routine.
+    """
+
+    def __init__(self, wrapped, checks):
+        # stack level of the caller, relative to a check called by the wrapper function
+        stacklevel = _get_stacklevels()[0] + 1
+        if len(checks) == 1:
+            check = checks[0]
+
+            def wrapper_function(wrapped_, instance_, args_, kwargs_):
+                kwargs_ = check(wrapped_, instance_, args_, kwargs_, stacklevel)
+                return wrapped_(*args_, **kwargs_)
+
+        else:
+
+            def wrapper_function(wrapped_, instance_, args_, kwargs_):
+                for check_ in checks:
+                    kwargs_ = check_(wrapped_, instance_, args_, kwargs_, stacklevel)
+                return wrapped_(*args_, **kwargs_)
+
+        super(_DeprecatedWrapper, self).__init__(wrapped, wrapper_function)
+        self._self_checks = checks
+
+
+#: Code objects of the lightweight wrappers, used to recognize them.
+_lightweight_codes = set()
+
+
+def _lightweight_wrapper(wrapped, checks):
+    """
+    Wrap a plain function with a closure which runs the checks, and copies the metadata
+    of the function (name, docstring, ``__wrapped__``...) using :func:`functools.update_wrapper`.
+
+    Unlike :class:`_DeprecatedWrapper`, the closure is not a descriptor proxy: it is cheaper to call,
+    but it must only be used for functions which are not bound (module-level or local functions).
+
+    :param wrapped: Function to wrap.
+    :param checks: Tuple of checks, run in order before calling the function (see :class:`_DeprecatedWrapper`).
+    :return: The wrapper function.
+    """
+    # stack level of the caller, relative to a check called by the wrapper function
+    stacklevel = 3
+    if len(checks) == 1:
+        check = checks[0]
+
+        def wrapper(*args, **kwargs):
+            kwargs = check(wrapped, None, args, kwargs, stacklevel)
+            return wrapped(*args, **kwargs)
+
+    else:
+
+        def wrapper(*args, **kwargs):
+            for check_ in checks:
+                kwargs = check_(wrapped, None, args, kwargs, stacklevel)
+            return wrapped(*args, **kwargs)
+
+    functools.update_wrapper(wrapper, wrapped)
+    wrapper._deprecated_checks = checks
+    _lightweight_codes.add(wrapper.__code__)
+    return wrapper
+
+
+def _is_lightweight_wrapper(obj):
+    # The ``_deprecated_checks`` attribute is not enough: it is copied by ``functools.wraps``
+    return getattr(obj, "__code__", None) in _lightweight_codes and "_deprecated_checks" in vars(obj)
+
+
+def _is_plain_function(obj):
+    """
+    Check whether *obj* is a function which is not defined in a class body
+    (according to its qualified name), so that it doesn't need to be bound.
+    """
+    if not inspect.isfunction(obj):
+        return False
+    path = (getattr(obj, "__qualname__", None) or obj.__name__).split(".")
+    return len(path) == 1 or path[-2] == "<locals>"
+
+
+def _get_binding_kind(wrapped, lightweight=False):
+    """
+    Get the binding kind of a routine, when it is known at decoration time.
+
+    The binding kind of class methods, static methods, bound methods and lightweight wrappers
+    doesn't depend on the way they are called. The kind of the other functions is only known
+    when they are called (a function defined in a class body can be called as a method,
+    or as a class method if it is wrapped by the :class:`classmethod` decorator).
+
+    :param wrapped: Routine to wrap (possibly already wrapped by stacked decorators).
+    :param lightweight: If ``True``, a plain function is wrapped by a lightweight wrapper.
+    :return: The binding kind ("function", "classmethod" or "method"), or ``None`` if it is resolved at each call.
+    """
+    if type(wrapped) is _DeprecatedWrapper:
+        wrapped = wrapped.__wrapped__
+    elif _is_lightweight_wrapper(wrapped) or (lightweight and _is_plain_function(wrapped)):
+        # the instance passed to the checks is always ``None``
+        return "function"
+    if isinstance(wrapped, staticmethod):
+        return "function"
+    if isinstance(wrapped, classmethod):
+        return "classmethod"
+    if inspect.ismethod(wrapped):
+        return "classmethod" if inspect.isclass(wrapped.__self__) else "method"
+    return None
+
+
+def _object_new(cls, *args, **kwargs):
+    # ``object.__new__`` cannot be assigned to a class which overrides ``__init__``
+    # (the arguments are then rejected), so it is called without the arguments.
+    return object.__new__(cls)
+
+
+def _restore_native_new(deprecated_cls, new_attr, old_new_attr, cls):
+    """
+    Restore the original ``__new__`` method in a subclass of a deprecated class,
+    so that the subclass is instantiated without calling the deprecation wrapper (*new_attr*).
+
+    :param deprecated_cls: Deprecated class.
+    :param new_attr: ``__new__`` attribute of the deprecated class (the deprecation wrapper).
+    :param old_new_attr: Original ``__new__`` attribute of the deprecated class,
+        or ``None`` if it is inherited.
+    :param cls: Subclass being defined.
+    """
+    mro = cls.__mro__
+    attr = next(vars(klass)["__new__"] for klass in mro if "__new__" in vars(klass))
+    if attr is not new_attr:
+        # ``__new__`` is overridden by the subclass (or by a mixin class)
+        return
+    if old_new_attr is None:
+        index = mro.index(deprecated_cls) + 1
+        old_new_attr = next(vars(klass)["__new__"] for klass in mro[index:] if "__new__" in vars(klass))
+    if old_new_attr is vars(object)["__new__"]:
+        old_new_attr = staticmethod(_object_new)
+    cls.__new__ = old_new_attr
+
+
+def _install_subclass_hook(cls, hook):
+    """
+    Install a hook which is called with each subclass of *cls*, when it is defined,
+    using the ``__init_subclass__`` class method (the existing method is still called).
+    Nothing is done on Python versions which don't support ``__init_subclass__``.
+
+    :param cls: Class.
+    :param hook: Function called with the subclass.
+    :return: The ``__init_subclass__`` attribute which is installed, or ``None``.
+    """
+    if not hasattr(cls, "__init_subclass__"):  # pragma: no cover
+        return None
+    old_attr = vars(cls).get("__init_subclass__")
+
+    def init_subclass(subclass, **kwargs):
+        hook(subclass)
+        if old_attr is None:
+            super(cls, subclass).__init_subclass__(**kwargs)
+        else:
+            old_attr.__get__(None, subclass)(**kwargs)
+
+    new_attr = classmethod(init_subclass)
+    cls.__init_subclass__ = new_attr
+    return new_attr
+
+
+#: Methods which may be called when a class is defined, see :func:`_get_subclass_stacklevel`.
+_class_creation_methods = {"__new__", "__init__", "__init_subclass__"}
+
+
+def _get_subclass_stacklevel():
+    """
+    Get the stack level of the class statement which defines a subclass, relative to
+    the hook installed by :func:`_install_subclass_hook` (to use with :func:`warnings.warn`).
+
+    The frames of the metaclass methods (``__new__`` and ``__init__``) and of the
+    ``__init_subclass__`` methods of the intermediate classes are skipped.
+    """
+    # frames: this function, the hook, ``init_subclass``, then the caller
+    stacklevel = 3
+    frame = sys._getframe(stacklevel)
+    while frame.f_back is not None and frame.f_code.co_name in _class_creation_methods:
+        code = frame.f_code
+        if not code.co_argcount or not isinstance(frame.f_locals.get(code.co_varnames[0]), type):
+            break
+        frame = frame.f_back
+        stacklevel += 1
+    return stacklevel
+
+
+def _wrap_routine(wrapped, check, lightweight=False):
+    """
+    Wrap a deprecated routine with a check.
+
+    If the routine is already wrapped by a :class:`_DeprecatedWrapper` or a lightweight wrapper
+    (stacked decorators), a new wrapper is built around the original routine, which runs the new check
+    followed by the checks of the previous wrapper, so that there is a single wrapper layer.
+
+    :param wrapped: Routine to wrap (function, method, class method or static method).
+    :param check: Check to run before calling the routine (see :class:`_DeprecatedWrapper`).
+    :param lightweight: If ``True``, a plain function is wrapped by a closure instead of
+        a *wrapt* function wrapper (see :func:`_lightweight_wrapper`).
+    :return: The wrapper.
+    """
+    if type(wrapped) is _DeprecatedWrapper:
+        return _DeprecatedWrapper(wrapped.__wrapped__, (check,) + wrapped._self_checks)
+    if _is_lightweight_wrapper(wrapped):
+        wrapper = _lightweight_wrapper(wrapped.__wrapped__, (check,) + wrapped._deprecated_checks)
+        # keep the metadata set on the previous wrapper (for instance, a Sphinx directive in the docstring)
+        checks = wrapper._deprecated_checks
+        wrapper.__doc__ = wrapped.__doc__
+        vars(wrapper).update(vars(wrapped))
+        wrapper._deprecated_checks = checks
+        return wrapper
+    if lightweight and _is_plain_function(wrapped):
+        return _lightweight_wrapper(wrapped, (check,))
+    return _DeprecatedWrapper(wrapped, (check,))
+
+
+def _is_wrapped_by(attr, check):
+    # Check whether *attr* is a wrapper which only runs the given *check*
+    if type(attr) is _DeprecatedWrapper:
+        return attr._self_checks == (check,)
+    return _is_lightweight_wrapper(attr) and attr._deprecated_checks == (check,)
+
+
+def _rebind(check, wrapped):
+    """
+    Replace a deprecated function (the wrapper which runs the *check*) by the original function
+    (*wrapped*) where the wrapper was installed: in the module globals or in the class attributes.
+
+    The location of the wrapper is found using the qualified name of the wrapped function,
+    so functions defined locally (in a function body) cannot be rebound.
+    A wrapper which runs the checks of several stacked decorators is not replaced.
+
+    :return: ``True`` if the wrapper was found and replaced.
+    """
+    # classmethod and staticmethod objects have no name before Python 3.10
+    func = getattr(wrapped, "__func__", wrapped)
+    module = sys.modules.get(getattr(func, "__module__", None) or "")
+    path = (getattr(func, "__qualname__", None) or func.__name__).split(".")
+    if module is None or "<locals>" in path:
+        return False
+    owner = module
+    for name in path[:-1]:
+        owner = vars(owner).get(name)
+        if owner is None:
+            return False
+    name = path[-1]
+    attr = vars(owner).get(name)
+    if _is_wrapped_by(attr, check):
+        setattr(owner, name, wrapped)
+    elif isinstance(attr, (classmethod, staticmethod)) and _is_wrapped_by(attr.__func__, check):
+        setattr(owner, name, type(attr)(wrapped))
+    else:
+        return False
+    return True
+
+
+#: Operations of the deprecated descriptors, see :meth:`ClassicAdapter.get_deprecated_attr_msg`.
+_descriptor_operations = ("get", "set", "delete")
+
+
+def _is_descriptor(obj):
+    """
+    Check whether *obj* is a descriptor which is not a routine, for instance a :class:`property`
+    or a :func:`functools.cached_property` (class methods and static methods are routines).
+    """
+    if callable(obj) or isinstance(obj, (classmethod, staticmethod)):
+        return False
+    return hasattr(type(obj), "__get__")
+
+
+def _get_descriptor_name(descriptor):
+    # name of the getter function, until the name of the attribute is given by ``__set_name__``
+    func = getattr(descriptor, "fget", None) or getattr(descriptor, "func", None)
+    return getattr(func, "__name__", None) or type(descriptor).__name__
+
+
+class _DeprecatedDescriptor(object):
+    """
+    Wrapper of a deprecated descriptor which is not a data descriptor (for instance,
+    a :func:`functools.cached_property`): reading the attribute emits a deprecation warning.
+
+    The wrapper is a data descriptor if and only if the wrapped descriptor is one
+    (see :class:`_DeprecatedDataDescriptor`), so that the attributes stored in the instance
+    dictionary have the same precedence. The other attributes are read from the wrapped descriptor.
+
+    When no more warning can be emitted (for instance, with *once*), the *quiet* flag is set
+    and the check is skipped, unless the usage statistics are collected.
+
+    :param descriptor: Wrapped descriptor.
+    :param check: Function called with the operation ("get", "set" or "delete") and the stack level
+        of the caller (relative to the check), before the attribute is accessed.
+    :param set_name: Function called with the owner class and the attribute name (see ``__set_name__``).
+    :param rewrap: Function used to wrap the descriptors built from the wrapped one
+        (see :meth:`_DeprecatedDataDescriptor.setter`).
+    :param quiet: ``True`` if the check can be skipped from the start (for instance, with the "ignore" action).
+    """
+
+    def __init__(self, descriptor, check, set_name, rewrap, quiet=False):
+        self.__wrapped__ = descriptor
+        self.__doc__ = getattr(descriptor, "__doc__", None)
+        self._deprecated_check = check
+        self._deprecated_set_name = set_name
+        self._deprecated_rewrap = rewrap
+        self._deprecated_quiet = quiet
+        self._descriptor_get = descriptor.__get__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            value = self._descriptor_get(None, owner)
+            return self if value is self.__wrapped__ else value
+        if not self._deprecated_quiet or stats._collecting:
+            # stack levels: the check, ``__get__``, then the caller
+            self._deprecated_check("get", 3)
+        return self._descriptor_get(instance, owner)
+
+    def __set_name__(self, owner, name):
+        set_name = getattr(self.__wrapped__, "__set_name__", None)
+        if set_name is not None:
+            set_name(owner, name)
+        self._deprecated_set_name(owner, name)
+
+    def __getattr__(self, name):
+        if name == "__wrapped__":
+            raise AttributeError(name)
+        return getattr(self.__wrapped__, name)
+
+
+class _DeprecatedDataDescriptor(_DeprecatedDescriptor):
+    """
+    Wrapper of a deprecated data descriptor: reading, assigning or deleting the attribute
+    emits a deprecation warning.
+
+    A property without setter (or deleter) raises :exc:`AttributeError` without emitting the warning.
+    """
+
+    def __set__(self, instance, value):
+        descriptor_set = getattr(self.__wrapped__, "__set__", None)
+        if descriptor_set is None:
+            raise AttributeError("__set__")
+        if getattr(self.__wrapped__, "fset", descriptor_set) is not None:
+            if not self._deprecated_quiet or stats._collecting:
+                self._deprecated_check("set", 3)
+        descriptor_set(instance, value)
+
+    def __delete__(self, instance):
+        descriptor_delete = getattr(self.__wrapped__, "__delete__", None)
+        if descriptor_delete is None:
+            raise AttributeError("__delete__")
+        if getattr(self.__wrapped__, "fdel", descriptor_delete) is not None:
+            if not self._deprecated_quiet or stats._collecting:
+                self._deprecated_check("delete", 3)
+        descriptor_delete(instance)
+
+    def getter(self, fget):
+        return self._deprecated_rewrap(self.__wrapped__.getter(fget))
+
+    def setter(self, fset):
+        return self._deprecated_rewrap(self.__wrapped__.setter(fset))
+
+    def deleter(self, fdel):
+        return self._deprecated_rewrap(self.__wrapped__.deleter(fdel))
+
+
+def _wrap_accessor(prop, func, operation, check):
+    # getter, setter or deleter of a deprecated property, see :class:`_DeprecatedProperty`.
+    # Stack levels: the check, the accessor, then the caller (``property.__get__`` has no frame).
+    if operation == "get":
+        # the getter has a fixed signature, which is faster to call
+
+        def accessor(instance):
+            if not prop._deprecated_quiet or stats._collecting:
+                check(operation, 3)
+            return func(instance)
+
+    else:
+
+        def accessor(*args):
+            if not prop._deprecated_quiet or stats._collecting:
+                check(operation, 3)
+            return func(*args)
+
+    return functools.update_wrapper(accessor, func)
+
+
+class _DeprecatedProperty(property):
+    """
+    Wrapper of a deprecated :class:`property`: the getter, setter and deleter are wrapped
+    by functions which call the check, and the attribute is accessed by the native ``property``
+    methods. Once quiet, reading the attribute costs a flag test and the call of the original getter.
+
+    The parameters are the same as :class:`_DeprecatedDescriptor`.
+    """
+
+    def __init__(self, descriptor, check, set_name, rewrap, quiet=False):
+        accessors = [
+            None if func is None else _wrap_accessor(self, func, operation, check)
+            for func, operation in zip((descriptor.fget, descriptor.fset, descriptor.fdel), _descriptor_operations)
+        ]
+        super(_DeprecatedProperty, self).__init__(*accessors)
+        # the docstring of this class would hide the docstring of the property
+        self.__doc__ = descriptor.__doc__
+        self.__wrapped__ = descriptor
+        self._deprecated_set_name = set_name
+        self._deprecated_rewrap = rewrap
+        self._deprecated_quiet = quiet
+
+    def __set_name__(self, owner, name):
+        set_name = getattr(self.__wrapped__, "__set_name__", None)
+        if set_name is not None:
+            set_name(owner, name)
+        self._deprecated_set_name(owner, name)
+
+    def getter(self, fget):
+        return self._deprecated_rewrap(self.__wrapped__.getter(fget))
+
+    def setter(self, fset):
+        return self._deprecated_rewrap(self.__wrapped__.setter(fset))
+
+    def deleter(self, fdel):
+        return self._deprecated_rewrap(self.__wrapped__.deleter(fdel))
+
+
+_monotonic = getattr(time, "monotonic", time.time)
+
+
+class _Throttle(object):
+    """
+    Limit the number of emitted warnings, using random sampling and/or a token bucket.
+
+    The decision is taken before the warning message is built and the call stack is inspected.
+
+    :param sample_rate: Probability (between 0 and 1) that a call emits the warning,
+        or ``None`` to disable the sampling.
+    :param max_per_interval: Maximum number of warnings emitted per *interval*,
+        or ``None`` to disable the rate limiting.
+    :param interval: Duration of the interval, in seconds.
+    """
+
+    def __init__(self, sample_rate=None, max_per_interval=None, interval=1.0):
+        if sample_rate is not None and not 0 <= sample_rate <= 1:
+            raise ValueError("sample_rate must be between 0 and 1: {0!r}".format(sample_rate))
+        if max_per_interval is not None and max_per_interval < 1:
+            raise ValueError("max_per_interval must be a positive number: {0!r}".format(max_per_interval))
+        if interval <= 0:
+            raise ValueError("interval must be a positive duration: {0!r}".format(interval))
+        self.sample_rate = sample_rate
+        self.max_per_interval = max_per_interval
+        self.interval = interval
+        if sample_rate is not None:
+            # the "random" module is only imported if necessary
+            import random
+
+            self._random = random.random
+        self._tokens = max_per_interval
+        self._last = _monotonic()
+        self._lock = threading.Lock()
+
+    def sample(self):
+        """
+        Randomly select the calls which may emit a warning.
+
+        :return: ``True`` if the call is selected.
+        """
+        return self.sample_rate is None or self._random() < self.sample_rate
+
+    def acquire(self):
+        """
+        Take a token from the bucket, which is refilled at the rate of
+        *max_per_interval* tokens per *interval*.
+
+        :return: ``True`` if a token was available: the warning can be emitted.
+        """
+        if self.max_per_interval is None:
+            return True
+        with self._lock:
+            now = _monotonic()
+            refill = (now - self._last) * self.max_per_interval / self.interval
+            self._tokens = min(self.max_per_interval, self._tokens + refill)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+    def allow(self):
+        """
+        Check whether a call can emit a warning: the call must be sampled,
+        and a token must be available.
+        """
+        return self.sample() and self.acquire()
+
+
+class _LocalFilter(object):
+    """
+    Apply a warning filter action locally, without modifying the global :data:`warnings.filters`.
+
+    The decision to emit, raise or skip the warning is taken by the filter itself.
+    The "default", "module" and "once" actions use a registry of the already emitted warnings
+    which is private to the filter (instead of the ``__warningregistry__`` of the modules).
+    """
+
+    def __init__(self, action, category):
+        if action not in _filter_actions:
+            raise ValueError("invalid action: {0!r}".format(action))
+        self.action = action
+        self.category = category
+        self._registry = set()
+        self._lock = threading.Lock()
+
+    def warn(self, message, stacklevel=1):
+        """
+        Emit, raise or skip a warning, according to the filter action.
+
+        :param message: The warning message.
+
+        :param stacklevel: Same meaning as in :func:`warnings.warn`.
+        """
+        action = self.action
+        if action == "ignore":
+            return
+        category = self.category
+        if action == "error":
+            raise category(message)
+        try:
+            frame = sys._getframe(stacklevel)
+        except ValueError:
+            filename, lineno = "sys", 1
+        else:
+            filename, lineno = frame.f_code.co_filename, frame.f_lineno
+        if action == "once":
+            key = message
+        elif action == "module":
+            key = (message, filename)
+        elif action == "default":
+            key = (message, filename, lineno)
+        else:
+            key = None
+        if key is not None:
+            registry = self._registry
+            if key in registry:
+                return
+            with self._lock:
+                if key in registry:
+                    return
+                registry.add(key)
+        warnings.showwarning(category(message), category, filename, lineno)
+
 
 class ClassicAdapter(wrapt.AdapterFactory):
     """
@@ -83,7 +795,21 @@ class ClassicAdapter(wrapt.AdapterFactory):
            return x + y
     """
 
-    def __init__(self, reason="", version="", action=None, category=DeprecationWarning, extra_stacklevel=0):
+    def __init__(
+        self,
+        reason="",
+        version="",
+        action=None,
+        category=DeprecationWarning,
+        extra_stacklevel=0,
+        once=False,
+        unwrap_after=None,
+        sample_rate=None,
+        max_per_interval=None,
+        interval=1.0,
+        lightweight=False,
+        class_mode="instance",
+    ):
         """
         Construct a wrapper adapter.
 
@@ -102,6 +828,7 @@ class ClassicAdapter(wrapt.AdapterFactory):
             A warning filter used to activate or not the deprecation warning.
             Can be one of "error", "ignore", "always", "default", "module", or "once".
             If ``None`` or empty, the global filtering mechanism is used.
+            The filter is applied locally: the global warning filters are not modified.
             See: `The Warnings Filter`_ in the Python documentation.
 
         :type  category: Type[Warning]
@@ -116,14 +843,78 @@ class ClassicAdapter(wrapt.AdapterFactory):
             With the default value of 0, the warning refers to where the class was instantiated
             or the function was called.
 
+        :type  once: bool
+        :param once:
+            If ``True``, the deprecation warning is emitted only once per decorated class or function.
+            Once the warning is emitted, the next calls only check a flag, without using
+            the warning filters and registries.
+
+        :type  unwrap_after: int
+        :param unwrap_after:
+            If set, the decorated function stops emitting warnings after *unwrap_after* warnings,
+            and the wrapper is replaced by the original function in the module or the class where
+            it was defined (so that the next calls are done at native speed).
+            For a class, the original ``__new__`` method is restored.
+            It cannot be combined with *once*.
+
+        :type  sample_rate: float
+        :param sample_rate:
+            Probability (between 0 and 1) that a call emits the deprecation warning.
+            If ``None``, every call emits the warning (subject to the warning filters).
+
+        :type  max_per_interval: int
+        :param max_per_interval:
+            Maximum number of deprecation warnings emitted per *interval* (token bucket).
+            If ``None``, the number of warnings is not limited.
+
+        :type  interval: float
+        :param interval:
+            Duration, in seconds, of the interval used by *max_per_interval*.
+
+        :type  lightweight: bool
+        :param lightweight:
+            If ``True``, the functions which are not defined in a class body are wrapped by a closure
+            (using :func:`functools.wraps`) instead of a *wrapt* function wrapper, which is cheaper to call.
+            The methods, class methods and static methods are still wrapped by *wrapt*.
+
+        :type  class_mode: Literal["instance", "exact", "subclass"]
+        :param class_mode:
+            Usages which emit the deprecation warning of a class.
+            With "instance" (the default), every instantiation of the class and of its subclasses
+            emits the warning. With "exact", only the instantiations of the deprecated class itself
+            emit the warning: the subclasses are instantiated using the original ``__new__`` method,
+            without calling the deprecation wrapper (Python 3.6+).
+            With "subclass", the warning is emitted when a subclass is defined (using an
+            ``__init_subclass__`` hook), and the instantiations are not slowed down (Python 3.6+).
+
         .. versionchanged:: 1.2.15
             Add the *extra_stacklevel* parameter.
+
+        .. versionchanged:: 1.4.0
+            Add the *once*, *unwrap_after*, *sample_rate*, *max_per_interval* and *interval* parameters.
+
+        .. versionchanged:: 1.4.0
+            Add the *lightweight* parameter.
+
+        .. versionchanged:: 1.4.0
+            Add the *class_mode* parameter.
         """
+        if class_mode not in _class_modes:
+            raise ValueError("invalid class_mode: {0!r}".format(class_mode))
+        if once and unwrap_after is not None:
+            raise ValueError("once and unwrap_after cannot be combined")
         self.reason = reason or ""
         self.version = version or ""
         self.action = action
         self.category = category
         self.extra_stacklevel = extra_stacklevel
+        self.once = once
+        self.unwrap_after = unwrap_after
+        self.sample_rate = sample_rate
+        self.max_per_interval = max_per_interval
+        self.interval = interval
+        self.lightweight = lightweight
+        self.class_mode = class_mode
         super(ClassicAdapter, self).__init__()
 
     def get_deprecated_msg(self, wrapped, instance):
@@ -132,15 +923,21 @@ class ClassicAdapter(wrapt.AdapterFactory):
 
         :param wrapped: Wrapped class or function.
 
-        :param instance: The object to which the wrapped function was bound when it was called.
+        :param instance: The object to which the wrapped function was bound when it was called,
+            or the subclass which is defined (with the "subclass" class mode).
 
         :return: The warning message.
+
+        .. versionchanged:: 1.4.0
+           Add the message of the "subclass" class mode.
         """
         if instance is None:
             if inspect.isclass(wrapped):
                 fmt = "Call to deprecated class {name}."
             else:
                 fmt = "Call to deprecated function (or staticmethod) {name}."
+        elif inspect.isclass(wrapped):
+            fmt = "Subclassing deprecated class {name}."
         else:
             if inspect.isclass(instance):
                 fmt = "Call to deprecated class method {name}."
@@ -152,6 +949,57 @@ class ClassicAdapter(wrapt.AdapterFactory):
             fmt += " -- Deprecated since version {version}."
         return fmt.format(name=wrapped.__name__, reason=self.reason or "", version=self.version or "")
 
+    def get_deprecated_attr_msg(self, wrapped, name, operation):
+        """
+        Get the deprecation warning message of a deprecated property (or descriptor) for the user.
+
+        :param wrapped: Wrapped descriptor.
+
+        :param name: Name of the attribute.
+
+        :param operation: The access to the attribute: "get", "set" or "delete".
+
+        :return: The warning message.
+
+        .. versionadded:: 1.4.0
+        """
+        fmt = {
+            "get": "Access to deprecated attribute {name}.",
+            "set": "Assignment to deprecated attribute {name}.",
+            "delete": "Deletion of deprecated attribute {name}.",
+        }[operation]
+        if self.reason:
+            fmt += " ({reason})"
+        if self.version:
+            fmt += " -- Deprecated since version {version}."
+        return fmt.format(name=name, reason=self.reason or "", version=self.version or "")
+
+    def _get_static_msgs(self, wrapped):
+        """
+        Compute the deprecation warning messages once, at decoration time.
+
+        :param wrapped: Wrapped class or function.
+
+        :return: A dictionary which maps each binding kind ("class", "function",
+            "classmethod" or "method") to its warning message, or ``None`` if the
+            :meth:`get_deprecated_msg` method is overridden, in which case the message
+            must be computed at each call.
+        """
+        getter = type(self).get_deprecated_msg
+        if getattr(getter, '__func__', getter) not in _static_msg_getters or _is_descriptor(wrapped):
+            # the messages of the descriptors are computed by :meth:`get_deprecated_attr_msg`
+            return None
+        if inspect.isclass(wrapped):
+            return {"class": self.get_deprecated_msg(wrapped, None)}
+        if isinstance(wrapped, (classmethod, staticmethod)):
+            # these objects have no name before Python 3.10
+            wrapped = wrapped.__func__
+        return {
+            "function": self.get_deprecated_msg(wrapped, None),
+            "classmethod": self.get_deprecated_msg(wrapped, object),
+            "method": self.get_deprecated_msg(wrapped, _any_instance),
+        }
+
     def __call__(self, wrapped):
         """
         Decorate your class or function.
@@ -165,40 +1013,206 @@ class ClassicAdapter(wrapt.AdapterFactory):
 
         .. versionchanged:: 1.2.8
            The warning filter is not set if the *action* parameter is ``None`` or empty.
+
+        .. versionchanged:: 1.4.0
+           The warning messages are computed at decoration time,
+           unless the :meth:`get_deprecated_msg` method is overridden.
+
+        .. versionchanged:: 1.4.0
+           The binding kind of class methods, static methods and bound methods is resolved
+           at decoration time, the message of the other functions is chosen at each call.
+
+        .. versionchanged:: 1.4.0
+           The *action* is applied locally, the global warning filters are no longer modified.
+
+        .. versionchanged:: 1.4.0
+           If the *action* is not set and the global warning filters ignore the warning category,
+           the warning message is not computed.
+
+        .. versionchanged:: 1.4.0
+           If the decorators are disabled (see :mod:`deprecated.config`),
+           the class or function is returned unchanged.
+
+        .. versionchanged:: 1.4.0
+           The calls are counted in the usage statistics (see :mod:`deprecated.stats`).
+
+        .. versionchanged:: 1.4.0
+           A property or a descriptor is wrapped in a descriptor which emits the warning
+           when the attribute is read, assigned or deleted.
         """
-        if inspect.isclass(wrapped):
+        if not is_enabled():
+            return wrapped
+
+        static_msgs = self._get_static_msgs(wrapped)
+        local_filter = _LocalFilter(self.action, self.category) if self.action else None
+        class_stacklevel = _get_stacklevels()[1]
+        limit = 1 if self.once else self.unwrap_after
+        state = _WarningState(limit)
+        counter = stats.register(stats.get_symbol_name(wrapped))
+        if self.sample_rate is None and self.max_per_interval is None:
+            throttle = None
+        else:
+            throttle = _Throttle(self.sample_rate, self.max_per_interval, self.interval)
+
+        if inspect.isclass(wrapped) and self.class_mode == "subclass":
+            old_init_subclass_attr = vars(wrapped).get("__init_subclass__")
+
+            def warn_subclass(subclass):
+                if stats._collecting:
+                    counter.count += 1
+                if state.done:
+                    return
+                stacklevel = _get_subclass_stacklevel() + self.extra_stacklevel
+                if local_filter is None and _is_ignored(self.category, stacklevel):
+                    return
+                if throttle is not None and not throttle.allow():
+                    return
+                if limit is not None and not state.claim():
+                    return
+                msg = self.get_deprecated_msg(wrapped, subclass)
+                if local_filter is None:
+                    warnings.warn(msg, category=self.category, stacklevel=stacklevel)
+                else:
+                    local_filter.warn(msg, stacklevel=stacklevel)
+                if state.done and self.unwrap_after is not None and vars(wrapped).get("__init_subclass__") is hook_attr:
+                    # restore the original ``__init_subclass__`` method
+                    if old_init_subclass_attr is None:
+                        del wrapped.__init_subclass__
+                    else:
+                        wrapped.__init_subclass__ = old_init_subclass_attr
+
+            hook_attr = _install_subclass_hook(wrapped, warn_subclass)
+
+        elif inspect.isclass(wrapped):
+            exact = self.class_mode == "exact"
             old_new1 = wrapped.__new__
+            old_new_attr = vars(wrapped).get("__new__")
 
             def wrapped_cls(cls, *args, **kwargs):
-                msg = self.get_deprecated_msg(wrapped, None)
-                stacklevel = _class_stacklevel + self.extra_stacklevel
-                if self.action:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter(self.action, self.category)
+                # with the "exact" class mode, a subclass may still call this ``__new__`` method
+                subclass = exact and cls is not wrapped
+                if stats._collecting and not subclass:
+                    counter.count += 1
+                if subclass or state.done:
+                    pass
+                elif local_filter is None and _is_ignored(self.category, class_stacklevel + self.extra_stacklevel):
+                    pass
+                elif throttle is not None and not throttle.allow():
+                    pass
+                elif limit is None or state.claim():
+                    if static_msgs is None:
+                        msg = self.get_deprecated_msg(wrapped, None)
+                    else:
+                        msg = static_msgs["class"]
+                    stacklevel = class_stacklevel + self.extra_stacklevel
+                    if local_filter is None:
                         warnings.warn(msg, category=self.category, stacklevel=stacklevel)
-                else:
-                    warnings.warn(msg, category=self.category, stacklevel=stacklevel)
+                    else:
+                        local_filter.warn(msg, stacklevel=stacklevel)
+                    if state.done and self.unwrap_after is not None and vars(wrapped).get("__new__") is new_attr:
+                        # restore the original ``__new__`` method
+                        if old_new_attr is None:
+                            del wrapped.__new__
+                        else:
+                            wrapped.__new__ = old_new_attr
                 if old_new1 is object.__new__:
                     return old_new1(cls)
                 # actually, we don't know the real signature of *old_new1*
                 return old_new1(cls, *args, **kwargs)
 
-            wrapped.__new__ = staticmethod(wrapped_cls)
+            new_attr = staticmethod(wrapped_cls)
+            wrapped.__new__ = new_attr
+            if exact:
+                _install_subclass_hook(wrapped, functools.partial(_restore_native_new, wrapped, new_attr, old_new_attr))
+
+        elif _is_descriptor(wrapped):
+            # ``__set_name__`` gives the name of the attribute and the classes where it is installed
+            msgs = {}
+            owners = []
+
+            def set_name(owner, name):
+                if owner is not None:
+                    owners.append((owner, name))
+                for operation in _descriptor_operations:
+                    msgs[operation] = self.get_deprecated_attr_msg(wrapped, name, operation)
+
+            def check(operation, stacklevel):
+                if stats._collecting:
+                    counter.count += 1
+                if state.done:
+                    return
+                if local_filter is None and _is_ignored(self.category, stacklevel + self.extra_stacklevel):
+                    return
+                if throttle is not None and not throttle.allow():
+                    return
+                if limit is not None and not state.claim():
+                    return
+                stacklevel += self.extra_stacklevel
+                if local_filter is None:
+                    warnings.warn(msgs[operation], category=self.category, stacklevel=stacklevel)
+                else:
+                    local_filter.warn(msgs[operation], stacklevel=stacklevel)
+                if state.done:
+                    # the next accesses skip the check
+                    descriptor._deprecated_quiet = True
+                    if self.unwrap_after is not None:
+                        # restore the original descriptor
+                        for owner, name in owners:
+                            if vars(owner).get(name) is descriptor:
+                                setattr(owner, name, wrapped)
+
+            set_name(None, _get_descriptor_name(wrapped))
+            if type(wrapped) is property:
+                descriptor_cls = _DeprecatedProperty
+            elif hasattr(type(wrapped), "__set__") or hasattr(type(wrapped), "__delete__"):
+                descriptor_cls = _DeprecatedDataDescriptor
+            else:
+                descriptor_cls = _DeprecatedDescriptor
+            # the descriptors built by ``setter`` (and so on) are wrapped without changing their docstring
+            rewrap = functools.partial(ClassicAdapter.__call__, self)
+            quiet = local_filter is not None and local_filter.action == "ignore"
+            descriptor = descriptor_cls(wrapped, check, set_name, rewrap, quiet=quiet)
+            return descriptor
 
         elif inspect.isroutine(wrapped):
-            @wrapt.decorator
-            def wrapper_function(wrapped_, instance_, args_, kwargs_):
-                msg = self.get_deprecated_msg(wrapped_, instance_)
-                stacklevel = _routine_stacklevel + self.extra_stacklevel
-                if self.action:
-                    with warnings.catch_warnings():
-                        warnings.simplefilter(self.action, self.category)
-                        warnings.warn(msg, category=self.category, stacklevel=stacklevel)
+            kind = _get_binding_kind(wrapped, self.lightweight)
+            if static_msgs is not None:
+                function_msg = static_msgs["function"]
+                classmethod_msg = static_msgs["classmethod"]
+                method_msg = static_msgs["method"]
+                kind_msg = None if kind is None else static_msgs[kind]
+
+            def check(wrapped_, instance_, args_, kwargs_, stacklevel):
+                if stats._collecting:
+                    counter.count += 1
+                if state.done:
+                    return kwargs_
+                if local_filter is None and _is_ignored(self.category, stacklevel + self.extra_stacklevel):
+                    return kwargs_
+                if throttle is not None and not throttle.allow():
+                    return kwargs_
+                if limit is not None and not state.claim():
+                    return kwargs_
+                if static_msgs is None:
+                    msg = self.get_deprecated_msg(wrapped_, instance_)
+                elif kind_msg is not None:
+                    msg = kind_msg
+                elif instance_ is None:
+                    msg = function_msg
+                elif inspect.isclass(instance_):
+                    msg = classmethod_msg
                 else:
+                    msg = method_msg
+                stacklevel += self.extra_stacklevel
+                if local_filter is None:
                     warnings.warn(msg, category=self.category, stacklevel=stacklevel)
-                return wrapped_(*args_, **kwargs_)
+                else:
+                    local_filter.warn(msg, stacklevel=stacklevel)
+                if state.done and self.unwrap_after is not None:
+                    _rebind(check, wrapped)
+                return kwargs_
 
-            return wrapper_function(wrapped)
+            return _wrap_routine(wrapped, check, lightweight=self.lightweight)
 
         else:  # pragma: no cover
             raise TypeError(repr(type(wrapped)))
@@ -206,6 +1220,12 @@ class ClassicAdapter(wrapt.AdapterFactory):
         return wrapped
 
 
+_static_msg_getters.add(ClassicAdapter.__dict__['get_deprecated_msg'])
+
+#: Placeholder used to compute the message of a method (any instance which is not a class).
+_any_instance = object()
+
+
 def deprecated(*args, **kwargs):
     """
     This is a decorator which can be used to mark functions
@@ -284,12 +1304,103 @@ def deprecated(*args, **kwargs):
     The *extra_stacklevel* keyword argument allows you to specify additional stack levels
     to consider instrumentation rather than user code. With the default value of 0, the
     warning refers to where the class was instantiated or the function was called.
+
+    The *once* keyword argument allows you to emit the deprecation warning only once per
+    decorated class or function. Once the warning is emitted, the next calls only check a flag,
+    which is faster than using the "once" *action*.
+
+    .. code-block:: python
+
+       from deprecated import deprecated
+
+
+       @deprecated(once=True)
+       def some_old_function(x, y):
+           return x + y
+
+    The *unwrap_after* keyword argument allows you to remove the wrapper after a given number
+    of warnings: the deprecated function is replaced by the original function in its module
+    (or class), so that the next calls are done at native speed.
+
+    .. code-block:: python
+
+       from deprecated import deprecated
+
+
+       @deprecated(unwrap_after=10)
+       def some_old_function(x, y):
+           return x + y
+
+    The *sample_rate* and *max_per_interval* keyword arguments allow you to limit the number
+    of warnings emitted by a function which is called very often: the decision is taken before
+    the warning message is built. In the following example, one call out of 100 emits the warning,
+    with at most 10 warnings per minute:
+
+    .. code-block:: python
+
+       from deprecated import deprecated
+
+
+       @deprecated(sample_rate=0.01, max_per_interval=10, interval=60)
+       def some_old_function(x, y):
+           return x + y
+
+    The *lightweight* keyword argument allows you to wrap the functions which are not defined
+    in a class body with a closure (using :func:`functools.wraps`) instead of a *wrapt* function wrapper,
+    which is cheaper to call. The methods are still wrapped by *wrapt*.
+
+    .. code-block:: python
+
+       from deprecated import deprecated
+
+
+       @deprecated(lightweight=True)
+       def some_old_function(x, y):
+           return x + y
+
+    The *class_mode* keyword argument allows you to deprecate a base class without slowing down
+    the instantiation of its subclasses: with "exact", only the instantiations of the deprecated class
+    itself emit the warning, and the subclasses are instantiated using the original ``__new__`` method.
+    With "subclass", the warning is emitted once per subclass, when the subclass is defined
+    (usually at import time), and the instantiations are not slowed down at all:
+
+    .. code-block:: python
+
+       from deprecated import deprecated
+
+
+       @deprecated(reason="use Model", class_mode="exact")
+       class OldModel(object):
+           pass
+
+
+       @deprecated(reason="use BaseModel", class_mode="subclass")
+       class OldBaseModel(object):
+           pass
+
+    You can also decorate a property, a :func:`functools.cached_property` or any other descriptor:
+    the warning is emitted when the attribute is read, assigned or deleted.
+
+    .. code-block:: python
+
+       from deprecated import deprecated
+
+
+       class SomeClass(object):
+           @deprecated(reason="use new_size")
+           @property
+           def old_size(self):
+               return self.new_size
+
+           @old_size.setter
+           def old_size(self, value):
+               self.new_size = value
     """
     if args and isinstance(args[0], string_types):
         kwargs['reason'] = args[0]
         args = args[1:]
 
-    if args and not callable(args[0]):
+    if args and not callable(args[0]) and not _is_descriptor(args[0]):
         raise TypeError(repr(type(args[0])))
 
     if args:
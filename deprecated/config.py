@@ -0,0 +1,74 @@
+# coding: utf-8
+"""
+Configuration
+=============
+
+Global configuration of the Deprecated Library.
+
+The deprecation decorators can be disabled, for instance in production,
+so that the deprecated functions and classes run at native speed.
+When the decorators are disabled, :func:`~deprecated.classic.deprecated`,
+:func:`~deprecated.sphinx.deprecated` and :func:`~deprecated.params.deprecated_params`
+return the decorated object unchanged: there is no wrapper and no ``__new__`` replacement,
+so no warning is ever emitted. The Sphinx directives are still added to the docstrings.
+
+The decorators can be disabled in two ways:
+
+- by setting the ``DEPRECATED_ENABLED`` environment variable to "0", "false", "no" or "off"
+  (the case is ignored),
+
+- by calling :func:`deprecated.configure` with ``enabled=False``.
+
+.. note::
+
+   The configuration is read when the decorators are applied (usually at import time),
+   so :func:`configure` must be called before importing the modules which use the decorators.
+   Changing the configuration afterward has no effect on the already decorated objects.
+
+.. versionadded:: 1.4.0
+"""
+import os
+
+#: Name of the environment variable used to enable or disable the decorators.
+ENABLED_ENV_VAR = "DEPRECATED_ENABLED"
+
+
+def _read_enabled_env():
+    value = os.environ.get(ENABLED_ENV_VAR, "")
+    return value.strip().lower() not in {"0", "false", "no", "off"}
+
+
+_enabled = _read_enabled_env()
+
+
+def configure(enabled=None):
+    """
+    Configure the Deprecated Library.
+
+    This function must be called before importing the modules which use the decorators.
+
+    .. code-block:: python
+
+       import deprecated
+
+       deprecated.configure(enabled=False)
+
+       import my_library  # the deprecated functions of this library run at native speed
+
+    :type  enabled: bool
+    :param enabled:
+        If ``False``, the decorators return the decorated objects unchanged.
+        If ``None``, the current setting is kept.
+    """
+    global _enabled
+    if enabled is not None:
+        _enabled = bool(enabled)
+
+
+def is_enabled():
+    """
+    Check whether the deprecation decorators are enabled.
+
+    :return: ``True`` if the decorators are enabled (the default).
+    """
+    return _enabled
@@ -0,0 +1,445 @@
+# coding: utf-8
+"""
+Deprecated module attributes and aliases
+========================================
+
+This module deprecates module-level names (constants, aliases of moved functions or classes...)
+using the module ``__getattr__`` function (:pep:`562`): the deprecated names are not stored
+in the module globals, so that each access calls ``__getattr__``, which emits the deprecation warning.
+
+The value of a deprecated name can be given explicitly, taken from the module globals,
+or imported from another module on first access, using a target of the form "package.module:name":
+the replacement module is only imported when the deprecated name is used.
+
+.. code-block:: python
+
+   # my_package/__init__.py
+   from deprecated.module import deprecate_attribute
+
+   NEW_TIMEOUT = 30
+
+   deprecate_attribute(__name__, "OLD_TIMEOUT", value=NEW_TIMEOUT, reason="use NEW_TIMEOUT", version="2.0")
+   deprecate_attribute(__name__, "parse", target="my_package.parsing:parse", version="2.0")
+
+Then, ``my_package.OLD_TIMEOUT`` or ``from my_package import parse`` emit a :class:`DeprecationWarning`.
+
+.. warning::
+
+   The module ``__getattr__`` function is not called for the global lookups done by the code
+   of the module itself: if the value of a deprecated name is taken from the module globals
+   (without *value* or *target*), the name is removed from the globals, and the functions
+   of the module which still use it raise :exc:`NameError`. Keep the value under another name
+   (for instance, a private one) and give it as *value*.
+
+If the module already defines a ``__getattr__`` function, it is called for the names which are not deprecated
+(:func:`deprecate_attribute` must be called after its definition). The ``__dir__`` function of the module
+is also defined, so that the deprecated names are listed by :func:`dir`.
+
+.. note::
+
+   On Python versions older than 3.7, the module ``__getattr__`` function is not supported:
+   the value of the deprecated name is stored in the module globals, and no warning is emitted.
+   If the decorators are disabled (see :mod:`deprecated.config`), the value is stored in
+   the module globals on first access, and no warning is emitted.
+
+The :func:`alias` function creates a deprecated alias of a function or a class which was moved:
+the alias is a proxy which imports its target on first use, and which emits the deprecation warning
+when it is called, instantiated or when one of its attributes is accessed (using a :class:`ClassicAdapter`).
+
+.. code-block:: python
+
+   # my_package/compat.py
+   from deprecated import alias
+
+   parse = alias("parse", target="my_package.parsing:parse", version="2.0")
+   Parser = alias("Parser", target="my_package.parsing:Parser", version="2.0")
+
+.. versionadded:: 1.4.0
+"""
+import importlib
+import sys
+import threading
+import warnings
+
+from deprecated import stats
+from deprecated.classic import ClassicAdapter
+from deprecated.classic import _is_ignored
+from deprecated.classic import _LocalFilter
+from deprecated.classic import _static_msg_getters
+from deprecated.config import is_enabled
+
+#: Placeholder used when the value of a deprecated attribute is not given.
+_missing = object()
+
+#: Registered deprecated attributes: module name => (``__getattr__`` function of the module,
+#: dictionary which maps the attribute names to the :class:`_DeprecatedAttribute` instances).
+_registries = {}
+
+
+def _import_target(target):
+    """
+    Import the object designated by a target of the form "package.module:name".
+
+    The name can be a dotted path (for instance "package.module:Class.attribute").
+    If the name is omitted ("package.module"), the module itself is returned.
+
+    :param target: Target to import.
+    :return: The imported object.
+    """
+    module_name, _, path = target.partition(":")
+    value = importlib.import_module(module_name)
+    for name in path.split(".") if path else ():
+        value = getattr(value, name)
+    return value
+
+
+class _DeprecatedAttribute(object):
+    """
+    Deprecated attribute of a module, resolved on first access.
+
+    :param module_name: Name of the module.
+    :param name: Name of the deprecated attribute.
+    :param value: Value of the attribute, or :data:`_missing` if it is imported from the *target*.
+    :param target: Target of the form "package.module:name" (see :func:`_import_target`), or ``None``.
+    :param msg: Deprecation warning message.
+    :param category: Warning category.
+    :param action: Warning filter applied locally, or ``None`` to use the global filters.
+    """
+
+    def __init__(self, module_name, name, value, target, msg, category, action):
+        self.module_name = module_name
+        self.name = name
+        self.value = value
+        self.target = target
+        self.msg = msg
+        self.category = category
+        self.local_filter = _LocalFilter(action, category) if action else None
+        self.counter = stats.register("{0}.{1}".format(module_name, name))
+
+    def resolve(self):
+        """
+        Get the value of the attribute, without emitting the deprecation warning.
+
+        :return: The value of the attribute (the target is imported on first access).
+        """
+        value = self.value
+        if value is _missing:
+            # Concurrent accesses may import the target twice, but the result is the same
+            value = self.value = _import_target(self.target)
+        return value
+
+    def get(self, stacklevel):
+        """
+        Get the value of the attribute, and emit the deprecation warning.
+
+        :param stacklevel: Stack level of the caller, relative to this method.
+        :return: The value of the attribute (the target is imported on first access).
+        """
+        value = self.resolve()
+        if stats._collecting:
+            self.counter.count += 1
+        if self.local_filter is None:
+            if not _is_ignored(self.category, stacklevel):
+                warnings.warn(self.msg, category=self.category, stacklevel=stacklevel)
+        else:
+            self.local_filter.warn(self.msg, stacklevel=stacklevel)
+        return value
+
+
+def _install_hooks(module, attributes):
+    """
+    Define the ``__getattr__`` and ``__dir__`` functions of a module, which give access
+    to the deprecated *attributes*. The existing functions are called for the other names.
+
+    :param module: Module.
+    :param attributes: Dictionary of the deprecated attributes (name => :class:`_DeprecatedAttribute`).
+    :return: The ``__getattr__`` function.
+    """
+    namespace = vars(module)
+    old_getattr = namespace.get("__getattr__")
+    old_dir = namespace.get("__dir__")
+    enabled = is_enabled()
+
+    def __getattr__(name):
+        try:
+            attribute = attributes[name]
+        except KeyError:
+            if old_getattr is None:
+                raise AttributeError("module {0!r} has no attribute {1!r}".format(module.__name__, name))
+            return old_getattr(name)
+        if not enabled:
+            value = namespace[name] = attribute.resolve()
+            return value
+        code = sys._getframe(1).f_code
+        if code.co_name == "_handle_fromlist" and code.co_filename.startswith("<frozen importlib"):
+            # ``from package import name`` looks up the attribute twice: this probe
+            # (to import the submodules), then the import itself, which emits the warning
+            return attribute.resolve()
+        # stack levels: ``get()``, ``__getattr__``, then the caller
+        return attribute.get(3)
+        return value
+
+    def __dir__():
+        names = set(old_dir() if old_dir is not None else namespace)
+        return sorted(names | set(attributes))
+
+    namespace["__getattr__"] = __getattr__
+    namespace["__dir__"] = __dir__
+    return __getattr__
+
+
+def deprecate_attribute(
+    module_name,
+    name,
+    value=_missing,
+    target=None,
+    reason="",
+    version="",
+    category=DeprecationWarning,
+    action=None,
+):
+    """
+    Deprecate an attribute of a module: a deprecation warning is emitted at each access.
+
+    This function is usually called at the end of the module which defines the deprecated attribute,
+    with ``__name__`` as *module_name*:
+
+    .. code-block:: python
+
+       from deprecated.module import deprecate_attribute
+
+       deprecate_attribute(__name__, "old_name", target="new_package.new_module:new_name", version="2.0")
+
+    :type  module_name: str
+    :param module_name:
+        Name of the module which defines the deprecated attribute (the module must be imported).
+
+    :type  name: str
+    :param name:
+        Name of the deprecated attribute.
+
+    :param value:
+        Value of the deprecated attribute. If the *value* and the *target* are omitted,
+        the value is taken from the module globals (and removed from them: the code of the module
+        can no longer use this name, see the warning above).
+
+    :type  target: str
+    :param target:
+        Replacement of the deprecated attribute, of the form "package.module:name"
+        (the name can be a dotted path). The module is imported on first access,
+        and the value is cached. If *reason* is empty, the target is used in the warning message.
+
+    :type  reason: str
+    :param reason:
+        Reason message which documents the deprecation in your library (can be omitted).
+
+    :type  version: str
+    :param version:
+        Version of your project which deprecates this attribute.
+
+    :type  category: Type[Warning]
+    :param category:
+        The warning category to use for the deprecation warning.
+        By default, the category class is :class:`~DeprecationWarning`.
+
+    :type  action: Literal["default", "error", "ignore", "always", "module", "once"]
+    :param action:
+        A warning filter applied locally to the deprecation warning.
+        If ``None`` or empty, the global filtering mechanism is used.
+
+    :raises TypeError: if both *value* and *target* are given.
+    :raises AttributeError: if the *value* and the *target* are omitted,
+        and the attribute is not defined in the module.
+    """
+    if value is not _missing and target is not None:
+        raise TypeError("'value' and 'target' arguments are mutually exclusive")
+    module = sys.modules[module_name]
+    namespace = vars(module)
+    if value is _missing and target is None:
+        try:
+            value = namespace.pop(name)
+        except KeyError:
+            raise AttributeError("module {0!r} has no attribute {1!r}".format(module_name, name))
+    else:
+        namespace.pop(name, None)
+
+    if sys.version_info < (3, 7):  # pragma: no cover
+        # Module ``__getattr__`` (PEP 562) is not available
+        namespace[name] = _import_target(target) if value is _missing else value
+        return
+
+    if not reason and target is not None:
+        reason = "use {0}".format(target.replace(":", "."))
+    fmt = "Access to deprecated attribute {name} of module {module}."
+    if reason:
+        fmt += " ({reason})"
+    if version:
+        fmt += " -- Deprecated since version {version}."
+    msg = fmt.format(name=name, module=module_name, reason=reason, version=version)
+
+    hook, attributes = _registries.get(module_name, (None, None))
+    if hook is None or namespace.get("__getattr__") is not hook:
+        # first deprecated attribute, or ``__getattr__`` was redefined (for instance, if the module is reloaded)
+        attributes = {}
+        _registries[module_name] = (_install_hooks(module, attributes), attributes)
+    attributes[name] = _DeprecatedAttribute(module_name, name, value, target, msg, category, action)
+
+
+class _AliasAdapter(ClassicAdapter):
+    """
+    Adapter used by the deprecated aliases: the warning message refers to the alias
+    (instead of the wrapped function), and to its target if the *reason* is empty.
+
+    :param alias_name: Name of the alias.
+    :param target: Target of the alias, of the form "package.module:name".
+    :param module_name: Name of the module which defines the alias.
+    :param kwargs: Keyword arguments of :class:`~deprecated.classic.ClassicAdapter`.
+    """
+
+    def __init__(self, alias_name, target, module_name, **kwargs):
+        self.alias_name = alias_name
+        self.target = target
+        self.module_name = module_name
+        super(_AliasAdapter, self).__init__(**kwargs)
+
+    def get_deprecated_msg(self, wrapped, instance):
+        fmt = "Use of deprecated alias {name}. ({reason})"
+        if self.version:
+            fmt += " -- Deprecated since version {version}."
+        reason = self.reason or "use {0}".format(self.target.replace(":", "."))
+        return fmt.format(name=self.alias_name, reason=reason, version=self.version)
+
+
+_static_msg_getters.add(_AliasAdapter.__dict__['get_deprecated_msg'])
+
+#: Lock used to resolve the targets of the aliases.
+_alias_lock = threading.Lock()
+
+
+class _DeprecatedAlias(object):
+    # Proxy of a deprecated alias, which imports its target on first use (see :func:`alias`).
+    #
+    # Once the target is resolved, the calls and the attribute accesses are forwarded to
+    # a deprecated wrapper of a single forwarder function (see :func:`_make_forwarder`).
+    # The class has no docstring: ``__doc__`` is forwarded to the target (see below).
+
+    __slots__ = ("_alias_adapter", "_alias_forward")
+
+    def __init__(self, adapter):
+        self._alias_adapter = adapter
+        self._alias_forward = None
+
+    def _alias_resolve(self):
+        adapter = self._alias_adapter
+        with _alias_lock:
+            if self._alias_forward is None:
+                obj = _import_target(adapter.target)
+                forward = _make_forwarder(obj, adapter.alias_name, adapter.module_name)
+                self._alias_forward = adapter(forward) if is_enabled() else forward
+        return self._alias_forward
+
+    def __call__(self, *args, **kwargs):
+        forward = self._alias_forward
+        if forward is None:
+            forward = self._alias_resolve()
+        return forward(_call, *args, **kwargs)
+
+    def __getattr__(self, name):
+        forward = self._alias_forward
+        if forward is None:
+            if name.startswith("_"):
+                # private and special attributes looked up by introspection tools
+                # (like ``_partialmethod`` for :func:`inspect.signature`) don't import the target
+                raise AttributeError(name)
+            forward = self._alias_resolve()
+        return forward(name)
+
+    @property
+    def __doc__(self):
+        """
+        Docstring of the target, once it is resolved (``None`` before, to not import the target).
+        """
+        forward = self._alias_forward
+        return None if forward is None else forward("__doc__")
+
+    def __repr__(self):
+        return "<deprecated alias {0} of {1!r}>".format(self._alias_adapter.alias_name, self._alias_adapter.target)
+
+
+#: First argument of the forwarder of an alias, to call the target (see :func:`_make_forwarder`).
+_call = object()
+
+
+def _make_forwarder(obj, name, module_name):
+    """
+    Make the function which forwards the calls and the attribute accesses of an alias to its target:
+    ``forward(_call, *args, **kwargs)`` calls the target, and ``forward(attr)`` gets one of its attributes.
+
+    A single function is used, so that the calls and the attribute accesses share the same
+    deprecation wrapper (and the same warning state, for instance with *once*).
+    The function is named after the alias, so that it is counted in the usage statistics
+    under the name of the alias (see :mod:`deprecated.stats`).
+
+    :param obj: Target of the alias.
+    :param name: Name of the alias.
+    :param module_name: Name of the module which defines the alias.
+    :return: The forwarder function.
+    """
+
+    def forward(*args, **kwargs):
+        if args[0] is _call:
+            return obj(*args[1:], **kwargs)
+        return getattr(obj, args[0])
+
+    forward.__name__ = forward.__qualname__ = name
+    forward.__module__ = module_name
+    return forward
+
+
+def alias(name, target, reason="", version="", **kwargs):
+    """
+    Create a deprecated alias of a function or a class which was moved or renamed.
+
+    The target is imported when the alias is first called, instantiated, or when one of its attributes
+    is accessed, then it is cached: the next calls are forwarded to a deprecated wrapper of the target.
+    The deprecation warning is emitted by a :class:`~deprecated.classic.ClassicAdapter`,
+    so the warning filters, the *action* parameter and the usage statistics apply.
+
+    .. code-block:: python
+
+       from deprecated import alias
+
+       old_parse = alias("old_parse", target="my_package.parsing:parse", version="2.0")
+
+    .. note::
+
+       The alias is not a class: it can't be used with :func:`isinstance` or as a base class.
+       It must be defined at module level (it is not bound like a method).
+
+    :type  name: str
+    :param name:
+        Name of the alias (usually the name of the variable which stores the alias).
+
+    :type  target: str
+    :param target:
+        Target of the alias, of the form "package.module:name" (the name can be a dotted path).
+
+    :type  reason: str
+    :param reason:
+        Reason message which documents the deprecation in your library.
+        If empty, the warning message refers to the target.
+
+    :type  version: str
+    :param version:
+        Version of your project which deprecates this alias.
+
+    :param kwargs:
+        Other keyword arguments of :class:`~deprecated.classic.ClassicAdapter`,
+        for instance *category*, *action* or *once*.
+
+    :return: The proxy of the alias.
+    """
+    module_name = sys._getframe(1).f_globals.get("__name__")
+    kwargs["extra_stacklevel"] = kwargs.get("extra_stacklevel", 0) + 1  # frame of the proxy
+    adapter = _AliasAdapter(name, target, module_name, reason=reason, version=version, lightweight=True, **kwargs)
+    return _DeprecatedAlias(adapter)
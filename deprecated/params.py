@@ -20,59 +20,747 @@ The complete study concerning the implementation of this decorator is available
 on the `Deprecated Parameters`_ page.
 """
 import collections
-import functools
+import sys
+import threading
 import warnings
 
-try:
+from deprecated import stats
+from deprecated.classic import _DeprecatedWrapper
+from deprecated.classic import _is_ignored
+from deprecated.classic import _LocalFilter
+from deprecated.classic import _Throttle
+from deprecated.classic import _WarningState
+from deprecated.classic import _wrap_routine
+from deprecated.classic import string_types
+from deprecated.config import is_enabled
+
+if sys.version_info < (3,):
     # noinspection PyPackageRequirements
     import inspect2 as inspect
-except ImportError:
+else:
     import inspect
 
 
+#: Maximum number of call shapes (number of positional arguments and keyword names)
+#: cached by a :class:`_ParamsChecker`.
+_MAX_CALL_SHAPES = 256
+
+
+class _ParamsChecker(object):
+    """
+    Checker of the deprecated parameters, compiled from the function signature.
+
+    The positional indexes and the keyword names of the deprecated parameters are
+    computed once, so that checking a call doesn't require :meth:`inspect.Signature.bind`:
+    a call which doesn't use any deprecated parameter costs a comparison of the number of positional arguments
+    and a set intersection with the keyword arguments.
+    The other calls are checked once per call shape, and the result is cached.
+    """
+
+    def __init__(self, signature, names):
+        """
+        Compile the checker.
+
+        :type  signature: inspect.Signature
+        :param signature: Signature of the decorated function.
+
+        :type  names: collections.Iterable[str]
+        :param names: Names of the deprecated parameters.
+        """
+        names = set(names)
+        positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        keyword_kinds = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+        parameters = list(signature.parameters.values())
+        positional_count = sum(1 for p in parameters if p.kind in positional_kinds)
+        keyword_names = {p.name for p in parameters if p.kind in keyword_kinds}
+        has_var_keyword = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
+
+        # Deprecated parameters, in signature order: (name, kind, positional index)
+        self.params = [(p.name, p.kind, index) for index, p in enumerate(parameters) if p.name in names]
+        # Deprecated keyword arguments collected by ``**kwargs`` (positional-only or unknown names)
+        self.extra_names = (names - keyword_names) if has_var_keyword else set()
+        self.keyword_names = keyword_names
+        self.positional_count = positional_count
+
+        # Fast path: smallest number of positional arguments which can use a deprecated parameter,
+        # and names of the keyword arguments which are deprecated parameters.
+        self.min_args = positional_count + 1
+        for name, kind, index in self.params:
+            if kind in positional_kinds:
+                self.min_args = min(self.min_args, index + 1)
+            elif kind == inspect.Parameter.VAR_KEYWORD:
+                # any unknown keyword argument is deprecated: the fast path can't be used
+                self.min_args = 0
+        self.keywords = (names & keyword_names) | self.extra_names
+        self._cache = {}
+
+    def __call__(self, nargs, kwargs):
+        """
+        Check the arguments of a call.
+
+        :param nargs: Number of positional arguments of the call.
+        :param kwargs: Keyword arguments of the call.
+        :return: Tuple of the deprecated parameters used by the call, in signature order.
+        """
+        if nargs < self.min_args and (not kwargs or self.keywords.isdisjoint(kwargs)):
+            return ()
+        shape = (min(nargs, self.positional_count + 1), tuple(kwargs))
+        try:
+            return self._cache[shape]
+        except KeyError:
+            used = self._check_shape(*shape)
+            if len(self._cache) < _MAX_CALL_SHAPES:
+                self._cache[shape] = used
+            return used
+
+    def _check_shape(self, nargs, keys):
+        used = []
+        for name, kind, index in self.params:
+            if kind == inspect.Parameter.VAR_POSITIONAL:
+                found = nargs > self.positional_count
+            elif kind == inspect.Parameter.VAR_KEYWORD:
+                found = any(key not in self.keyword_names for key in keys)
+            elif kind == inspect.Parameter.KEYWORD_ONLY:
+                found = name in keys
+            else:
+                found = nargs > index or (name in keys and name in self.keyword_names)
+            if found:
+                used.append(name)
+        # keyword arguments collected by ``**kwargs``, in call order
+        used.extend(key for key in keys if key in self.extra_names and key not in used)
+        return tuple(used)
+
+
+class _ValuesChecker(object):
+    """
+    Checker of the deprecated parameter values, compiled from the function signature.
+
+    The position of each parameter is resolved once, so that checking a call costs
+    a set lookup per parameter (the unhashable values are never deprecated).
+    """
+
+    def __init__(self, signature, values):
+        """
+        Compile the checker.
+
+        :type  signature: inspect.Signature
+        :param signature: Signature of the decorated function.
+
+        :type  values: dict[str, frozenset]
+        :param values: Dictionary which maps the parameter names to their deprecated values.
+        """
+        positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        parameters = list(signature.parameters.values())
+        has_var_keyword = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
+
+        # Parameters which have deprecated values: (name, positional index or None, keyword?, values)
+        self.params = []
+        for index, p in enumerate(parameters):
+            if p.name in values and p.kind not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+                position = index if p.kind in positional_kinds else None
+                keyword = p.kind != inspect.Parameter.POSITIONAL_ONLY or has_var_keyword
+                self.params.append((p.name, position, keyword, values[p.name]))
+        if has_var_keyword:
+            # keyword arguments collected by ``**kwargs``
+            self.params.extend((name, None, True, values[name]) for name in values if name not in signature.parameters)
+
+    def __call__(self, args, shift, kwargs):
+        """
+        Check the argument values of a call.
+
+        :param args: Positional arguments of the call.
+        :param shift: 1 if the first parameter of the signature (instance or class) is bound, else 0.
+        :param kwargs: Keyword arguments of the call.
+        :return: List of the ``(name, value)`` tuples of the deprecated values used by the call, in signature order.
+        """
+        used = []
+        nargs = len(args) + shift
+        for name, position, keyword, values in self.params:
+            if position is not None and shift <= position < nargs:
+                value = args[position - shift]
+            elif keyword and name in kwargs:
+                value = kwargs[name]
+            else:
+                continue
+            try:
+                if value in values:
+                    used.append((name, value))
+            except TypeError:
+                # unhashable value
+                pass
+        return used
+
+
+class _PositionalChecker(object):
+    """
+    Checker of the parameters which should be passed as keyword arguments,
+    compiled from the function signature.
+
+    The smallest positional index of these parameters is computed once, so that checking
+    a call costs a comparison of the number of positional arguments with this threshold.
+    """
+
+    def __init__(self, signature, names):
+        """
+        Compile the checker.
+
+        :type  signature: inspect.Signature
+        :param signature: Signature of the decorated function.
+
+        :type  names: collections.Iterable[str]
+        :param names: Names of the parameters which should be passed as keyword arguments.
+
+        :raise TypeError: If a parameter is not a positional-or-keyword parameter of the signature.
+        """
+        for name in names:
+            param = signature.parameters.get(name)
+            if param is None or param.kind != inspect.Parameter.POSITIONAL_OR_KEYWORD:
+                fmt = "keyword_only: '{0}' is not a positional-or-keyword parameter of the signature {1}"
+                raise TypeError(fmt.format(name, signature))
+        names = set(names)
+        parameters = list(signature.parameters.values())
+        # Positional parameters which should be passed as keyword arguments: (positional index, name)
+        self.params = [(index, p.name) for index, p in enumerate(parameters) if p.name in names]
+        self.threshold = min(index for index, _ in self.params) if self.params else len(parameters)
+        self._cache = {}
+
+    def __call__(self, nargs):
+        """
+        Check the number of positional arguments of a call (beyond the threshold).
+
+        :param nargs: Number of positional arguments of the call.
+        :return: Tuple of the parameters passed positionally, in signature order.
+        """
+        try:
+            return self._cache[nargs]
+        except KeyError:
+            used = tuple(name for index, name in self.params if index < nargs)
+            if len(self._cache) < _MAX_CALL_SHAPES:
+                self._cache[nargs] = used
+            return used
+
+
+class _OmittedChecker(object):
+    """
+    Checker of the omitted parameters (which default value will change),
+    compiled from the function signature.
+
+    The positional index of each parameter is resolved once, so that checking a call
+    costs a comparison with the number of positional arguments and a lookup in the keyword arguments.
+    """
+
+    def __init__(self, signature, names):
+        """
+        Compile the checker.
+
+        :type  signature: inspect.Signature
+        :param signature: Signature of the decorated function.
+
+        :type  names: collections.Iterable[str]
+        :param names: Names of the parameters which default value will change.
+
+        :raise TypeError: If a parameter is not a parameter of the signature which has a default value.
+        """
+        for name in names:
+            param = signature.parameters.get(name)
+            if param is None or param.default is inspect.Parameter.empty:
+                fmt = "default_changes: '{0}' is not a parameter with a default value in the signature {1}"
+                raise TypeError(fmt.format(name, signature))
+        positional_kinds = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+        parameters = list(signature.parameters.values())
+        # Parameters which default value will change: (name, positional index or None)
+        self.params = [
+            (p.name, index if p.kind in positional_kinds else None)
+            for index, p in enumerate(parameters)
+            if p.name in names
+        ]
+
+    def __call__(self, nargs, kwargs):
+        """
+        Check the parameters omitted by a call.
+
+        :param nargs: Number of positional arguments of the call.
+        :param kwargs: Keyword arguments of the call.
+        :return: List of the omitted parameters, in signature order.
+        """
+        return [
+            name for name, position in self.params if (position is None or position >= nargs) and name not in kwargs
+        ]
+
+
+class _ParamsRenamer(object):
+    """
+    Forward the renamed keyword arguments to the new parameter names.
+
+    The old names used by a call are computed once per call shape (keyword names),
+    and the result is cached. The old names are reported once per call shape.
+    """
+
+    def __init__(self, renamed, func_name):
+        """
+        :type  renamed: dict[str, str]
+        :param renamed: Dictionary which maps the old parameter names to the new ones.
+
+        :param func_name: Name of the decorated function, used in the error messages.
+        """
+        self.renamed = dict(renamed)
+        self.names = frozenset(renamed)
+        self.func_name = func_name
+        self._cache = {}
+        self._reported = set()
+
+    def __call__(self, kwargs):
+        """
+        Rename the keyword arguments of a call.
+
+        :param kwargs: Keyword arguments of the call, which use at least one old name.
+        :return: The renamed keyword arguments, and the tuple of the old names used (in call order).
+        :raise TypeError: If both the old name and the new name of a parameter are used.
+        """
+        shape = tuple(kwargs)
+        try:
+            used = self._cache[shape]
+        except KeyError:
+            used = tuple(name for name in shape if name in self.names)
+            for name in used:
+                if self.renamed[name] in kwargs:
+                    fmt = "{func}() got values for both '{old}' and its new name '{new}'"
+                    raise TypeError(fmt.format(func=self.func_name, old=name, new=self.renamed[name]))
+            if len(self._cache) < _MAX_CALL_SHAPES:
+                self._cache[shape] = used
+        kwargs = dict(kwargs)
+        for name in used:
+            kwargs[self.renamed[name]] = kwargs.pop(name)
+        return kwargs, used
+
+    def claim(self, shape):
+        """
+        Claim the warning of the old names used by a call shape.
+
+        :param shape: Call shape: tuple of the keyword names of the call (before renaming).
+        :return: ``True`` if the old names of this call shape are not reported yet.
+        """
+        if shape in self._reported:
+            return False
+        if len(self._reported) < _MAX_CALL_SHAPES:
+            self._reported.add(shape)
+        return True
+
+
 class DeprecatedParams(object):
     """
     Decorator used to decorate a function which at least one
     of the parameters is deprecated.
     """
 
-    def __init__(self, param, reason="", category=DeprecationWarning):
+    def __init__(
+        self,
+        param=None,
+        reason="",
+        category=DeprecationWarning,
+        action=None,
+        version="",
+        extra_stacklevel=0,
+        once=False,
+        sample_rate=None,
+        max_per_interval=None,
+        interval=1.0,
+        renamed=None,
+        values=None,
+        keyword_only=None,
+        default_changes=None,
+    ):
+        """
+        Construct the decorator.
+
+        :type  param: str | dict[str, str]
+        :param param:
+            Name of the deprecated parameter, or dictionary which maps
+            the deprecated parameter names to their warning messages.
+            Can be omitted if *renamed* is given.
+
+        :type  reason: str
+        :param reason:
+            Warning message of the deprecated parameter (if *param* is a name).
+
+        :type  category: Type[Warning]
+        :param category:
+            The warning category to use for the deprecation warnings.
+
+        :type  action: Literal["default", "error", "ignore", "always", "module", "once"]
+        :param action:
+            A warning filter used to activate or not the deprecation warnings.
+            If ``None`` or empty, the global filtering mechanism is used.
+            The filter is applied locally: the global warning filters are not modified.
+
+        :type  version: str
+        :param version:
+            Version of your project which deprecates the parameters,
+            appended to the warning messages.
+
+        :type  extra_stacklevel: int
+        :param extra_stacklevel:
+            Number of additional stack levels to consider instrumentation rather than user code.
+            With the default value of 0, the warnings refer to where the function was called.
+
+        :type  once: bool
+        :param once:
+            If ``True``, the deprecation warning of each parameter is emitted only once per decorated function.
+
+        :type  sample_rate: float
+        :param sample_rate:
+            Probability (between 0 and 1) that a call is checked for deprecated parameters.
+            If ``None``, every call is checked.
+
+        :type  max_per_interval: int
+        :param max_per_interval:
+            Maximum number of calls emitting deprecation warnings per *interval* (token bucket).
+            If ``None``, the number of warnings is not limited.
+
+        :type  interval: float
+        :param interval:
+            Duration, in seconds, of the interval used by *max_per_interval*.
+
+        :type  renamed: dict[str, str]
+        :param renamed:
+            Dictionary which maps the old names of renamed parameters to their new names.
+            When a call uses an old name (as a keyword argument), the argument is passed to
+            the function using the new name, and a warning is emitted once per call shape
+            (keyword names of the call).
+
+        :type  values: dict[str, collections.Iterable | dict[Any, str]]
+        :param values:
+            Dictionary which maps parameter names to their deprecated values: a collection of
+            (hashable) values, or a dictionary which maps each deprecated value to its warning message.
+            A warning is emitted only when one of these values is passed.
+
+        :type  keyword_only: str | collections.Iterable[str]
+        :param keyword_only:
+            Name (or names) of the parameters which will become keyword-only:
+            a warning is emitted when they are passed as positional arguments.
+            A :exc:`TypeError` is raised when the signature is analysed if one of them
+            is not a positional-or-keyword parameter of the decorated function.
+
+        :type  default_changes: str | collections.Iterable[str] | dict[str, str]
+        :param default_changes:
+            Name (or names) of the parameters which default value will change, or dictionary
+            which maps these names to their warning messages: a warning is emitted when
+            the caller relies on the default value (the parameter is omitted).
+            A :exc:`TypeError` is raised when the signature is analysed if one of them
+            is not a parameter of the decorated function which has a default value.
+
+        .. versionchanged:: 1.4.0
+            Add the *sample_rate*, *max_per_interval* and *interval* parameters.
+
+        .. versionchanged:: 1.4.0
+            Add the *renamed*, *values*, *keyword_only* and *default_changes* parameters, *param* is optional.
+
+        .. versionchanged:: 1.4.0
+            Add the *action*, *version*, *extra_stacklevel* and *once* parameters.
+
+        .. versionchanged:: 1.4.0
+            The signature of the decorated function is analysed on first call,
+            instead of when the decorator is applied.
+
+        .. versionchanged:: 1.4.0
+            The use of the deprecated parameters is counted in the usage statistics
+            (see :mod:`deprecated.stats`).
+        """
         self.messages = {}  # type: dict[str, str]
         self.category = category
-        self.populate_messages(param, reason=reason)
+        self.action = action
+        self.version = version or ""
+        self.extra_stacklevel = extra_stacklevel
+        self.once = once
+        self.sample_rate = sample_rate
+        self.max_per_interval = max_per_interval
+        self.interval = interval
+        self.renamed = dict(renamed or {})  # type: dict[str, str]
+        self.values = {}  # type: dict[str, frozenset]
+        self.value_messages = {}  # type: dict[tuple[str, Any], str]
+        self.positional_messages = {}  # type: dict[str, str]
+        self.default_messages = {}  # type: dict[str, str]
+        if param is not None:
+            self.populate_messages(param, reason=reason)
+        elif not (self.renamed or values or keyword_only or default_changes):
+            raise TypeError(
+                "deprecated_params() requires a 'param', 'renamed', 'values', 'keyword_only' "
+                "or 'default_changes' argument"
+            )
+        fmt = "'{old}' parameter is deprecated, use '{new}' instead"
+        self.populate_messages(
+            {old: fmt.format(old=old, new=new) for old, new in self.renamed.items() if old not in self.messages}
+        )
+        if values:
+            self.populate_values(values)
+        suffix = " -- Deprecated since version {version}.".format(version=self.version) if self.version else ""
+        if keyword_only:
+            names = [keyword_only] if isinstance(keyword_only, string_types) else keyword_only
+            fmt = "Passing '{param}' as a positional argument is deprecated, use a keyword argument"
+            self.positional_messages.update((name, fmt.format(param=name) + suffix) for name in names)
+        if default_changes:
+            if isinstance(default_changes, string_types):
+                default_changes = {default_changes: ""}
+            elif not isinstance(default_changes, dict):
+                default_changes = dict.fromkeys(default_changes, "")
+            fmt = "The default value of the '{param}' parameter will change, pass it explicitly"
+            self.default_messages.update(
+                (name, (reason or fmt.format(param=name)) + suffix) for name, reason in default_changes.items()
+            )
 
     def populate_messages(self, param, reason=""):
         if isinstance(param, dict):
-            self.messages.update(param)
+            messages = dict(param)
         elif isinstance(param, str):
             fmt = "'{param}' parameter is deprecated"
-            reason = reason or fmt.format(param=param)
-            self.messages[param] = reason
+            messages = {param: reason or fmt.format(param=param)}
         else:
             raise TypeError(param)
+        if self.version:
+            fmt = "{message} -- Deprecated since version {version}."
+            messages = {name: fmt.format(message=message, version=self.version) for name, message in messages.items()}
+        self.messages.update(messages)
+
+    def populate_values(self, values):
+        """
+        Register the deprecated parameter values and their warning messages.
+
+        :type  values: dict[str, collections.Iterable | dict[Any, str]]
+        :param values: Dictionary which maps parameter names to their deprecated values.
+
+        .. versionadded:: 1.4.0
+        """
+        fmt = "'{param}' parameter value {value!r} is deprecated"
+        for param, param_values in values.items():
+            if isinstance(param_values, string_types):
+                raise TypeError("deprecated values of '{0}' must be a collection: {1!r}".format(param, param_values))
+            if isinstance(param_values, dict):
+                messages = {
+                    value: reason or fmt.format(param=param, value=value) for value, reason in param_values.items()
+                }
+            else:
+                messages = {value: fmt.format(param=param, value=value) for value in param_values}
+            if self.version:
+                suffix = " -- Deprecated since version {version}.".format(version=self.version)
+                messages = {value: message + suffix for value, message in messages.items()}
+            self.values[param] = self.values.get(param, frozenset()) | frozenset(messages)
+            self.value_messages.update(((param, value), message) for value, message in messages.items())
 
     def check_params(self, signature, *args, **kwargs):
+        """
+        Check the parameters used by a call, using :meth:`inspect.Signature.bind`.
+
+        The decorated function uses a checker compiled at decoration time instead,
+        unless this method is overridden.
+
+        :param signature: Signature of the decorated function.
+        :param args: Positional arguments of the call (including the bound instance or class, if any).
+        :param kwargs: Keyword arguments of the call.
+        :return: List of the deprecated parameters used by the call, in signature order.
+        """
         binding = signature.bind(*args, **kwargs)
         bound = collections.OrderedDict(binding.arguments, **binding.kwargs)
         return [param for param in bound if param in self.messages]
 
-    def warn_messages(self, messages):
-        # type: (list[str]) -> None
+    def compile_checker(self, signature):
+        """
+        Compile the checker of the deprecated parameters.
+
+        :param signature: Signature of the decorated function.
+        :return: A callable which takes the number of positional arguments of a call
+            (including the bound instance or class, if any) and its keyword arguments,
+            and returns the deprecated parameters used, or ``None`` if the :meth:`check_params`
+            method is overridden, in which case it is called for each call.
+
+        .. versionadded:: 1.4.0
+        """
+        method = type(self).check_params
+        if getattr(method, '__func__', method) is not DeprecatedParams.__dict__['check_params']:
+            return None
+        return _ParamsChecker(signature, self.messages)
+
+    def warn_messages(self, messages, stacklevel=3, local_filter=None):
+        """
+        Emit the deprecation warnings.
+
+        :type  messages: list[str]
+        :param messages: Warning messages.
+
+        :param stacklevel: Same meaning as in :func:`warnings.warn`, relative to this method.
+
+        :param local_filter: Filter used to apply the *action* locally, or ``None`` to use the global filters.
+
+        .. versionchanged:: 1.4.0
+            Add the *stacklevel* and *local_filter* parameters.
+        """
         for message in messages:
-            warnings.warn(message, category=self.category, stacklevel=3)
+            if local_filter is None:
+                warnings.warn(message, category=self.category, stacklevel=stacklevel)
+            else:
+                local_filter.warn(message, stacklevel=stacklevel)
 
     def __call__(self, f):
-        # type: (callable) -> callable
-        signature = inspect.signature(f)
+        """
+        Decorate your function, method or class.
+
+        For a class, the ``__init__`` method is decorated, or the ``__new__`` method if the class
+        doesn't define ``__init__``.
+
+        :param f: Function, method (possibly a :class:`classmethod` or :class:`staticmethod` object), or class.
+
+        :return: the decorated function or class.
+
+        .. versionchanged:: 1.4.0
+            The decorator supports the methods and the classes.
+            If the decorators are disabled (see :mod:`deprecated.config`), *f* is returned unchanged
+            (unless parameters are renamed: the arguments are still forwarded, without warnings).
+        """
+        if not is_enabled() and not self.renamed:
+            return f
+        if inspect.isclass(f):
+            # the raw attributes are used, so that the checks of stacked decorators are merged
+            if f.__init__ is object.__init__ and f.__new__ is not object.__new__:
+                new = vars(f).get('__new__', f.__new__)
+                f.__new__ = staticmethod(self._decorate(getattr(new, '__func__', new), f))
+            else:
+                init = vars(f).get('__init__', f.__init__)
+                f.__init__ = self._decorate(getattr(init, '__func__', init), f)
+            return f
+        return self._decorate(f, f)
+
+    def _analyze(self, function):
+        # Analyse the signature of the decorated function, and compile the checkers
+        signature = inspect.signature(function)
+        return (
+            signature,
+            self.compile_checker(signature),
+            _ValuesChecker(signature, self.values) if self.values else None,
+            _PositionalChecker(signature, self.positional_messages) if self.positional_messages else None,
+            _OmittedChecker(signature, self.default_messages) if self.default_messages else None,
+        )
+
+    def _decorate(self, f, symbol):
+        # *symbol* is the class or the function which name is used in the usage statistics
+        local_filter = _LocalFilter(self.action, self.category) if self.action else None
+        # when the decorators are disabled, only the renamed parameters are forwarded
+        enabled = is_enabled()
+        skip_checks = self.action == "ignore" or not enabled
+        if self.sample_rate is None and self.max_per_interval is None:
+            throttle = None
+        else:
+            throttle = _Throttle(self.sample_rate, self.max_per_interval, self.interval)
+        # warning messages of the deprecated parameters (names), values (name and value tuples),
+        # positional parameters and omitted parameters (name and marker tuples)
+        messages = dict(self.messages)
+        messages.update(self.value_messages)
+        messages.update(((name, _positional), message) for name, message in self.positional_messages.items())
+        messages.update(((name, _default), message) for name, message in self.default_messages.items())
+        if self.once:
+            # one state per warning, and a global state to skip the checks when all the warnings are emitted
+            param_states = {key: _WarningState(1) for key in messages}
+            state = _WarningState(len(param_states))
+        else:
+            param_states = state = None
+
+        symbol_name = stats.get_symbol_name(symbol)
+        counters = {
+            param: stats.register("{name}({param})".format(name=symbol_name, param=param)) for param in self.messages
+        }
+        fmt = "{name}({param}={value!r})"
+        counters.update(
+            ((param, value), stats.register(fmt.format(name=symbol_name, param=param, value=value)))
+            for param, value in self.value_messages
+        )
+        fmt = "{name}({param}, positional)"
+        counters.update(
+            ((param, _positional), stats.register(fmt.format(name=symbol_name, param=param)))
+            for param in self.positional_messages
+        )
+        fmt = "{name}({param}, default)"
+        counters.update(
+            ((param, _default), stats.register(fmt.format(name=symbol_name, param=param)))
+            for param in self.default_messages
+        )
+
+        # The signature is analysed on first check:
+        # (signature, checker, values checker, positional checker, omitted checker)
+        analysis = []
+        lock = threading.Lock()
+        # function to analyse: the wrapped function of the stacked decorators, of the classmethod or staticmethod
+        function = f.__wrapped__ if type(f) is _DeprecatedWrapper else f
+        function = getattr(function, '__func__', function)
+        renamer = _ParamsRenamer(self.renamed, function.__name__) if self.renamed else None
+
+        def analyze():
+            if not analysis:
+                with lock:
+                    if not analysis:
+                        analysis.append(self._analyze(function))
+            return analysis[0]
+
+        def check(wrapped_, instance_, args_, kwargs_, stacklevel):
+            if renamer is not None and kwargs_ and not renamer.names.isdisjoint(kwargs_):
+                renamed_shape = tuple(kwargs_)
+                kwargs_, renamed_params = renamer(kwargs_)
+            else:
+                renamed_params = ()
+            collecting = enabled and stats._collecting
+            emitting = not (
+                skip_checks
+                or (state is not None and state.done)
+                or (local_filter is None and _is_ignored(self.category, stacklevel + self.extra_stacklevel))
+                or (throttle is not None and not throttle.sample())
+            )
+            if emitting or collecting:
+                signature, checker, values_checker, positional_checker, omitted_checker = (
+                    analysis[0] if analysis else analyze()
+                )
+                # the bound instance or class is the first parameter of the signature
+                shift = 0 if instance_ is None else 1
+                nargs = len(args_) + shift
+                if checker is not None:
+                    invalid_params = checker(nargs, kwargs_)
+                elif instance_ is None:
+                    invalid_params = self.check_params(signature, *args_, **kwargs_)
+                else:
+                    invalid_params = self.check_params(signature, instance_, *args_, **kwargs_)
+                if renamed_params:
+                    invalid_params = renamed_params + tuple(invalid_params)
+                if values_checker is not None:
+                    invalid_values = values_checker(args_, shift, kwargs_)
+                    if invalid_values:
+                        invalid_params = tuple(invalid_params) + tuple(invalid_values)
+                if positional_checker is not None and nargs > positional_checker.threshold:
+                    invalid_params = tuple(invalid_params) + tuple(
+                        (name, _positional) for name in positional_checker(nargs)
+                    )
+                if omitted_checker is not None:
+                    omitted_params = omitted_checker(nargs, kwargs_)
+                    if omitted_params:
+                        invalid_params = tuple(invalid_params) + tuple((name, _default) for name in omitted_params)
+                if collecting:
+                    for param in invalid_params:
+                        counters[param].count += 1
+                if emitting and renamed_params and not renamer.claim(renamed_shape):
+                    # the old names are reported once per call shape
+                    invalid_params = invalid_params[len(renamed_params) :]
+                if emitting and invalid_params and (throttle is None or throttle.acquire()):
+                    if param_states is not None:
+                        invalid_params = [param for param in invalid_params if param_states[param].claim()]
+                        for _ in invalid_params:
+                            state.claim()
+                    stacklevel += 1 + self.extra_stacklevel
+                    self.warn_messages([messages[key] for key in invalid_params], stacklevel, local_filter)
+            return kwargs_
+
+        return _wrap_routine(f, check)
 
-        @functools.wraps(f)
-        def wrapper(*args, **kwargs):
-            invalid_params = self.check_params(signature, *args, **kwargs)
-            self.warn_messages([self.messages[param] for param in invalid_params])
-            return f(*args, **kwargs)
 
-        return wrapper
+#: Marker of the warnings about the parameters passed positionally.
+_positional = object()
 
+#: Marker of the warnings about the omitted parameters (which default value will change).
+_default = object()
 
 #: Decorator used to decorate a function which at least one
 #: of the parameters is deprecated.
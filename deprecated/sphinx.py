@@ -23,9 +23,17 @@ import re
 import textwrap
 
 from deprecated.classic import ClassicAdapter
+from deprecated.classic import _static_msg_getters
 from deprecated.classic import deprecated as _classic_deprecated
 
 
+def _strip_roles(msg):
+    # Strip Sphinx cross-reference syntax (like ":function:", ":py:func:" and ":py:meth:")
+    # Possible values are ":role:`foo`", ":domain:role:`foo`"
+    # where ``role`` and ``domain`` should match "[a-zA-Z]+"
+    return re.sub(r"(?: : [a-zA-Z]+ )? : [a-zA-Z]+ : (`[^`]*`)", r"\1", msg, flags=re.X)
+
+
 class SphinxAdapter(ClassicAdapter):
     """
     Sphinx adapter -- *for advanced usage only*
@@ -48,6 +56,13 @@ class SphinxAdapter(ClassicAdapter):
         category=DeprecationWarning,
         extra_stacklevel=0,
         line_length=70,
+        once=False,
+        unwrap_after=None,
+        sample_rate=None,
+        max_per_interval=None,
+        interval=1.0,
+        lightweight=False,
+        class_mode="instance",
     ):
         """
         Construct a wrapper adapter.
@@ -71,6 +86,7 @@ class SphinxAdapter(ClassicAdapter):
             A warning filter used to activate or not the deprecation warning.
             Can be one of "error", "ignore", "always", "default", "module", or "once".
             If ``None`` or empty, the global filtering mechanism is used.
+            The filter is applied locally: the global warning filters are not modified.
             See: `The Warnings Filter`_ in the Python documentation.
 
         :type  category: Type[Warning]
@@ -89,8 +105,46 @@ class SphinxAdapter(ClassicAdapter):
         :param line_length:
             Max line length of the directive text. If non nul, a long text is wrapped in several lines.
 
+        :type  once: bool
+        :param once:
+            If ``True``, the deprecation warning is emitted only once per decorated class or function.
+
+        :type  unwrap_after: int
+        :param unwrap_after:
+            If set, the decorated function stops emitting warnings after *unwrap_after* warnings,
+            and the wrapper is replaced by the original function where it was defined.
+            It cannot be combined with *once*.
+
+        :type  sample_rate: float
+        :param sample_rate:
+            Probability (between 0 and 1) that a call emits the deprecation warning.
+
+        :type  max_per_interval: int
+        :param max_per_interval:
+            Maximum number of deprecation warnings emitted per *interval* (token bucket).
+
+        :type  interval: float
+        :param interval:
+            Duration, in seconds, of the interval used by *max_per_interval*.
+
+        :type  lightweight: bool
+        :param lightweight:
+            If ``True``, the functions which are not defined in a class body are wrapped by a closure
+            instead of a *wrapt* function wrapper.
+
+        :type  class_mode: Literal["instance", "exact", "subclass"]
+        :param class_mode:
+            If "exact", only the instantiations of the deprecated class itself emit the warning
+            (not the instantiations of its subclasses).
+            If "subclass", the warning is emitted when a subclass is defined, instead of when
+            the class is instantiated.
+
         .. versionchanged:: 1.2.15
             Add the *extra_stacklevel* parameter.
+
+        .. versionchanged:: 1.4.0
+            Add the *once*, *unwrap_after*, *sample_rate*, *max_per_interval*, *interval*,
+            *lightweight* and *class_mode* parameters.
         """
         if not version:
             # https://github.com/laurent-laporte-pro/deprecated/issues/40
@@ -98,7 +152,18 @@ class SphinxAdapter(ClassicAdapter):
         self.directive = directive
         self.line_length = line_length
         super(SphinxAdapter, self).__init__(
-            reason=reason, version=version, action=action, category=category, extra_stacklevel=extra_stacklevel
+            reason=reason,
+            version=version,
+            action=action,
+            category=category,
+            extra_stacklevel=extra_stacklevel,
+            once=once,
+            unwrap_after=unwrap_after,
+            sample_rate=sample_rate,
+            max_per_interval=max_per_interval,
+            interval=interval,
+            lightweight=lightweight,
+            class_mode=class_mode,
         )
 
     def __call__(self, wrapped):
@@ -163,11 +228,28 @@ class SphinxAdapter(ClassicAdapter):
 
         """
         msg = super(SphinxAdapter, self).get_deprecated_msg(wrapped, instance)
-        # Strip Sphinx cross-reference syntax (like ":function:", ":py:func:" and ":py:meth:")
-        # Possible values are ":role:`foo`", ":domain:role:`foo`"
-        # where ``role`` and ``domain`` should match "[a-zA-Z]+"
-        msg = re.sub(r"(?: : [a-zA-Z]+ )? : [a-zA-Z]+ : (`[^`]*`)", r"\1", msg, flags=re.X)
-        return msg
+        return _strip_roles(msg)
+
+    def get_deprecated_attr_msg(self, wrapped, name, operation):
+        """
+        Get the deprecation warning message of a deprecated property (or descriptor),
+        without Sphinx cross-referencing syntax, for the user.
+
+        :param wrapped: Wrapped descriptor.
+
+        :param name: Name of the attribute.
+
+        :param operation: The access to the attribute: "get", "set" or "delete".
+
+        :return: The warning message.
+
+        .. versionadded:: 1.4.0
+        """
+        msg = super(SphinxAdapter, self).get_deprecated_attr_msg(wrapped, name, operation)
+        return _strip_roles(msg)
+
+
+_static_msg_getters.add(SphinxAdapter.__dict__['get_deprecated_msg'])
 
 
 def versionadded(reason="", version="", line_length=70):
@@ -264,6 +346,27 @@ def deprecated(reason="", version="", line_length=70, **kwargs):
         With the default value of 0, the warning refers to where the class was instantiated
         or the function was called.
 
+    -   "once":
+        If ``True``, the deprecation warning is emitted only once per decorated class or function.
+
+    -   "unwrap_after":
+        If set, the decorated function stops emitting warnings after *unwrap_after* warnings,
+        and the wrapper is replaced by the original function where it was defined.
+
+    -   "sample_rate", "max_per_interval" and "interval":
+        Limit the number of emitted deprecation warnings, using random sampling (*sample_rate*
+        is the probability that a call emits the warning), and/or a token bucket (at most
+        *max_per_interval* warnings per *interval* seconds).
+
+    -   "lightweight":
+        If ``True``, the functions which are not defined in a class body are wrapped by a closure
+        instead of a *wrapt* function wrapper, which is cheaper to call.
+
+    -   "class_mode":
+        If "exact", only the instantiations of the deprecated class itself emit the warning
+        (the subclasses are instantiated using the original ``__new__`` method).
+        If "subclass", the warning is emitted when a subclass is defined, instead of when
+        the class is instantiated.
 
     :return: a decorator used to deprecate a function.
 
@@ -272,6 +375,10 @@ def deprecated(reason="", version="", line_length=70, **kwargs):
 
     .. versionchanged:: 1.2.15
         Add the *extra_stacklevel* parameter.
+
+    .. versionchanged:: 1.4.0
+        Add the *once*, *unwrap_after*, *sample_rate*, *max_per_interval*, *interval*,
+        *lightweight* and *class_mode* parameters.
     """
     directive = kwargs.pop('directive', 'deprecated')
     adapter_cls = kwargs.pop('adapter_cls', SphinxAdapter)
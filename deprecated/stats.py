@@ -0,0 +1,143 @@
+# coding: utf-8
+"""
+Usage statistics
+================
+
+This module counts the calls to the deprecated functions, methods and classes,
+and the use of the deprecated parameters, in order to know which deprecated APIs
+are really used, for instance in production, without emitting the warnings.
+
+The counting is independent of the warnings: the calls are counted even if the warnings
+are ignored, sampled or already emitted (see the *once* parameter).
+
+The collection is disabled by default. It can be enabled with :func:`enable`,
+or by setting the ``DEPRECATED_STATS`` environment variable to "1", "true", "yes" or "on"
+(the case is ignored).
+
+.. code-block:: python
+
+   import deprecated.stats
+
+   deprecated.stats.enable()
+
+   ...  # run your application
+
+   for name, count in sorted(deprecated.stats.snapshot().items()):
+       print(name, count)
+
+.. note::
+
+   The calls of a deprecated function are counted by its wrapper: once the wrapper is removed
+   (see the *unwrap_after* parameter), or if the decorators are disabled (see :mod:`deprecated.config`),
+   the calls are no longer counted.
+
+.. versionadded:: 1.4.0
+"""
+import os
+import threading
+
+#: Name of the environment variable used to enable the collection at startup.
+STATS_ENV_VAR = "DEPRECATED_STATS"
+
+
+def _read_stats_env():
+    value = os.environ.get(STATS_ENV_VAR, "")
+    return value.strip().lower() in {"1", "true", "yes", "on"}
+
+
+_collecting = _read_stats_env()
+_counters = {}  # type: dict[str, Counter]
+_lock = threading.Lock()
+
+
+class Counter(object):
+    """
+    Call counter of a deprecated symbol.
+
+    The counter is incremented by the wrappers, without lock, so that the counting is cheap:
+    in multithreaded programs, some calls may not be counted.
+    """
+
+    __slots__ = ("name", "count")
+
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+
+    def __repr__(self):
+        return "<Counter {name!r}: {count}>".format(name=self.name, count=self.count)
+
+
+def get_symbol_name(obj):
+    """
+    Get the name used to identify a deprecated function or class in the statistics.
+
+    :param obj: Deprecated function, class or property.
+
+    :return: The qualified name of the object, for instance "package.module.Class.method".
+    """
+    obj = getattr(obj, "__func__", obj)  # classmethod or staticmethod object
+    obj = getattr(obj, "fget", None) or getattr(obj, "func", None) or obj  # property or cached_property
+    module = getattr(obj, "__module__", None)
+    name = getattr(obj, "__qualname__", None) or getattr(obj, "__name__", repr(obj))
+    return "{module}.{name}".format(module=module, name=name) if module else name
+
+
+def register(name):
+    """
+    Register a deprecated symbol (done by the decorators).
+
+    :param name: Name of the symbol, for instance "package.module.function".
+
+    :return: The :class:`Counter` of the symbol. The counter is shared by
+        all the symbols with the same name.
+    """
+    with _lock:
+        try:
+            return _counters[name]
+        except KeyError:
+            counter = _counters[name] = Counter(name)
+            return counter
+
+
+def enable():
+    """
+    Enable the collection of the statistics.
+    """
+    global _collecting
+    _collecting = True
+
+
+def disable():
+    """
+    Disable the collection of the statistics (the counters are kept).
+    """
+    global _collecting
+    _collecting = False
+
+
+def is_enabled():
+    """
+    Check whether the collection of the statistics is enabled.
+    """
+    return _collecting
+
+
+def snapshot():
+    """
+    Get the statistics.
+
+    :return: A dictionary which maps the name of each deprecated symbol to its number of calls.
+        The symbols which are never called are included (with a count of 0).
+    """
+    with _lock:
+        return {name: counter.count for name, counter in _counters.items()}
+
+
+def reset():
+    """
+    Reset all the counters to 0.
+    """
+    with _lock:
+        for counter in _counters.values():
+            counter.count = 0
@@ -0,0 +1,720 @@
+# -*- coding: utf-8 -*-
+import inspect
+import threading
+import warnings
+
+import pytest
+
+import deprecated.params
+from deprecated.params import DeprecatedParams
+
+
+class CountingDeprecatedParams(DeprecatedParams):
+    def __init__(self, *args, **kwargs):
+        super(CountingDeprecatedParams, self).__init__(*args, **kwargs)
+        self.checks = 0
+
+    def check_params(self, signature, *args, **kwargs):
+        self.checks += 1
+        return super(CountingDeprecatedParams, self).check_params(signature, *args, **kwargs)
+
+
+def test_ignored_params_are_not_checked():
+    decorator = CountingDeprecatedParams("z")
+
+    @decorator
+    def foo(x, z=None):
+        return x
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        assert foo(1, z=2) == 1
+    assert warns == []
+    assert decorator.checks == 0
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo(1, z=2) == 1
+    assert [str(warn.message) for warn in warns] == ["'z' parameter is deprecated"]
+    assert decorator.checks == 1
+
+
+def test_sample_rate_skips_checks():
+    decorator = CountingDeprecatedParams("z", sample_rate=0)
+
+    @decorator
+    def foo(x, z=None):
+        return x
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo(1, z=2) == 1
+    assert warns == []
+    assert decorator.checks == 0
+
+
+def test_max_per_interval_counts_warning_calls():
+    @DeprecatedParams({"y": "y is deprecated", "z": "z is deprecated"}, max_per_interval=2, interval=3600)
+    def foo(x, y=None, z=None):
+        return x
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        for _ in range(5):
+            foo(1)
+        for _ in range(5):
+            foo(1, y=2, z=3)
+    # calls without deprecated parameters don't consume the tokens
+    assert [str(warn.message) for warn in warns] == ["y is deprecated", "z is deprecated"] * 2
+
+
+def _reference_check(decorator, func, *args, **kwargs):
+    return DeprecatedParams.check_params(decorator, inspect.signature(func), *args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [
+        ((), {"a": 1}),
+        ((1,), {}),
+        ((1, 2), {}),
+        ((1, 2, 3), {}),
+        ((1, 2, 3, 4, 5), {}),
+        ((1,), {"b": 2}),
+        ((1,), {"c": 3, "b": 2}),
+        ((1, 2), {"d": 4}),
+        ((1, 2), {"e": 5, "f": 6}),
+        ((1, 2, 3, 4), {"d": 4, "f": 6, "e": 5}),
+    ],
+)
+def test_compiled_checker_matches_bind(args, kwargs):
+    decorator = DeprecatedParams({name: name for name in ["a", "b", "c", "d", "e", "args", "kwargs"]})
+
+    def foo(a, b=None, c=None, *args, **kwargs):
+        pass
+
+    checker = decorator.compile_checker(inspect.signature(foo))
+    expected = _reference_check(decorator, foo, *args, **kwargs)
+    assert list(checker(len(args), kwargs)) == expected
+    # the second call uses the cached call shape
+    assert list(checker(len(args), kwargs)) == expected
+
+
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [
+        ((1,), {}),
+        ((1, 2), {}),
+        ((1, 2), {"c": 3}),
+        ((1,), {"b": 2, "c": 3}),
+        ((1, 2, 3), {}),
+    ],
+)
+def test_compiled_checker_keyword_only(args, kwargs):
+    decorator = DeprecatedParams({"b": "b", "c": "c"})
+
+    def foo(a, b=None, *, c=None):
+        pass
+
+    checker = decorator.compile_checker(inspect.signature(foo))
+    if len(args) > 2:
+        with pytest.raises(TypeError):
+            _reference_check(decorator, foo, *args, **kwargs)
+    else:
+        assert list(checker(len(args), kwargs)) == _reference_check(decorator, foo, *args, **kwargs)
+
+
+def test_compiled_checker_fast_path():
+    decorator = DeprecatedParams("z")
+
+    def foo(x, y=None, z=None):
+        pass
+
+    checker = decorator.compile_checker(inspect.signature(foo))
+    assert checker(1, {"y": 2}) == ()
+    assert checker(2, {}) == ()
+    assert checker._cache == {}
+    assert checker(3, {}) == ("z",)
+    assert checker(1, {"z": 3}) == ("z",)
+    assert len(checker._cache) == 2
+
+
+def test_overridden_check_params_is_used():
+    decorator = CountingDeprecatedParams("z")
+
+    def foo(x, z=None):
+        return x
+
+    assert decorator.compile_checker(inspect.signature(foo)) is None
+
+
+@pytest.fixture(name="signature_calls")
+def fixture_signature_calls(monkeypatch):
+    calls = []
+    signature = deprecated.params.inspect.signature
+
+    def counting_signature(func):
+        calls.append(func)
+        return signature(func)
+
+    monkeypatch.setattr(deprecated.params.inspect, "signature", counting_signature)
+    return calls
+
+
+def test_signature_is_analysed_on_first_call(signature_calls):
+    @DeprecatedParams("z")
+    def foo(x, z=None):
+        return x
+
+    assert signature_calls == []
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo(1) == 1
+        assert foo(1, z=2) == 1
+        assert foo(1, 2) == 1
+    assert [str(warn.message) for warn in warns] == ["'z' parameter is deprecated"] * 2
+    assert len(signature_calls) == 1
+
+
+def test_signature_is_not_analysed_when_ignored(signature_calls):
+    @DeprecatedParams("z")
+    def foo(x, z=None):
+        return x
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert foo(1, z=2) == 1
+    assert signature_calls == []
+
+
+def test_signature_analysis_is_thread_safe(signature_calls):
+    @DeprecatedParams("z")
+    def foo(x, z=None):
+        return x
+
+    barrier = threading.Barrier(8)
+
+    def run():
+        barrier.wait()
+        foo(1, z=2)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        warnings.showwarning = lambda *args, **kwargs: None
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(signature_calls) == 1
+
+
+class Shape(object):
+    @DeprecatedParams("color")
+    def draw(self, x, color=None):
+        return x
+
+    @classmethod
+    @DeprecatedParams("color")
+    def create(cls, x, color=None):
+        return x
+
+    @staticmethod
+    @DeprecatedParams("color")
+    def compute(x, color=None):
+        return x
+
+    @DeprecatedParams("color")
+    @classmethod
+    def build(cls, x, color=None):
+        return x
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: Shape().draw(1, "red"),
+        lambda: Shape().draw(1, color="red"),
+        lambda: Shape.draw(Shape(), 1, "red"),
+        lambda: Shape.create(1, "red"),
+        lambda: Shape().create(1, color="red"),
+        lambda: Shape.compute(1, "red"),
+        lambda: Shape.build(1, "red"),
+    ],
+)
+def test_deprecated_params_methods(call):
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert call() == 1
+    assert [str(warn.message) for warn in warns] == ["'color' parameter is deprecated"]
+    assert warns[0].filename == __file__
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        lambda: Shape().draw(1),
+        lambda: Shape.create(1),
+        lambda: Shape.compute(1),
+        lambda: Shape.build(1),
+    ],
+)
+def test_deprecated_params_methods_not_used(call):
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert call() == 1
+    assert warns == []
+
+
+def test_deprecated_params_class_init():
+    @DeprecatedParams("color")
+    class Circle(object):
+        def __init__(self, radius, color=None):
+            self.radius = radius
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Circle(1).radius == 1
+        assert Circle(2, "red").radius == 2
+    assert [str(warn.message) for warn in warns] == ["'color' parameter is deprecated"]
+    assert warns[0].filename == __file__
+
+
+def test_deprecated_params_class_new():
+    @DeprecatedParams("color")
+    class Point(tuple):
+        def __new__(cls, x, y, color=None):
+            return super(Point, cls).__new__(cls, (x, y))
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Point(1, 2) == (1, 2)
+        assert Point(1, 2, color="red") == (1, 2)
+    assert [str(warn.message) for warn in warns] == ["'color' parameter is deprecated"]
+    assert warns[0].filename == __file__
+
+
+def test_deprecated_params_version():
+    @DeprecatedParams({"y": "use z", "z": "z is deprecated"}, version="1.2.3")
+    def foo(x, y=None, z=None):
+        return x
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        foo(1, 2, 3)
+    assert [str(warn.message) for warn in warns] == [
+        "use z -- Deprecated since version 1.2.3.",
+        "z is deprecated -- Deprecated since version 1.2.3.",
+    ]
+
+
+def test_deprecated_params_action_error():
+    @DeprecatedParams("z", action="error")
+    def foo(x, z=None):
+        return x
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert foo(1) == 1
+        with pytest.raises(DeprecationWarning, match="'z' parameter is deprecated"):
+            foo(1, z=2)
+
+
+def test_deprecated_params_action_ignore():
+    decorator = CountingDeprecatedParams("z", action="ignore")
+
+    @decorator
+    def foo(x, z=None):
+        return x
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo(1, z=2) == 1
+    assert warns == []
+    assert decorator.checks == 0
+
+
+def test_deprecated_params_action_once():
+    @DeprecatedParams("z", action="once")
+    def foo(x, z=None):
+        return x
+
+    filters = list(warnings.filters)
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        for _ in range(3):
+            foo(1, z=2)
+    assert [str(warn.message) for warn in warns] == ["'z' parameter is deprecated"]
+    assert warns[0].filename == __file__
+    assert warns[0].lineno == inspect.currentframe().f_lineno - 3
+    assert warnings.filters == filters
+
+
+def test_deprecated_params_action_default():
+    class Foo(object):
+        @DeprecatedParams("x", action="default")
+        @classmethod
+        def cm(cls, x=None):
+            return x
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        for _ in range(2):
+            Foo.cm(x=1)
+            Foo.cm(x=1)
+    # one warning per call site
+    lineno = inspect.currentframe().f_lineno
+    assert [(warn.filename, warn.lineno) for warn in warns] == [(__file__, lineno - 3), (__file__, lineno - 2)]
+
+
+def test_deprecated_params_invalid_action():
+    with pytest.raises(ValueError):
+        DeprecatedParams("z", action="bad")(lambda x, z=None: x)
+
+
+def test_deprecated_params_extra_stacklevel():
+    @DeprecatedParams("z", extra_stacklevel=1)
+    def foo(x, z=None):
+        return x
+
+    def outer():
+        return foo(1, z=2)  # warning refers to the caller of outer
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        outer()
+    assert warns[0].lineno == inspect.currentframe().f_lineno - 1
+
+
+def test_deprecated_params_once():
+    decorator = CountingDeprecatedParams({"y": "y is deprecated", "z": "z is deprecated"}, once=True)
+
+    @decorator
+    def foo(x, y=None, z=None):
+        return x
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        foo(1, y=2)
+        foo(1, y=2)
+        foo(1, y=2, z=3)
+        foo(1, y=2, z=3)
+    assert [str(warn.message) for warn in warns] == ["y is deprecated", "z is deprecated"]
+    # once all the warnings are emitted, the calls are not checked
+    assert decorator.checks == 3
+
+
+def test_deprecated_params_renamed():
+    @DeprecatedParams(renamed={"colour": "color", "size": "width"}, version="2.0")
+    def draw(x, color=None, width=None):
+        return x, color, width
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert draw(1, "red", 2) == (1, "red", 2)
+        assert draw(1, color="red", width=2) == (1, "red", 2)
+        assert warns == []
+        assert draw(1, width=2, colour="red") == (1, "red", 2)
+        assert draw(1, size=2, colour="red") == (1, "red", 2)
+    assert [str(warn.message) for warn in warns] == [
+        "'colour' parameter is deprecated, use 'color' instead -- Deprecated since version 2.0.",
+        "'size' parameter is deprecated, use 'width' instead -- Deprecated since version 2.0.",
+        "'colour' parameter is deprecated, use 'color' instead -- Deprecated since version 2.0.",
+    ]
+    assert all(warn.filename == __file__ for warn in warns)
+
+
+def test_deprecated_params_renamed_once_per_call_shape():
+    @DeprecatedParams("width", renamed={"colour": "color"})
+    def draw(x, color=None, width=None):
+        return x, color
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            assert draw(1, colour="red") == (1, "red")
+        assert draw(1, colour="red", width=2) == (1, "red")
+        assert draw(1, colour="red", width=2) == (1, "red")
+    # the other deprecated parameters are still reported on each call
+    assert [str(warn.message) for warn in warns] == [
+        "'colour' parameter is deprecated, use 'color' instead",
+        "'colour' parameter is deprecated, use 'color' instead",
+        "'width' parameter is deprecated",
+        "'width' parameter is deprecated",
+    ]
+
+
+def test_deprecated_params_renamed_is_forwarded_when_ignored():
+    @DeprecatedParams("width", renamed={"colour": "color"})
+    def draw(x, color=None, width=None):
+        return x, color
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        assert draw(1, colour="red") == (1, "red")
+    assert warns == []
+
+
+def test_deprecated_params_renamed_and_deprecated():
+    @DeprecatedParams({"width": "width is deprecated", "colour": "use color"}, renamed={"colour": "color"})
+    def draw(x, color=None, width=None):
+        return x, color
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert draw(1, width=2, colour="red") == (1, "red")
+    assert [str(warn.message) for warn in warns] == ["use color", "width is deprecated"]
+
+
+def test_deprecated_params_renamed_conflict():
+    @DeprecatedParams(renamed={"colour": "color"})
+    def draw(x, color=None):
+        return x
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with pytest.raises(TypeError, match="draw\\(\\) got values for both 'colour' and its new name 'color'"):
+            draw(1, color="red", colour="blue")
+
+
+def test_deprecated_params_requires_param_or_renamed():
+    with pytest.raises(TypeError):
+        DeprecatedParams()
+
+
+def test_deprecated_params_values():
+    @DeprecatedParams(values={"mode": {"legacy", "old"}})
+    def process(data, mode="fast"):
+        return mode
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert process(1) == "fast"
+        assert process(1, "fast") == "fast"
+        assert process(1, mode="fast") == "fast"
+        assert process(1, mode=["unhashable"]) == ["unhashable"]
+        assert warns == []
+        assert process(1, "legacy") == "legacy"
+        assert process(1, mode="old") == "old"
+    assert [str(warn.message) for warn in warns] == [
+        "'mode' parameter value 'legacy' is deprecated",
+        "'mode' parameter value 'old' is deprecated",
+    ]
+    assert all(warn.filename == __file__ for warn in warns)
+
+
+def test_deprecated_params_values_with_reasons():
+    class Reader(object):
+        @DeprecatedParams(values={"encoding": {"latin1": "use 'utf-8'", "ascii": ""}}, version="3.0")
+        def read(self, path, encoding="utf-8"):
+            return encoding
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Reader().read("a", "latin1") == "latin1"
+        assert Reader().read("a", encoding="ascii") == "ascii"
+        assert Reader().read("a", "utf-8") == "utf-8"
+    assert [str(warn.message) for warn in warns] == [
+        "use 'utf-8' -- Deprecated since version 3.0.",
+        "'encoding' parameter value 'ascii' is deprecated -- Deprecated since version 3.0.",
+    ]
+
+
+def test_deprecated_params_values_and_params():
+    @DeprecatedParams("z", values={"mode": ["legacy"]}, once=True)
+    def process(data, mode="fast", z=None):
+        return mode
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        for _ in range(3):
+            process(1, "legacy", z=2)
+    assert [str(warn.message) for warn in warns] == [
+        "'z' parameter is deprecated",
+        "'mode' parameter value 'legacy' is deprecated",
+    ]
+
+
+def test_deprecated_params_values_must_be_a_collection():
+    with pytest.raises(TypeError):
+        DeprecatedParams(values={"mode": "legacy"})
+
+
+def test_deprecated_params_keyword_only():
+    @DeprecatedParams(keyword_only=("b", "c"), version="2.0")
+    def foo(a, b=None, c=None, d=None):
+        return a, b, c
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo(1) == (1, None, None)
+        assert foo(1, b=2, c=3) == (1, 2, 3)
+        assert warns == []
+        assert foo(1, 2) == (1, 2, None)
+        assert foo(1, 2, 3, 4) == (1, 2, 3)
+    assert [str(warn.message) for warn in warns] == [
+        "Passing 'b' as a positional argument is deprecated, use a keyword argument -- Deprecated since version 2.0.",
+        "Passing 'b' as a positional argument is deprecated, use a keyword argument -- Deprecated since version 2.0.",
+        "Passing 'c' as a positional argument is deprecated, use a keyword argument -- Deprecated since version 2.0.",
+    ]
+    assert all(warn.filename == __file__ for warn in warns)
+
+
+def test_deprecated_params_keyword_only_method():
+    class Foo(object):
+        @DeprecatedParams("b", keyword_only="b")
+        def method(self, a, b=None):
+            return a, b
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Foo().method(1) == (1, None)
+        assert warns == []
+        assert Foo().method(1, 2) == (1, 2)
+    assert [str(warn.message) for warn in warns] == [
+        "'b' parameter is deprecated",
+        "Passing 'b' as a positional argument is deprecated, use a keyword argument",
+    ]
+
+
+def test_deprecated_params_default_changes():
+    @DeprecatedParams(default_changes={"sort": "the default value of 'sort' will be True"}, version="2.0")
+    def items(data, sort=False, *, reverse=False):
+        return sort
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert items([], True) is True
+        assert items([], sort=False) is False
+        assert warns == []
+        assert items([]) is False
+        assert items([], reverse=True) is False
+    assert [str(warn.message) for warn in warns] == [
+        "the default value of 'sort' will be True -- Deprecated since version 2.0.",
+    ] * 2
+    assert all(warn.filename == __file__ for warn in warns)
+
+
+@pytest.mark.parametrize("default_changes", ["reverse", ["reverse"], {"reverse": ""}])
+def test_deprecated_params_default_changes_keyword_only(default_changes):
+    class Foo(object):
+        @DeprecatedParams(default_changes=default_changes)
+        def items(self, data, *, reverse=False):
+            return reverse
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Foo().items([], reverse=False) is False
+        assert warns == []
+        assert Foo().items([]) is False
+    assert [str(warn.message) for warn in warns] == [
+        "The default value of the 'reverse' parameter will change, pass it explicitly",
+    ]
+
+
+@pytest.mark.parametrize("name", ["x", "args", "c", "kwargs"])
+def test_deprecated_params_keyword_only_invalid(name):
+    @DeprecatedParams(keyword_only=name)
+    def foo(a, b=None, *args, c=None, **kwargs):
+        return b
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        with pytest.raises(TypeError, match="keyword_only: '{0}' is not a positional-or-keyword".format(name)):
+            foo(1)
+
+
+@pytest.mark.parametrize("name", ["x", "a", "b", "args", "kwargs"])
+def test_deprecated_params_default_changes_invalid(name):
+    @DeprecatedParams(default_changes=name)
+    def foo(a, b, *args, c=None, **kwargs):
+        return c
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("always")
+        with pytest.raises(TypeError, match="default_changes: '{0}' is not a parameter with a default".format(name)):
+            foo(1, 2)
+
+
+def test_stacked_decorators_use_a_single_wrapper():
+    import deprecated.classic
+    import deprecated.sphinx
+
+    def foo(x, y=None, z=None):
+        """Foo"""
+        return x
+
+    decorated = deprecated.sphinx.deprecated(version="1.2", reason="use :func:`bar`")(
+        DeprecatedParams("y")(DeprecatedParams("z")(deprecated.classic.deprecated(reason="Old")(foo)))
+    )
+    assert type(decorated) is deprecated.classic._DeprecatedWrapper
+    assert decorated.__wrapped__ is foo
+    assert len(decorated._self_checks) == 4
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert decorated(1, y=2, z=3) == 1
+    assert [str(warn.message) for warn in warns] == [
+        "Call to deprecated function (or staticmethod) foo. (use `bar`) -- Deprecated since version 1.2.",
+        "'y' parameter is deprecated",
+        "'z' parameter is deprecated",
+        "Call to deprecated function (or staticmethod) foo. (Old)",
+    ]
+    assert all(warn.filename == __file__ for warn in warns)
+
+
+def test_stacked_decorators_on_class():
+    import deprecated.classic
+
+    @DeprecatedParams("y")
+    @DeprecatedParams("x")
+    class Foo(object):
+        def __init__(self, x=None, y=None):
+            self.x = x
+
+    @DeprecatedParams("y")
+    @DeprecatedParams("x")
+    class Point(tuple):
+        def __new__(cls, x=None, y=None):
+            return super(Point, cls).__new__(cls, (x, y))
+
+    init = vars(Foo)["__init__"]
+    new = vars(Point)["__new__"].__func__
+    assert type(init) is deprecated.classic._DeprecatedWrapper
+    assert len(init._self_checks) == 2
+    assert type(new) is deprecated.classic._DeprecatedWrapper
+    assert len(new._self_checks) == 2
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Foo(x=1, y=2).x == 1
+        assert Point(x=1, y=2) == (1, 2)
+    assert [str(warn.message) for warn in warns] == [
+        "'y' parameter is deprecated",
+        "'x' parameter is deprecated",
+    ] * 2
+    assert all(warn.filename == __file__ for warn in warns)
+
+
+def test_stacked_decorators_renamed():
+    import deprecated.classic
+
+    class Foo(object):
+        @DeprecatedParams(renamed={"colour": "color"})
+        @DeprecatedParams("color")
+        @deprecated.classic.deprecated
+        def draw(self, color=None):
+            return color
+
+    assert type(vars(Foo)["draw"]) is deprecated.classic._DeprecatedWrapper
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Foo().draw(colour="red") == "red"
+    assert [str(warn.message) for warn in warns] == [
+        "'colour' parameter is deprecated, use 'color' instead",
+        "'color' parameter is deprecated",
+        "Call to deprecated method draw.",
+    ]
+    assert all(warn.filename == __file__ for warn in warns)
@@ -1,5 +1,11 @@
 # coding: utf-8
+import os
+import subprocess
+import sys
+import textwrap
+
 import pkg_resources
+import pytest
 
 import deprecated
 
@@ -25,3 +31,56 @@ def test_deprecated_has_version():
     #    https://github.com/pypa/setuptools/issues/1299
 
     assert 'Legacy' not in version.__class__.__name__
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="module __getattr__ requires Python 3.7+")
+def test_deprecated_submodules_are_imported_lazily():
+    # The test is run in a new interpreter, because the submodules are already imported by the other tests
+    code = textwrap.dedent(
+        """
+        import sys
+        import deprecated
+        assert "deprecated.classic" not in sys.modules
+        assert "deprecated.params" not in sys.modules
+        assert "deprecated.module" not in sys.modules
+        assert "wrapt" not in sys.modules
+        assert "platform" not in sys.modules
+        from deprecated import deprecated as deprecated_func
+        assert "deprecated.classic" in sys.modules
+        """
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    subprocess.check_call([sys.executable, "-c", code], env=env)
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="module __getattr__ requires Python 3.7+")
+def test_deprecated_submodules_are_attributes():
+    # The test is run in a new interpreter, because the submodules are already imported by the other tests
+    code = textwrap.dedent(
+        """
+        import deprecated
+        assert deprecated.classic.ClassicAdapter.__name__ == "ClassicAdapter"
+        assert deprecated.params.DeprecatedParams.__name__ == "DeprecatedParams"
+        assert deprecated.sphinx.SphinxAdapter.__name__ == "SphinxAdapter"
+        assert callable(deprecated.stats.snapshot)
+        assert callable(deprecated.module.deprecate_attribute)
+        assert "classic" in dir(deprecated)
+        """
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    subprocess.check_call([sys.executable, "-c", code], env=env)
+
+
+def test_deprecated_has_lazy_attributes():
+    import deprecated.classic
+    import deprecated.module
+    import deprecated.params
+
+    assert deprecated.deprecated is deprecated.classic.deprecated
+    assert deprecated.deprecated_params is deprecated.params.deprecated_params
+    assert deprecated.alias is deprecated.module.alias
+    assert {"alias", "configure", "deprecated", "deprecated_params"} <= set(dir(deprecated))
+    with pytest.raises(AttributeError):
+        getattr(deprecated, "unknown")
@@ -0,0 +1,88 @@
+# coding: utf-8
+import warnings
+
+import pytest
+
+import deprecated
+import deprecated.classic
+import deprecated.config
+import deprecated.params
+import deprecated.sphinx
+
+
+@pytest.fixture(name="disabled")
+def fixture_disabled():
+    deprecated.configure(enabled=False)
+    yield
+    deprecated.configure(enabled=True)
+
+
+def test_enabled_by_default():
+    assert deprecated.config.is_enabled()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", True),
+        ("1", True),
+        ("yes", True),
+        ("0", False),
+        ("False", False),
+        (" no ", False),
+        ("OFF", False),
+    ],
+)
+def test_read_enabled_env(monkeypatch, value, expected):
+    monkeypatch.setenv(deprecated.config.ENABLED_ENV_VAR, value)
+    assert deprecated.config._read_enabled_env() is expected
+
+
+# noinspection PyUnusedLocal
+def test_configure_keeps_setting(disabled):
+    deprecated.configure()
+    assert not deprecated.config.is_enabled()
+
+
+# noinspection PyUnusedLocal
+def test_disabled_function(disabled):
+    def foo():
+        return "foo"
+
+    assert deprecated.classic.deprecated(foo) is foo
+    assert deprecated.classic.deprecated(reason="Good reason", action="error")(foo) is foo
+    assert deprecated.params.deprecated_params("x")(foo) is foo
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo() == "foo"
+    assert warns == []
+
+
+# noinspection PyUnusedLocal
+def test_disabled_class(disabled):
+    class Foo(object):
+        pass
+
+    assert deprecated.classic.deprecated(Foo) is Foo
+    assert Foo.__new__ is object.__new__
+
+
+# noinspection PyUnusedLocal
+def test_disabled_sphinx_function(disabled):
+    def foo():
+        """Foo"""
+
+    assert deprecated.sphinx.deprecated(version="1.2.3")(foo) is foo
+    assert ".. deprecated:: 1.2.3" in foo.__doc__
+
+
+# noinspection PyUnusedLocal
+def test_disabled_params_renamed(disabled):
+    @deprecated.params.deprecated_params(renamed={"colour": "color"})
+    def foo(color=None):
+        return color
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo(colour="red") == "red"
+    assert warns == []
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import functools
 import inspect
 import sys
 import warnings
@@ -322,3 +323,617 @@ def test_extra_stacklevel():
     # Check that the line number points to the first line inside 'demo'
     demo_lineno = inspect.getsourcelines(demo)[1]
     assert warn.lineno == demo_lineno + 1
+
+
+def test_overridden_msg_is_computed_at_each_call():
+    calls = []
+
+    class MyClassicAdapter(deprecated.classic.ClassicAdapter):
+        def get_deprecated_msg(self, wrapped, instance):
+            calls.append(instance)
+            return "call #{0}".format(len(calls))
+
+    @deprecated.classic.deprecated(adapter_cls=MyClassicAdapter)
+    def foo():
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        foo()
+        foo()
+    assert [str(warn.message) for warn in warns] == ["call #1", "call #2"]
+    assert calls == [None, None]
+
+
+def test_static_msgs_by_binding_kind():
+    adapter = deprecated.classic.ClassicAdapter(reason="Good reason", version="1.2.3")
+
+    def foo():
+        pass
+
+    msgs = adapter._get_static_msgs(foo)
+    assert msgs == {
+        "function": "Call to deprecated function (or staticmethod) foo. (Good reason) -- Deprecated since version 1.2.3.",
+        "classmethod": "Call to deprecated class method foo. (Good reason) -- Deprecated since version 1.2.3.",
+        "method": "Call to deprecated method foo. (Good reason) -- Deprecated since version 1.2.3.",
+    }
+
+
+def test_binding_kind_at_decoration_time():
+    class Foo(object):
+        def foo(self):
+            pass
+
+        @classmethod
+        def bar(cls):
+            pass
+
+    def baz():
+        pass
+
+    get_binding_kind = deprecated.classic._get_binding_kind
+    assert get_binding_kind(Foo.__dict__["foo"]) is None
+    assert get_binding_kind(Foo.__dict__["bar"]) == "classmethod"
+    assert get_binding_kind(staticmethod(baz)) == "function"
+    assert get_binding_kind(Foo().foo) == "method"
+    assert get_binding_kind(Foo.bar) == "classmethod"
+    assert get_binding_kind(baz) is None
+    assert get_binding_kind(baz, lightweight=True) == "function"
+    assert get_binding_kind(deprecated.classic.ClassicAdapter()(classmethod(baz))) == "classmethod"
+
+
+def test_resolved_binding_kind_is_not_inspected_at_call(monkeypatch):
+    class Foo(object):
+        @deprecated.classic.ClassicAdapter()
+        @classmethod
+        def foo(cls):
+            return "foo"
+
+        @deprecated.classic.ClassicAdapter()
+        @staticmethod
+        def bar():
+            return "bar"
+
+        def baz(self):
+            return "baz"
+
+    baz = deprecated.classic.deprecated(Foo().baz)
+
+    def isclass(obj):
+        raise AssertionError("unexpected call to inspect.isclass()")
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        with monkeypatch.context() as context:
+            context.setattr(inspect, "isclass", isclass)
+            assert Foo.foo() == "foo"
+            assert Foo().bar() == "bar"
+            assert baz() == "baz"
+    assert [str(warn.message) for warn in warns] == [
+        "Call to deprecated class method foo.",
+        "Call to deprecated function (or staticmethod) bar.",
+        "Call to deprecated method baz.",
+    ]
+
+
+class Unnamed(object):
+    def foo(cls):
+        return "foo"
+
+    def bar():
+        return "bar"
+
+
+def test_unnamed_classmethod_and_staticmethod():
+    # before Python 3.10, classmethod and staticmethod objects have no name
+    foo = classmethod(Unnamed.__dict__["foo"])
+    bar = staticmethod(Unnamed.__dict__["bar"])
+    for obj in foo, bar:
+        for attr in "__module__", "__name__", "__qualname__":
+            vars(obj).pop(attr, None)
+    Unnamed.foo = deprecated.classic.ClassicAdapter(unwrap_after=1)(foo)
+    Unnamed.bar = deprecated.classic.ClassicAdapter(unwrap_after=1)(bar)
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Unnamed.foo() == "foo"
+        assert Unnamed.bar() == "bar"
+    assert [str(warn.message) for warn in warns] == [
+        "Call to deprecated class method foo.",
+        "Call to deprecated function (or staticmethod) bar.",
+    ]
+    # the original objects are restored
+    assert vars(Unnamed)["foo"] is foo
+    assert vars(Unnamed)["bar"] is bar
+
+
+def test_overridden_msg_receives_the_instance():
+    instances = []
+
+    class MyClassicAdapter(deprecated.classic.ClassicAdapter):
+        def get_deprecated_msg(self, wrapped, instance):
+            instances.append(instance)
+            return "call"
+
+    class Foo(object):
+        @deprecated.classic.deprecated(adapter_cls=MyClassicAdapter)
+        def foo(self):
+            pass
+
+        @classmethod
+        @deprecated.classic.deprecated(adapter_cls=MyClassicAdapter)
+        def bar(cls):
+            pass
+
+    obj = Foo()
+    with warnings.catch_warnings(record=True):
+        warnings.simplefilter("always")
+        obj.foo()
+        Foo.bar()
+    if (3, 9) <= sys.version_info < (3, 13):
+        assert instances == [obj, Foo]
+    else:
+        assert instances == [obj, None]
+
+
+@pytest.mark.parametrize("action", ["error", "ignore", "always", "default", "module", "once"])
+def test_action_does_not_modify_global_filters(action):
+    filters = []
+
+    @deprecated.classic.deprecated(action=action)
+    def foo():
+        filters.append((warnings.filters, list(warnings.filters)))
+
+    with warnings.catch_warnings(record=True):
+        warnings.simplefilter("always")
+        expected = (warnings.filters, list(warnings.filters))
+        try:
+            foo()
+        except DeprecationWarning:
+            assert action == "error"
+        else:
+            assert filters == [expected]
+
+
+def test_action_always_overrides_global_filter():
+    @deprecated.classic.deprecated(action="always")
+    def foo():
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        foo()
+        foo()
+    assert len(warns) == 2
+    assert warns[0].filename == __file__
+
+
+def test_action_error_raises():
+    @deprecated.classic.deprecated(action="error", category=MyDeprecationWarning)
+    def foo():
+        pass
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        with pytest.raises(MyDeprecationWarning):
+            foo()
+
+
+def test_action_default_warns_once_per_location():
+    @deprecated.classic.deprecated(action="default")
+    def foo():
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        for _ in range(3):
+            foo()
+            foo()
+    assert len(warns) == 2
+    assert warns[0].lineno != warns[1].lineno
+
+
+def test_action_once_is_thread_safe():
+    import threading
+
+    @deprecated.classic.deprecated(action="once")
+    def foo():
+        pass
+
+    def run():
+        for _ in range(100):
+            foo()
+
+    with warnings.catch_warnings(record=True) as warns:
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(warns) == 1
+
+
+def test_invalid_action():
+    with pytest.raises(ValueError):
+
+        @deprecated.classic.deprecated(action="invalid")
+        def foo():
+            pass
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        pytest.param([{}], True, id="ignore all"),
+        pytest.param([{"category": DeprecationWarning}], True, id="ignore category"),
+        pytest.param([{"category": MyDeprecationWarning}], False, id="ignore subclass"),
+        pytest.param([{"action": "always"}], False, id="always"),
+        pytest.param([{"category": DeprecationWarning, "module": "foo"}], False, id="ignore module"),
+        pytest.param(
+            [{"module": "foo"}, {"category": DeprecationWarning}],
+            True,
+            id="ignore module then ignore all",
+        ),
+        pytest.param(
+            [{"action": "error", "module": "foo"}, {"category": DeprecationWarning}],
+            False,
+            id="error module then ignore all",
+        ),
+        pytest.param([{"category": UserWarning}], False, id="other category"),
+    ],
+)
+def test_is_ignored(filters, expected):
+    with warnings.catch_warnings():
+        warnings.resetwarnings()
+        for kwargs in reversed(filters):
+            kwargs = dict(kwargs)
+            warnings.filterwarnings(kwargs.pop("action", "ignore"), **kwargs)
+        assert deprecated.classic._is_ignored(DeprecationWarning) is expected
+
+
+@pytest.mark.parametrize("compiled", [True, False], ids=["filterwarnings", "default filters"])
+def test_is_ignored_by_module(compiled):
+    calls = []
+
+    class MyClassicAdapter(deprecated.classic.ClassicAdapter):
+        def get_deprecated_msg(self, wrapped, instance):
+            calls.append(instance)
+            return "call"
+
+    @deprecated.classic.deprecated(adapter_cls=MyClassicAdapter)
+    def foo():
+        return "foo"
+
+    # like the default filters of CPython: the deprecation warnings are only shown in __main__
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.resetwarnings()
+        warnings.filterwarnings("ignore", category=DeprecationWarning)
+        if compiled:
+            warnings.filterwarnings("default", category=DeprecationWarning, module="__main__")
+        else:
+            warnings.filters.insert(0, ("default", None, DeprecationWarning, "__main__", 0))
+        namespace = {"__name__": "__main__", "foo": foo, "is_ignored": deprecated.classic._is_ignored}
+        exec("main_ignored = is_ignored(DeprecationWarning, 1)\nfoo()\n", namespace)
+
+        assert not namespace["main_ignored"]
+        assert deprecated.classic._is_ignored(DeprecationWarning, 1)
+        assert not deprecated.classic._is_ignored(DeprecationWarning)
+        assert foo() == "foo"
+
+    assert [str(warn.message) for warn in warns] == ["call"]
+    assert calls == [None]
+
+
+def test_is_ignored_cache_is_invalidated():
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert deprecated.classic._is_ignored(DeprecationWarning)
+        warnings.simplefilter("always", DeprecationWarning)
+        assert not deprecated.classic._is_ignored(DeprecationWarning)
+        warnings.filters.pop(0)
+        assert deprecated.classic._is_ignored(DeprecationWarning)
+
+
+def test_ignored_msg_is_not_computed():
+    calls = []
+
+    class MyClassicAdapter(deprecated.classic.ClassicAdapter):
+        def get_deprecated_msg(self, wrapped, instance):
+            calls.append(instance)
+            return "call"
+
+    @deprecated.classic.deprecated(adapter_cls=MyClassicAdapter)
+    def foo():
+        return "foo"
+
+    @deprecated.classic.deprecated(adapter_cls=MyClassicAdapter)
+    class Foo(object):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        assert foo() == "foo"
+        assert isinstance(Foo(), Foo)
+    assert warns == []
+    assert calls == []
+
+
+@pytest.mark.parametrize("action", [None, "always"])
+def test_once_function(action):
+    @deprecated.classic.deprecated(once=True, action=action)
+    def foo():
+        return "foo"
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert [foo() for _ in range(3)] == ["foo"] * 3
+    assert len(warns) == 1
+    assert warns[0].filename == __file__
+
+
+def test_once_class():
+    @deprecated.classic.deprecated(once=True)
+    class Foo(object):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        objs = [Foo() for _ in range(3)]
+    assert len(warns) == 1
+    assert all(isinstance(obj, Foo) for obj in objs)
+
+
+def test_once_ignored_warnings_are_not_counted():
+    @deprecated.classic.deprecated(once=True)
+    def foo():
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        foo()
+        warnings.simplefilter("always")
+        foo()
+        foo()
+    assert len(warns) == 1
+
+
+def test_once_is_thread_safe():
+    import threading
+
+    @deprecated.classic.deprecated(once=True)
+    def foo():
+        pass
+
+    def run():
+        for _ in range(100):
+            foo()
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    assert len(warns) == 1
+
+
+@deprecated.classic.deprecated(unwrap_after=2)
+def unwrapped_foo():
+    return "foo"
+
+
+class UnwrappedFoo(object):
+    @deprecated.classic.deprecated(unwrap_after=1)
+    def foo(self):
+        return "foo"
+
+    @classmethod
+    @deprecated.classic.deprecated(unwrap_after=1)
+    def bar(cls):
+        return "bar"
+
+
+@deprecated.classic.deprecated(unwrap_after=1)
+class UnwrappedBar(object):
+    pass
+
+
+def test_unwrap_after_function():
+    wrapper = unwrapped_foo
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert [unwrapped_foo() for _ in range(3)] == ["foo"] * 3
+        # an old reference to the wrapper stops warning too
+        assert wrapper() == "foo"
+    assert len(warns) == 2
+    assert unwrapped_foo is not wrapper
+    assert unwrapped_foo is wrapper.__wrapped__
+
+
+def test_unwrap_after_methods():
+    obj = UnwrappedFoo()
+    foo_wrapper = vars(UnwrappedFoo)["foo"]
+    bar_wrapper = vars(UnwrappedFoo)["bar"].__func__
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert [obj.foo() for _ in range(3)] == ["foo"] * 3
+        assert [UnwrappedFoo.bar() for _ in range(3)] == ["bar"] * 3
+    assert len(warns) == 2
+    assert vars(UnwrappedFoo)["foo"] is foo_wrapper.__wrapped__
+    assert vars(UnwrappedFoo)["bar"].__func__ is bar_wrapper.__wrapped__
+
+
+def test_unwrap_after_class():
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        objs = [UnwrappedBar() for _ in range(3)]
+    assert len(warns) == 1
+    assert all(isinstance(obj, UnwrappedBar) for obj in objs)
+    assert UnwrappedBar.__new__ is object.__new__
+
+
+def test_unwrap_after_local_function():
+    @deprecated.classic.deprecated(unwrap_after=1)
+    def foo():
+        return "foo"
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert [foo() for _ in range(3)] == ["foo"] * 3
+    assert len(warns) == 1
+
+
+def test_once_and_unwrap_after():
+    with pytest.raises(ValueError):
+        deprecated.classic.ClassicAdapter(once=True, unwrap_after=10)
+
+
+@pytest.mark.parametrize("sample_rate, expected", [(0, 0), (0.0, 0), (1, 10), (1.0, 10)])
+def test_sample_rate(sample_rate, expected):
+    @deprecated.classic.deprecated(sample_rate=sample_rate)
+    def foo():
+        return "foo"
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert [foo() for _ in range(10)] == ["foo"] * 10
+    assert len(warns) == expected
+
+
+def test_sample_rate_is_random(monkeypatch):
+    import random
+
+    samples = iter([0.1, 0.6, 0.4, 0.9])
+    monkeypatch.setattr(random, "random", lambda: next(samples))
+
+    @deprecated.classic.deprecated(sample_rate=0.5)
+    class Foo(object):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        for _ in range(4):
+            Foo()
+    assert len(warns) == 2
+
+
+def test_max_per_interval(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(deprecated.classic, "_monotonic", lambda: now[0])
+
+    @deprecated.classic.deprecated(max_per_interval=2, interval=10)
+    def foo():
+        return "foo"
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        for _ in range(5):
+            foo()
+        assert len(warns) == 2
+        now[0] += 5  # one token is refilled
+        for _ in range(5):
+            foo()
+        assert len(warns) == 3
+        now[0] += 60  # the bucket is full
+        for _ in range(5):
+            foo()
+        assert len(warns) == 5
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"sample_rate": -0.1},
+        {"sample_rate": 1.5},
+        {"max_per_interval": 0},
+        {"max_per_interval": 1, "interval": 0},
+    ],
+)
+def test_invalid_throttle(kwargs):
+    with pytest.raises(ValueError):
+
+        @deprecated.classic.deprecated(**kwargs)
+        def foo():
+            pass
+
+
+@deprecated.classic.deprecated(unwrap_after=1, lightweight=True)
+def unwrapped_light_foo():
+    return "foo"
+
+
+class LightFoo(object):
+    @deprecated.classic.deprecated(lightweight=True)
+    def foo(self):
+        return "foo"
+
+
+def test_lightweight_function():
+    def foo(x, y=2):
+        """Foo"""
+        return x + y
+
+    wrapper = deprecated.classic.deprecated(reason="Good reason", lightweight=True)(foo)
+    assert type(wrapper) is type(foo)
+    assert wrapper.__wrapped__ is foo
+    assert wrapper.__name__ == "foo"
+    assert wrapper.__doc__ == "Foo"
+    assert inspect.signature(wrapper) == inspect.signature(foo)
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert wrapper(1) == 3
+    assert [str(warn.message) for warn in warns] == [
+        "Call to deprecated function (or staticmethod) foo. (Good reason)"
+    ]
+    assert warns[0].filename == __file__
+
+
+def test_lightweight_methods_use_wrapt():
+    assert type(vars(LightFoo)["foo"]) is deprecated.classic._DeprecatedWrapper
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert LightFoo().foo() == "foo"
+    assert [str(warn.message) for warn in warns] == ["Call to deprecated method foo."]
+
+
+def test_lightweight_stacked_decorators():
+    import deprecated.params
+
+    @deprecated.params.deprecated_params("y")
+    @deprecated.classic.deprecated(lightweight=True)
+    def foo(x, y=2):
+        return x + y
+
+    assert deprecated.classic._is_lightweight_wrapper(foo)
+    assert len(foo._deprecated_checks) == 2
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo(1, y=3) == 4
+    assert [str(warn.message) for warn in warns] == [
+        "'y' parameter is deprecated",
+        "Call to deprecated function (or staticmethod) foo.",
+    ]
+    assert all(warn.filename == __file__ for warn in warns)
+
+
+def test_lightweight_wrapper_copied_by_wraps():
+    light = deprecated.classic.deprecated(lightweight=True)(lambda: "foo")
+
+    @functools.wraps(light)
+    def other():
+        return light()
+
+    assert "_deprecated_checks" in vars(other)
+    assert not deprecated.classic._is_lightweight_wrapper(other)
+    # the decorator doesn't merge with a foreign wrapper
+    wrapper = deprecated.classic.deprecated(lightweight=True)(other)
+    assert wrapper.__wrapped__ is other
+
+
+def test_unwrap_after_lightweight_function():
+    wrapper = unwrapped_light_foo
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert [unwrapped_light_foo() for _ in range(3)] == ["foo"] * 3
+    assert len(warns) == 1
+    assert unwrapped_light_foo is wrapper.__wrapped__
@@ -5,6 +5,8 @@ import inspect
 import io
 import warnings
 
+import pytest
+
 import deprecated.classic
 
 
@@ -153,3 +155,233 @@ def test_simple_class_deprecation_with_args():
     assert len(warns) == 1
     assert isinstance(obj, MyClass)
     assert inspect.isclass(MyClass)
+
+
+def test_exact_class_mode():
+    @deprecated.classic.deprecated(class_mode="exact")
+    class MyBaseClass(object):
+        pass
+
+    class MySubClass(MyBaseClass):
+        def __init__(self, arg):
+            super(MySubClass, self).__init__()
+            self.arg = arg
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        obj = MySubClass(5)
+        assert warns == []
+        MyBaseClass()
+
+    assert len(warns) == 1
+    assert warns[0].filename == __file__
+    assert obj.arg == 5
+    # the subclass doesn't call the deprecation wrapper
+    assert MySubClass.__new__ is not MyBaseClass.__new__
+
+
+def test_exact_class_mode_original_new():
+    calls = []
+
+    @deprecated.classic.deprecated(class_mode="exact")
+    class MyBaseClass(object):
+        def __new__(cls, *args, **kwargs):
+            calls.append(cls)
+            return super(MyBaseClass, cls).__new__(cls)
+
+    class MyMixin(object):
+        def __new__(cls, *args, **kwargs):
+            calls.append(MyMixin)
+            return super(MyMixin, cls).__new__(cls, *args, **kwargs)
+
+    class MySubClass(MyBaseClass):
+        pass
+
+    class MyMixinClass(MyMixin, MyBaseClass):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        MySubClass()
+        MyMixinClass()
+
+    assert warns == []
+    assert calls == [MySubClass, MyMixin, MyMixinClass]
+    assert MySubClass.__new__ is not MyBaseClass.__new__
+
+
+def test_exact_class_mode_inherited_new():
+    calls = []
+
+    class MyMixin(object):
+        def __new__(cls, *args, **kwargs):
+            calls.append(cls)
+            return super(MyMixin, cls).__new__(cls)
+
+    @deprecated.classic.deprecated(class_mode="exact")
+    class MyBaseClass(object):
+        pass
+
+    class MySubClass(MyBaseClass, MyMixin):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        MySubClass()
+
+    assert warns == []
+    assert calls == [MySubClass]
+
+
+def test_exact_class_mode_subclass_calls_new():
+    @deprecated.classic.deprecated(class_mode="exact")
+    class MyBaseClass(object):
+        pass
+
+    class MySubClass(MyBaseClass):
+        def __new__(cls, *args, **kwargs):
+            return super(MySubClass, cls).__new__(cls, *args, **kwargs)
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        obj = MySubClass()
+
+    assert warns == []
+    assert isinstance(obj, MySubClass)
+
+
+def test_exact_class_mode_init_subclass():
+    subclasses = []
+
+    @deprecated.classic.deprecated(class_mode="exact")
+    class MyBaseClass(object):
+        def __init_subclass__(cls, tag=None, **kwargs):
+            super(MyBaseClass, cls).__init_subclass__(**kwargs)
+            subclasses.append((cls, tag))
+
+    class MySubClass(MyBaseClass, tag="sub"):
+        pass
+
+    assert subclasses == [(MySubClass, "sub")]
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        MySubClass()
+    assert warns == []
+
+
+def test_exact_class_mode_deprecated_subclass():
+    @deprecated.classic.deprecated(class_mode="exact")
+    class MyBaseClass(object):
+        pass
+
+    @deprecated.classic.deprecated(reason="use MyClass")
+    class MySubClass(MyBaseClass):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        MySubClass()
+
+    assert [str(warn.message) for warn in warns] == ["Call to deprecated class MySubClass. (use MyClass)"]
+
+
+def test_subclass_class_mode():
+    @deprecated.classic.deprecated(reason="use MyClass", version="1.2.3", class_mode="subclass")
+    class MyBaseClass(object):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        MyBaseClass()
+
+        class MySubClass(MyBaseClass):
+            def __init__(self, arg):
+                super(MySubClass, self).__init__()
+                self.arg = arg
+
+        lineno = inspect.currentframe().f_lineno - 5
+
+        class MyOtherSubClass(MyBaseClass):
+            pass
+
+        obj = MySubClass(5)
+        MyOtherSubClass()
+
+    assert [str(warn.message) for warn in warns] == [
+        "Subclassing deprecated class MyBaseClass. (use MyClass) -- Deprecated since version 1.2.3.",
+    ] * 2
+    assert warns[0].filename == __file__
+    assert warns[0].lineno == lineno
+    assert obj.arg == 5
+    # the instantiation is not wrapped
+    assert "__new__" not in vars(MyBaseClass)
+
+
+def test_subclass_class_mode_once():
+    @deprecated.classic.deprecated(class_mode="subclass", once=True)
+    class MyBaseClass(object):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+
+        class MySubClass(MyBaseClass):
+            pass
+
+        class MyOtherSubClass(MySubClass):
+            pass
+
+    assert len(warns) == 1
+
+
+def test_subclass_class_mode_unwrap_after():
+    subclasses = []
+
+    class MyBaseClass(object):
+        def __init_subclass__(cls, tag=None, **kwargs):
+            super(MyBaseClass, cls).__init_subclass__(**kwargs)
+            subclasses.append((cls.__name__, tag))
+
+    @deprecated.classic.deprecated(class_mode="subclass", unwrap_after=1)
+    class MyClass(MyBaseClass, tag="class"):
+        pass
+
+    init_subclass = MyClass.__dict__["__init_subclass__"]
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+
+        class MySubClass(MyClass, tag="sub"):
+            pass
+
+        assert "__init_subclass__" not in vars(MyClass)
+
+        class MyOtherSubClass(MyClass):
+            pass
+
+    assert len(warns) == 1
+    assert isinstance(init_subclass, classmethod)
+    assert subclasses == [("MyClass", "class"), ("MySubClass", "sub"), ("MyOtherSubClass", None)]
+
+
+def test_subclass_class_mode_custom_msg():
+    class MyClassicAdapter(deprecated.classic.ClassicAdapter):
+        def get_deprecated_msg(self, wrapped, instance):
+            return "{0} inherits from {1}".format(instance.__name__, wrapped.__name__)
+
+    @deprecated.classic.deprecated(class_mode="subclass", adapter_cls=MyClassicAdapter)
+    class MyBaseClass(object):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+
+        class MySubClass(MyBaseClass):
+            pass
+
+    assert [str(warn.message) for warn in warns] == ["MySubClass inherits from MyBaseClass"]
+
+
+def test_invalid_class_mode():
+    with pytest.raises(ValueError):
+        deprecated.classic.ClassicAdapter(class_mode="subclasses")
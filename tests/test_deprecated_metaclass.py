@@ -1,4 +1,5 @@
 # coding: utf-8
+import inspect
 import warnings
 
 import deprecated.classic
@@ -113,3 +114,52 @@ def test_with_singleton_metaclass():
     assert obj1.a == "five"
     assert obj1.b == 5
     assert obj2 is obj1
+
+
+def test_subclass_class_mode_with_metaclass():
+    class Meta(type):
+        def __new__(mcs, name, bases, namespace, **kwargs):
+            return super(Meta, mcs).__new__(mcs, name, bases, namespace, **kwargs)
+
+        def __init__(cls, name, bases, namespace, **kwargs):
+            super(Meta, cls).__init__(name, bases, namespace, **kwargs)
+            cls.registered = True
+
+    @deprecated.classic.deprecated(class_mode="subclass")
+    class MyClass(with_metaclass(Meta)):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+
+        class MySubClass(MyClass):
+            pass
+
+        lineno = inspect.currentframe().f_lineno - 3
+        MySubClass()
+
+    assert len(warns) == 1
+    assert warns[0].filename == __file__
+    assert warns[0].lineno == lineno
+    assert MySubClass.registered
+
+
+def test_subclass_class_mode_of_metaclass():
+    @deprecated.classic.deprecated(class_mode="subclass")
+    class Meta(type):
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+
+        class MyMeta(Meta):
+            pass
+
+        lineno = inspect.currentframe().f_lineno - 3
+
+        class MyClass(with_metaclass(MyMeta)):
+            pass
+
+    assert len(warns) == 1
+    assert warns[0].lineno == lineno
+    assert type(MyClass) is MyMeta
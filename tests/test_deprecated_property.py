@@ -0,0 +1,236 @@
+# coding: utf-8
+import functools
+import sys
+import warnings
+
+import pytest
+
+import deprecated.classic
+import deprecated.sphinx
+import deprecated.stats
+
+
+class Foo(object):
+    def __init__(self):
+        self.new_size = 1
+
+    @deprecated.classic.deprecated(reason="use new_size", version="1.2.3")
+    @property
+    def size(self):
+        """Size of the object."""
+        return self.new_size
+
+    @size.setter
+    def size(self, value):
+        self.new_size = value
+
+    @size.deleter
+    def size(self):
+        del self.new_size
+
+    @deprecated.classic.deprecated
+    @property
+    def read_only(self):
+        return self.new_size
+
+
+def test_property_get_set_delete():
+    foo = Foo()
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo.size == 1
+        foo.size = 2
+        assert foo.new_size == 2
+        del foo.size
+        assert not hasattr(foo, "new_size")
+
+    assert [str(warn.message) for warn in warns] == [
+        "Access to deprecated attribute size. (use new_size) -- Deprecated since version 1.2.3.",
+        "Assignment to deprecated attribute size. (use new_size) -- Deprecated since version 1.2.3.",
+        "Deletion of deprecated attribute size. (use new_size) -- Deprecated since version 1.2.3.",
+    ]
+    assert all(warn.filename == __file__ for warn in warns)
+    assert all(warn.category is DeprecationWarning for warn in warns)
+
+
+def test_property_class_access():
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        size = Foo.size
+
+    assert warns == []
+    assert size is Foo.__dict__["size"]
+    assert isinstance(size, property)
+    assert size.__doc__ == "Size of the object."
+    assert size.fget.__name__ == "size"
+    assert isinstance(size.__wrapped__, property)
+
+
+def test_property_read_only():
+    foo = Foo()
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert foo.read_only == 1
+        with pytest.raises(AttributeError):
+            foo.read_only = 2
+        with pytest.raises(AttributeError):
+            del foo.read_only
+
+    # no warning for the missing setter and deleter
+    assert [str(warn.message) for warn in warns] == ["Access to deprecated attribute read_only."]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 8), reason="functools.cached_property requires Python 3.8+")
+def test_cached_property():
+    calls = []
+
+    class Bar(object):
+        @deprecated.classic.deprecated(reason="use size")
+        @functools.cached_property
+        def old_size(self):
+            calls.append(self)
+            return 42
+
+    bar = Bar()
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert bar.old_size == 42
+        # the cached value is read from the instance dictionary, without warning
+        assert bar.old_size == 42
+
+    assert calls == [bar]
+    assert [str(warn.message) for warn in warns] == ["Access to deprecated attribute old_size. (use size)"]
+    assert warns[0].filename == __file__
+
+
+def test_custom_descriptors():
+    class NonData(object):
+        def __get__(self, instance, owner=None):
+            return self if instance is None else "non-data"
+
+    class Data(NonData):
+        def __set_name__(self, owner, name):
+            self.name = name
+
+        def __get__(self, instance, owner=None):
+            return self if instance is None else instance.__dict__[self.name]
+
+        def __set__(self, instance, value):
+            instance.__dict__[self.name] = value
+
+    class Bar(object):
+        old_non_data = deprecated.classic.deprecated(NonData())
+        old_data = deprecated.classic.deprecated(Data())
+
+    bar = Bar()
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert bar.old_non_data == "non-data"
+        bar.old_data = 5
+        assert bar.old_data == 5
+        with pytest.raises(AttributeError):
+            del bar.old_data
+
+    assert Bar.old_data.name == "old_data"
+    assert [str(warn.message) for warn in warns] == [
+        "Access to deprecated attribute old_non_data.",
+        "Assignment to deprecated attribute old_data.",
+        "Access to deprecated attribute old_data.",
+    ]
+    # the instance dictionary still hides the non-data descriptors
+    bar.old_non_data = "instance"
+    assert bar.old_non_data == "instance"
+
+
+def test_property_options():
+    class Bar(object):
+        @deprecated.classic.deprecated(once=True, category=FutureWarning)
+        @property
+        def old_once(self):
+            return 1
+
+        @deprecated.classic.deprecated(unwrap_after=1)
+        @property
+        def old_unwrapped(self):
+            return 2
+
+        @deprecated.classic.deprecated(action="ignore")
+        @property
+        def old_ignored(self):
+            return 3
+
+    bar = Bar()
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert [bar.old_once, bar.old_once] == [1, 1]
+        assert [bar.old_unwrapped, bar.old_unwrapped] == [2, 2]
+        assert [bar.old_ignored, bar.old_ignored] == [3, 3]
+
+    assert [(warn.category, str(warn.message)) for warn in warns] == [
+        (FutureWarning, "Access to deprecated attribute old_once."),
+        (DeprecationWarning, "Access to deprecated attribute old_unwrapped."),
+    ]
+    assert type(vars(Bar)["old_unwrapped"]) is property
+
+
+def test_sphinx_property():
+    class Bar(object):
+        @deprecated.sphinx.deprecated(version="1.2.3", reason="Use :attr:`new_size`")
+        @property
+        def old_size(self):
+            """Size of the object."""
+            return 1
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert Bar().old_size == 1
+
+    assert Bar.old_size.__doc__ == "Size of the object.\n\n.. deprecated:: 1.2.3\n   Use :attr:`new_size`\n"
+    assert [str(warn.message) for warn in warns] == [
+        "Access to deprecated attribute old_size. (Use `new_size`) -- Deprecated since version 1.2.3."
+    ]
+
+
+def test_property_stats():
+    foo = Foo()
+    deprecated.stats.reset()
+    deprecated.stats.enable()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            foo.size
+            foo.size = 3
+    finally:
+        deprecated.stats.disable()
+
+    assert deprecated.stats.snapshot()["tests.test_deprecated_property.Foo.size"] == 2
+
+
+def test_property_once_is_quiet():
+    class Bar(object):
+        @deprecated.classic.deprecated(once=True)
+        @property
+        def old_size(self):
+            return 1
+
+    bar = Bar()
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert bar.old_size == 1
+    assert len(warns) == 1
+    assert vars(Bar)["old_size"]._deprecated_quiet
+
+    # the statistics are still collected once the warning is emitted
+    deprecated.stats.reset()
+    deprecated.stats.enable()
+    try:
+        assert bar.old_size == 1
+    finally:
+        deprecated.stats.disable()
+    name = "tests.test_deprecated_property.test_property_once_is_quiet.<locals>.Bar.old_size"
+    assert deprecated.stats.snapshot()[name] == 1
+
+
+def test_not_a_descriptor():
+    with pytest.raises(TypeError):
+        deprecated.classic.deprecated(42)
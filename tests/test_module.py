@@ -0,0 +1,327 @@
+# coding: utf-8
+import collections
+import inspect
+import os
+import sys
+import types
+import warnings
+
+import pytest
+
+import deprecated
+import deprecated.config
+import deprecated.stats
+from deprecated.module import deprecate_attribute
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7), reason="module __getattr__ requires Python 3.7+")
+
+
+@pytest.fixture
+def module():
+    module = types.ModuleType("my_module")
+    sys.modules["my_module"] = module
+    yield module
+    del sys.modules["my_module"]
+
+
+@pytest.fixture
+def target_module(tmp_path, monkeypatch):
+    source = u"NEW_TIMEOUT = 30\n\nclass Parser(object):\n    strict = True\n"
+    tmp_path.joinpath("my_target_module.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "my_target_module"
+    sys.modules.pop("my_target_module", None)
+
+
+def test_deprecate_attribute_from_globals(module):
+    module.NEW_TIMEOUT = module.OLD_TIMEOUT = 30
+    deprecate_attribute("my_module", "OLD_TIMEOUT", reason="use NEW_TIMEOUT", version="2.0")
+
+    assert "OLD_TIMEOUT" not in vars(module)
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert module.OLD_TIMEOUT == 30
+        assert module.OLD_TIMEOUT == 30
+        assert module.NEW_TIMEOUT == 30
+
+    assert [str(warn.message) for warn in warns] == [
+        "Access to deprecated attribute OLD_TIMEOUT of module my_module. (use NEW_TIMEOUT)"
+        " -- Deprecated since version 2.0."
+    ] * 2
+    assert warns[0].filename == __file__
+    assert "OLD_TIMEOUT" in dir(module)
+
+
+def test_module_globals_lookup(tmp_path, monkeypatch):
+    # the module __getattr__ is not used for the global lookups of the module code
+    source = (
+        u"from deprecated.module import deprecate_attribute\n"
+        u"OLD_TIMEOUT = 30\n"
+        u"_TIMEOUT = 30\n"
+        u"def uses_old():\n    return OLD_TIMEOUT\n"
+        u"def uses_private():\n    return _TIMEOUT\n"
+        u"deprecate_attribute(__name__, 'OLD_TIMEOUT')\n"
+        u"deprecate_attribute(__name__, 'TIMEOUT', value=_TIMEOUT)\n"
+    )
+    tmp_path.joinpath("my_globals_module.py").write_text(source)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        import my_globals_module
+
+        with pytest.raises(NameError):
+            my_globals_module.uses_old()
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter("always")
+            assert my_globals_module.uses_private() == 30
+            assert my_globals_module.TIMEOUT == 30
+        assert len(warns) == 1
+    finally:
+        sys.modules.pop("my_globals_module", None)
+
+
+def test_deprecate_attribute_value(module):
+    deprecate_attribute("my_module", "OLD_TIMEOUT", value=30)
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        from my_module import OLD_TIMEOUT
+
+    assert OLD_TIMEOUT == 30
+    assert len(warns) == 1
+    assert warns[0].filename == __file__
+
+
+def test_deprecate_attribute_from_package(module):
+    # ``from package import name`` looks up the attribute twice (see ``importlib._bootstrap._handle_fromlist``)
+    module.__path__ = []
+    deprecate_attribute("my_module", "OLD_TIMEOUT", value=30)
+
+    deprecated.stats.reset()
+    deprecated.stats.enable()
+    try:
+        with warnings.catch_warnings(record=True) as warns:
+            warnings.simplefilter("always")
+            from my_module import OLD_TIMEOUT
+    finally:
+        deprecated.stats.disable()
+
+    assert OLD_TIMEOUT == 30
+    assert len(warns) == 1
+    assert warns[0].filename == __file__
+    assert deprecated.stats.snapshot()["my_module.OLD_TIMEOUT"] == 1
+
+
+def test_deprecate_attribute_target(module, target_module):
+    deprecate_attribute("my_module", "OLD_TIMEOUT", target="my_target_module:NEW_TIMEOUT")
+    deprecate_attribute("my_module", "OldParser", target="my_target_module:Parser", version="2.0")
+    deprecate_attribute("my_module", "old_module", target="my_target_module")
+
+    assert target_module not in sys.modules
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert module.OLD_TIMEOUT == 30
+        assert module.OldParser is sys.modules[target_module].Parser
+        assert module.old_module is sys.modules[target_module]
+
+    assert [str(warn.message) for warn in warns] == [
+        "Access to deprecated attribute OLD_TIMEOUT of module my_module. (use my_target_module.NEW_TIMEOUT)",
+        "Access to deprecated attribute OldParser of module my_module. (use my_target_module.Parser)"
+        " -- Deprecated since version 2.0.",
+        "Access to deprecated attribute old_module of module my_module. (use my_target_module)",
+    ]
+
+
+def test_deprecate_attribute_target_is_cached(module, target_module):
+    deprecate_attribute("my_module", "OLD_TIMEOUT", target="my_target_module:NEW_TIMEOUT")
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert module.OLD_TIMEOUT == 30
+        sys.modules[target_module].NEW_TIMEOUT = 60
+        assert module.OLD_TIMEOUT == 30
+
+    assert len(warns) == 2
+
+
+def test_existing_module_hooks(module):
+    module.__getattr__ = lambda name: "dynamic {0}".format(name)
+    module.__dir__ = lambda: ["dynamic"]
+    deprecate_attribute("my_module", "OLD_TIMEOUT", value=30)
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert module.foo == "dynamic foo"
+        assert module.OLD_TIMEOUT == 30
+
+    assert len(warns) == 1
+    assert dir(module) == ["OLD_TIMEOUT", "dynamic"]
+
+
+def test_missing_attribute(module):
+    deprecate_attribute("my_module", "OLD_TIMEOUT", value=30)
+
+    with pytest.raises(AttributeError, match="no attribute 'foo'"):
+        module.foo
+    with pytest.raises(AttributeError):
+        deprecate_attribute("my_module", "OLD_NAME")
+
+
+def test_value_and_target(module):
+    with pytest.raises(TypeError):
+        deprecate_attribute("my_module", "OLD_TIMEOUT", value=30, target="my_target_module:NEW_TIMEOUT")
+
+
+@pytest.mark.parametrize("action", ["ignore", "error", "once"])
+def test_deprecate_attribute_action(module, action):
+    deprecate_attribute("my_module", "OLD_TIMEOUT", value=30, action=action)
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        if action == "error":
+            with pytest.raises(DeprecationWarning):
+                module.OLD_TIMEOUT
+        else:
+            assert module.OLD_TIMEOUT == 30
+            assert module.OLD_TIMEOUT == 30
+
+    assert len(warns) == {"ignore": 0, "error": 0, "once": 1}[action]
+
+
+def test_deprecate_attribute_disabled(module, target_module, monkeypatch):
+    monkeypatch.setattr(deprecated.config, "_enabled", False)
+    deprecate_attribute("my_module", "OLD_TIMEOUT", target="my_target_module:NEW_TIMEOUT")
+
+    assert target_module not in sys.modules
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert module.OLD_TIMEOUT == 30
+
+    assert warns == []
+    assert vars(module)["OLD_TIMEOUT"] == 30
+
+
+def test_deprecate_attribute_stats(module):
+    deprecate_attribute("my_module", "OLD_TIMEOUT", value=30)
+
+    deprecated.stats.reset()
+    deprecated.stats.enable()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            module.OLD_TIMEOUT
+            module.OLD_TIMEOUT
+    finally:
+        deprecated.stats.disable()
+
+    assert deprecated.stats.snapshot()["my_module.OLD_TIMEOUT"] == 2
+
+
+def test_alias_function(target_module):
+    calls = []
+    old_parse = deprecated.alias("old_parse", target="my_target_module:Parser", version="2.0")
+
+    assert target_module not in sys.modules
+    assert repr(old_parse) == "<deprecated alias old_parse of 'my_target_module:Parser'>"
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        calls.append(old_parse())
+        sys.modules[target_module].Parser = None
+        calls.append(old_parse())
+
+    parser_cls = type(calls[0])
+    assert parser_cls.__name__ == "Parser"
+    assert [type(obj) for obj in calls] == [parser_cls, parser_cls]
+    assert [str(warn.message) for warn in warns] == [
+        "Use of deprecated alias old_parse. (use my_target_module.Parser) -- Deprecated since version 2.0."
+    ] * 2
+    assert warns[0].filename == __file__
+
+
+def test_alias_attribute(target_module):
+    OldParser = deprecated.alias("OldParser", target="my_target_module:Parser", reason="use Parser")
+
+    # special attributes don't import the target
+    assert not hasattr(OldParser, "__wrapped__")
+    assert target_module not in sys.modules
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert OldParser.strict is True
+
+    assert [str(warn.message) for warn in warns] == ["Use of deprecated alias OldParser. (use Parser)"]
+    assert warns[0].filename == __file__
+
+
+def test_alias_introspection(target_module):
+    OldParser = deprecated.alias("OldParser", target="my_target_module:Parser")
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        inspect.signature(OldParser)
+        assert not hasattr(OldParser, "_private")
+
+    assert warns == []
+    assert target_module not in sys.modules
+
+
+def test_alias_resolved_introspection():
+    old_join = deprecated.alias("old_join", target="os.path:join")
+
+    assert old_join.__doc__ is None
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        old_join("a", "b")
+        # once the target is resolved, the special attributes are forwarded
+        assert old_join.__name__ == "join"
+        assert old_join.__doc__ == os.path.join.__doc__
+
+
+def test_alias_once_is_shared(target_module):
+    OldParser = deprecated.alias("OldParser", target="my_target_module:Parser", once=True)
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert OldParser().strict is True
+        assert OldParser.strict is True
+
+    # the instantiation and the attribute access share the same warning state
+    assert len(warns) == 1
+
+
+def test_alias_adapter_options():
+    old_join = deprecated.alias("old_join", target="os.path:join", once=True, category=FutureWarning)
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert old_join("a", "b") == os.path.join("a", "b")
+        assert old_join("a", "c") == os.path.join("a", "c")
+
+    assert len(warns) == 1
+    assert warns[0].category is FutureWarning
+
+
+def test_alias_disabled(monkeypatch):
+    monkeypatch.setattr(deprecated.config, "_enabled", False)
+    OldOrderedDict = deprecated.alias("OldOrderedDict", target="collections:OrderedDict")
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        assert OldOrderedDict(a=1) == collections.OrderedDict(a=1)
+        assert OldOrderedDict.fromkeys == collections.OrderedDict.fromkeys
+
+    assert warns == []
+
+
+def test_alias_stats():
+    old_join = deprecated.alias("old_join", target="os.path:join")
+
+    deprecated.stats.reset()
+    deprecated.stats.enable()
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            old_join("a", "b")
+            old_join("a", "c")
+    finally:
+        deprecated.stats.disable()
+
+    assert deprecated.stats.snapshot()["tests.test_module.old_join"] == 2
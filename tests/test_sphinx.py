@@ -422,3 +422,31 @@ def test_get_deprecated_msg(reason, expected):
     adapter = deprecated.sphinx.SphinxAdapter("deprecated", reason=reason, version="1")
     actual = adapter.get_deprecated_msg(lambda: None, None)
     assert expected in actual
+
+
+def test_sphinx_deprecated_once():
+    @deprecated.sphinx.deprecated(version="1.2.3", reason="Use :func:`bar` instead", once=True)
+    def foo():
+        pass
+
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        foo()
+        foo()
+    assert len(warns) == 1
+    assert "Use `bar` instead" in str(warns[0].message)
+
+
+def test_sphinx_directives_stacked_on_lightweight_wrapper():
+    @deprecated.sphinx.deprecated(version="3.0", lightweight=True)
+    @deprecated.sphinx.versionchanged(version="2.0")
+    @deprecated.sphinx.deprecated(version="1.0", lightweight=True)
+    def foo():
+        """Doc."""
+
+    assert foo.__doc__ == "Doc.\n\n.. deprecated:: 1.0\n\n.. versionchanged:: 2.0\n\n.. deprecated:: 3.0\n"
+    assert len(foo._deprecated_checks) == 2
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("always")
+        foo()
+    assert len(warns) == 2
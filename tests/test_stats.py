@@ -0,0 +1,95 @@
+# coding: utf-8
+import warnings
+
+import pytest
+
+import deprecated.classic
+import deprecated.params
+import deprecated.stats
+
+
+@pytest.fixture(name="collecting")
+def fixture_collecting():
+    deprecated.stats.enable()
+    yield
+    deprecated.stats.disable()
+
+
+@deprecated.classic.deprecated
+def stats_foo():
+    pass
+
+
+class StatsFoo(object):
+    @deprecated.classic.deprecated
+    def foo(self):
+        pass
+
+
+@deprecated.classic.deprecated
+class StatsBar(object):
+    pass
+
+
+@deprecated.params.deprecated_params({"y": "y is deprecated", "z": "z is deprecated"}, values={"x": {"legacy"}})
+def stats_baz(x, y=None, z=None):
+    pass
+
+
+def test_disabled_by_default():
+    assert not deprecated.stats.is_enabled()
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("", False), ("0", False), ("1", True), ("True", True), (" on ", True)],
+)
+def test_read_stats_env(monkeypatch, value, expected):
+    monkeypatch.setenv(deprecated.stats.STATS_ENV_VAR, value)
+    assert deprecated.stats._read_stats_env() is expected
+
+
+def test_get_symbol_name():
+    assert deprecated.stats.get_symbol_name(test_get_symbol_name) == __name__ + ".test_get_symbol_name"
+    assert deprecated.stats.get_symbol_name(StatsFoo.foo) == __name__ + ".StatsFoo.foo"
+
+
+def test_register_shares_counters():
+    counter = deprecated.stats.register("tests.test_stats.shared")
+    assert deprecated.stats.register("tests.test_stats.shared") is counter
+
+
+# noinspection PyUnusedLocal
+def test_counts_calls(collecting):
+    deprecated.stats.reset()
+    with warnings.catch_warnings(record=True) as warns:
+        warnings.simplefilter("ignore")
+        for _ in range(3):
+            stats_foo()
+        StatsFoo().foo()
+        StatsBar()
+        StatsBar()
+        stats_baz(1)
+        stats_baz(1, 2)
+        stats_baz(1, y=2, z=3)
+        stats_baz("legacy")
+    assert warns == []
+    snapshot = deprecated.stats.snapshot()
+    assert snapshot[__name__ + ".stats_foo"] == 3
+    assert snapshot[__name__ + ".StatsFoo.foo"] == 1
+    assert snapshot[__name__ + ".StatsBar"] == 2
+    assert snapshot[__name__ + ".stats_baz(y)"] == 2
+    assert snapshot[__name__ + ".stats_baz(z)"] == 1
+    assert snapshot[__name__ + ".stats_baz(x='legacy')"] == 1
+
+    deprecated.stats.reset()
+    snapshot = deprecated.stats.snapshot()
+    assert snapshot[__name__ + ".stats_foo"] == 0
+
+
+def test_no_count_when_disabled():
+    deprecated.stats.reset()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        stats_foo()
+    assert deprecated.stats.snapshot()[__name__ + ".stats_foo"] == 0